@@ -6,11 +6,18 @@ FitDB Seed Data Generator
 Generates realistic seed data for the FitDB database using the Faker library.
 Outputs CSV files that can be loaded using bulkcopy.sql.
 
+Rows are streamed to the CSV files in fixed-size chunks as they are generated,
+so memory stays constant and run time grows linearly with the row count
+(10M+ members is fine).
+
 Usage:
     python generate_seed.py --size tiny --output ./csvs
     python generate_seed.py --size medium --output ./csvs
+    python generate_seed.py --size large --output ./csvs --profile --metrics-json ./seed_metrics.json
+    python generate_seed.py --members 2000000 --gyms 40 --gym-skew 1.0 --output ./csvs
+    python generate_seed.py --scale-config ./scale.json --output ./csvs
 
-Sizes:
+Sizes (presets; any value can be overridden with the scale options):
     tiny:   10 members (for 1 gym)
     small:  100 members (for 1 gym)
     medium: 1000 members (for 1 gym)
@@ -19,12 +26,24 @@ Sizes:
 """
 
 import argparse
+import bisect
+import cProfile
 import csv
+import io
+import json
+import pstats
 import random
+import re
 import sys
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
 from datetime import datetime, timedelta, date
 from pathlib import Path
 
+from seed_schema import TABLE_FIELDS
+
 try:
     from faker import Faker
 except ImportError:
@@ -32,6 +51,13 @@ except ImportError:
     print("Please run: pip install -r requirements.txt")
     sys.exit(1)
 
+# Optional: peak RSS reporting (not available on Windows)
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
 # Initialize Faker
 fake = Faker()
 # Seed value: 437 (CS-437 course number) for reproducibility
@@ -44,45 +70,91 @@ SCRIPT_DIR = Path(__file__).parent
 BANKS_DIR = SCRIPT_DIR / 'banks'
 
 # Size configurations (MVP-focused: accounts and access cards only)
-# All counts are multiples of 5 for clean data
+# Staff counts are per gym; all counts are multiples of 5 for clean data
 SIZE_CONFIG = {
     'tiny': {
         'members': 10,
         'gyms': 1,
-        'front_desk_staff': 5,
-        'admin_staff': 5,
+        'front_desk_per_gym': 5,
+        'admins_per_gym': 5,
         'access_cards_pct': 0.80  # 80% of members have cards
     },
     'small': {
         'members': 100,
         'gyms': 1,
-        'front_desk_staff': 5,
-        'admin_staff': 5,
+        'front_desk_per_gym': 5,
+        'admins_per_gym': 5,
         'access_cards_pct': 0.80
     },
     'medium': {
         'members': 1000,
         'gyms': 1,
-        'front_desk_staff': 10,
-        'admin_staff': 5,
+        'front_desk_per_gym': 10,
+        'admins_per_gym': 5,
         'access_cards_pct': 0.80
     },
     'large': {
         'members': 10000,
         'gyms': 1,
-        'front_desk_staff': 20,
-        'admin_staff': 10,
+        'front_desk_per_gym': 20,
+        'admins_per_gym': 10,
         'access_cards_pct': 0.80
     },
     'huge': {
         'members': 100000,
         'gyms': 1,
-        'front_desk_staff': 50,
-        'admin_staff': 20,
+        'front_desk_per_gym': 50,
+        'admins_per_gym': 20,
         'access_cards_pct': 0.80
     }
 }
 
+# Defaults shared by every size (overridable via --scale-config / CLI)
+SCALE_DEFAULTS = {
+    'gym_skew': 0.0,  # Zipf exponent for members across gyms (0 = uniform)
+    'plan_mix': {'trial': 10, 'basic': 60, 'plus': 30},  # tier weights
+    'gym_plan_mix': {},  # optional per-gym tier weights: {"3": {"trial": 5, "basic": 45, "plus": 50}}
+    'equipment_per_kind': 4,  # per_item machines of each kind at an average gym (scaled by gym weight)
+}
+
+# Value types accepted for each scale setting (--scale-config JSON or CLI overrides)
+SCALE_CONFIG_TYPES = {
+    'members': int,
+    'gyms': int,
+    'front_desk_per_gym': int,
+    'admins_per_gym': int,
+    'access_cards_pct': (int, float),
+    'gym_skew': (int, float),
+    'plan_mix': dict,
+    'gym_plan_mix': dict,
+    'equipment_per_kind': (int, float),
+}
+
+# Equipment fleet profile: service ratings, cleaning intervals and daily use per machine
+EQUIPMENT_RATED_USES = [10000, 20000, 50000]
+EQUIPMENT_CLEANING_INTERVAL_USES = [200, 500, 1000]
+EQUIPMENT_CLEANING_INTERVAL_DAYS = [1, 3, 7]
+EQUIPMENT_USES_PER_DAY = (5, 40)
+
+# Membership plan tiers accepted in plan_mix / gym_plan_mix
+PLAN_TIERS = ('trial', 'basic', 'plus')
+
+# Membership plans: (name, tier, billing cycle, price)
+MEMBERSHIP_PLANS = [
+    ('Trial - 7 Days', 'trial', 'monthly', 0.00),
+    ('Basic Monthly', 'basic', 'monthly', 29.99),
+    ('Basic Annual', 'basic', 'annual', 299.99),
+    ('Plus Monthly', 'plus', 'monthly', 49.99),
+    ('Plus Annual', 'plus', 'annual', 499.99),
+]
+
+# Rows buffered per table before they are flushed to disk
+CSV_CHUNK_ROWS = 10000
+
+# Faker is slow per call; member names and domains are drawn from pools sampled once from Faker
+NAME_POOL_SIZE = 5000
+DOMAIN_POOL_SIZE = 50
+
 def load_bank_data(filename):
     """Load reference data from CSV files in the banks directory."""
     filepath = BANKS_DIR / filename
@@ -100,14 +172,266 @@ EQUIPMENT_KINDS = load_bank_data('equipment_kinds.csv')
 SESSION_TITLES = load_bank_data('session_titles.csv')
 
 
+def peak_rss_mb():
+    """Return the peak resident set size of this process in MB (None if unavailable)."""
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+    if sys.platform == 'darwin':
+        return round(peak / (1024 * 1024), 2)
+    return round(peak / 1024, 2)
+
+
+class PhaseProfiler:
+    """Records wall time, CPU time, CSV I/O time, peak RSS and rows/sec for each generation phase."""
+
+    def __init__(self, enabled=False, top_n=0, trace_memory=False):
+        self.enabled = enabled
+        self.top_n = top_n
+        self.trace_memory = trace_memory
+        self.phases = []
+        self.cprofile = cProfile.Profile() if enabled and top_n > 0 else None
+        self.started_at = None
+        self.total_wall_s = None
+
+    def start(self):
+        """Begin whole-run profiling (cProfile / tracemalloc when requested)."""
+        self.started_at = time.perf_counter()
+        if not self.enabled:
+            return
+        if self.trace_memory:
+            tracemalloc.start()
+        if self.cprofile:
+            self.cprofile.enable()
+
+    def stop(self):
+        """Stop whole-run profiling."""
+        self.total_wall_s = round(time.perf_counter() - self.started_at, 4)
+        if self.cprofile:
+            self.cprofile.disable()
+
+    @contextmanager
+    def phase(self, name, count_rows, io_seconds=None):
+        """
+        Time a single phase.
+
+        count_rows is called before and after the phase; the difference is the
+        number of rows the phase produced (used for rows/sec). io_seconds, when
+        given, returns cumulative CSV write time; its difference is the phase's
+        share of I/O (already included in its wall time).
+        """
+        rows_before = count_rows()
+        io_before = io_seconds() if io_seconds else None
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall_s = time.perf_counter() - wall_start
+            cpu_s = time.process_time() - cpu_start
+            rows = count_rows() - rows_before
+            metrics = {
+                'phase': name,
+                'wall_s': round(wall_s, 4),
+                'cpu_s': round(cpu_s, 4),
+                'rows': rows,
+                'rows_per_s': round(rows / wall_s, 1) if wall_s > 0 else None,
+                'io_s': round(io_seconds() - io_before, 4) if io_seconds else None,
+                'peak_rss_mb': peak_rss_mb(),
+            }
+            if self.trace_memory and tracemalloc.is_tracing():
+                metrics['traced_peak_mb'] = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+            self.phases.append(metrics)
+
+    def cprofile_top(self):
+        """Return the top-N functions by cumulative time as a list of dicts."""
+        if not self.cprofile:
+            return []
+        stats = pstats.Stats(self.cprofile, stream=io.StringIO())
+        stats.sort_stats('cumulative')
+        top = []
+        for func in stats.fcn_list[:self.top_n]:
+            cc, nc, tt, ct, _ = stats.stats[func]
+            filename, line, funcname = func
+            top.append({
+                'function': f"{Path(filename).name}:{line}({funcname})",
+                'calls': nc,
+                'tottime_s': round(tt, 4),
+                'cumtime_s': round(ct, 4),
+            })
+        return top
+
+    def tracemalloc_top(self):
+        """Return the top-N allocation sites still alive at the end of the run."""
+        if not (self.trace_memory and tracemalloc.is_tracing()):
+            return []
+        snapshot = tracemalloc.take_snapshot()
+        top = []
+        for stat in snapshot.statistics('lineno')[:self.top_n or 10]:
+            frame = stat.traceback[0]
+            top.append({
+                'location': f"{Path(frame.filename).name}:{frame.lineno}",
+                'size_mb': round(stat.size / (1024 * 1024), 3),
+                'count': stat.count,
+            })
+        return top
+
+    def report(self):
+        """Build the metrics report as a JSON-serializable dict."""
+        report = {
+            'total_wall_s': self.total_wall_s,
+            'peak_rss_mb': peak_rss_mb(),
+            'phases': self.phases,
+        }
+        if self.cprofile:
+            report['cprofile_top'] = self.cprofile_top()
+        if self.trace_memory:
+            report['tracemalloc_top'] = self.tracemalloc_top()
+            tracemalloc.stop()
+        return report
+
+    def print_report(self, report):
+        """Print the per-phase metrics as a table."""
+        print("\n" + "=" * 94)
+        print("Seed Generation Profile")
+        print("=" * 94)
+        print(f"{'Phase':<30}{'Wall (s)':>10}{'CPU (s)':>10}{'I/O (s)':>10}{'Rows':>12}{'Rows/s':>12}{'RSS (MB)':>10}")
+        for p in report['phases']:
+            rows_per_s = p['rows_per_s'] if p['rows_per_s'] is not None else '-'
+            rss = p['peak_rss_mb'] if p['peak_rss_mb'] is not None else '-'
+            io_s = p['io_s'] if p['io_s'] is not None else '-'
+            print(f"{p['phase']:<30}{p['wall_s']:>10}{p['cpu_s']:>10}{io_s:>10}{p['rows']:>12}{rows_per_s:>12}{rss:>10}")
+        print(f"\nTotal wall time: {report['total_wall_s']}s")
+        if report.get('cprofile_top'):
+            print(f"\nTop {len(report['cprofile_top'])} functions by cumulative time:")
+            for f in report['cprofile_top']:
+                print(f"  {f['cumtime_s']:>9}s  {f['calls']:>9} calls  {f['function']}")
+        if report.get('tracemalloc_top'):
+            print(f"\nTop {len(report['tracemalloc_top'])} allocation sites:")
+            for a in report['tracemalloc_top']:
+                print(f"  {a['size_mb']:>9} MB  {a['count']:>9} blocks  {a['location']}")
+        print("=" * 94)
+
+
+class UsernameAllocator:
+    """
+    Collision-free username allocator.
+
+    Usernames are '<name parts><n>': the name parts are reduced to lowercase
+    letters joined by dots (so they never end in a digit) and n comes from one
+    counter shared by every account, which makes two allocations always differ
+    without remembering the names handed out (constant memory at any scale).
+    Emails reuse the username as the local part, so they are unique as well.
+    """
+
+    NON_LETTERS = re.compile(r'[^a-z]')
+
+    def __init__(self):
+        self.next_number = 1
+
+    def allocate(self, *name_parts):
+        """Return a new unique username built from the given name parts."""
+        base = '.'.join(self.NON_LETTERS.sub('', part.lower()) or 'user' for part in name_parts)
+        username = f"{base}{self.next_number}"
+        self.next_number += 1
+        return username
+
+    @staticmethod
+    def email(username, domain):
+        """Email address for an allocated username."""
+        return f"{username}@{domain}"
+
+
+def validate_plan_mix(mix, label='plan_mix'):
+    """Check a tier -> weight dict: known tiers, weights >= 0, not all zero (raises ValueError)."""
+    if not isinstance(mix, dict):
+        raise ValueError(f"{label} must be an object of tier -> weight")
+    for tier, weight in mix.items():
+        if tier not in PLAN_TIERS:
+            raise ValueError(f"{label}: unknown tier '{tier}' (expected one of {', '.join(PLAN_TIERS)})")
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) or weight < 0:
+            raise ValueError(f"{label}: weight for '{tier}' must be a number >= 0")
+    if sum(mix.values()) <= 0:
+        raise ValueError(f"{label}: at least one tier weight must be > 0")
+
+
+def parse_plan_mix(text):
+    """Parse 'trial=10,basic=60,plus=30' into a tier -> weight dict."""
+    mix = {}
+    for part in text.split(','):
+        tier, _, weight = part.partition('=')
+        tier = tier.strip()
+        if tier not in PLAN_TIERS or not weight:
+            raise argparse.ArgumentTypeError(f"invalid plan mix entry '{part}' (expected tier=weight)")
+        try:
+            mix[tier] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid plan mix weight '{weight}' for '{tier}'")
+    try:
+        validate_plan_mix(mix)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return mix
+
+
+def build_scale_config(size, overrides=None):
+    """Merge a size preset, scale defaults and any overrides into one config dict."""
+    config = dict(SCALE_DEFAULTS)
+    config.update(SIZE_CONFIG[size])
+    for key, value in (overrides or {}).items():
+        if key not in SCALE_CONFIG_TYPES:
+            raise ValueError(f"unknown setting '{key}' (expected one of {', '.join(SCALE_CONFIG_TYPES)})")
+        if value is None:
+            continue
+        expected = SCALE_CONFIG_TYPES[key]
+        if isinstance(value, bool) or not isinstance(value, expected):
+            names = ' or '.join(t.__name__ for t in (expected if isinstance(expected, tuple) else (expected,)))
+            raise ValueError(f"{key} must be {names}, got {type(value).__name__} {value!r}")
+        config[key] = value
+
+    if config['members'] < 0:
+        raise ValueError("members must be >= 0")
+    if config['gyms'] < 1:
+        raise ValueError("gyms must be >= 1")
+    if config['front_desk_per_gym'] < 0 or config['admins_per_gym'] < 0:
+        raise ValueError("front_desk_per_gym and admins_per_gym must be >= 0")
+    if not 0 <= config['access_cards_pct'] <= 1:
+        raise ValueError("access_cards_pct must be between 0 and 1")
+    if config['equipment_per_kind'] < 0:
+        raise ValueError("equipment_per_kind must be >= 0")
+    validate_plan_mix(config['plan_mix'])
+    if not isinstance(config['gym_plan_mix'], dict):
+        raise ValueError("gym_plan_mix must be an object of gym id -> plan mix")
+    for gym_key, mix in config['gym_plan_mix'].items():
+        # keys must match str(gym_id) exactly, since that is how the mix is looked up
+        if gym_key not in {str(gym_id) for gym_id in range(1, config['gyms'] + 1)}:
+            raise ValueError(f"gym_plan_mix: gym '{gym_key}' is not between 1 and {config['gyms']}")
+        validate_plan_mix(mix, f"gym_plan_mix['{gym_key}']")
+    return config
+
+
+def cumulative(weights):
+    """Running totals of a weight list (for bisect-based weighted picks)."""
+    totals = []
+    running = 0.0
+    for weight in weights:
+        running += weight
+        totals.append(running)
+    return totals
+
+
 class SeedDataGenerator:
     """Generates seed data for FitDB database."""
-    
-    def __init__(self, size: str, output_dir: Path):
+
+    def __init__(self, size: str, output_dir: Path, profiler: PhaseProfiler = None, overrides: dict = None):
         self.size = size
-        self.config = SIZE_CONFIG[size]
+        self.config = build_scale_config(size, overrides)
         self.output_dir = output_dir
-        
+        self.profiler = profiler or PhaseProfiler()
+
         # ID counters
         self.user_id = 1
         self.staff_id = 1
@@ -131,9 +455,9 @@ class SeedDataGenerator:
         self.booking_id = 1
         self.access_card_id = 1
         self.check_in_id = 1
-        
+
         # Status IDs (matching the indicator tables)
-        self.account_status = {'ACTIVE': 1, 'INACTIVE': 2, 'LOCKED': 3, 'SUSPENDED': 4, 'CANCELED': 5}
+        self.account_status = {'ACTIVE': 1, 'INACTIVE': 2, 'LOCKED': 3, 'SUSPENDED': 4, 'CANCELED': 5, 'EXPIRED': 6}
         self.gym_status = {'ACTIVE': 1, 'INACTIVE': 2}
         self.equipment_status = {'OK': 1, 'NEEDS_SERVICE': 2, 'OUT_OF_ORDER': 3, 'RETIRED': 4}
         self.session_status = {'SCHEDULED': 1, 'CANCELED': 2, 'COMPLETED': 3}
@@ -141,71 +465,149 @@ class SeedDataGenerator:
         self.plan_status = {'ACTIVE': 1, 'RETIRED': 2}
         self.access_card_status = {'ACTIVE': 1, 'LOST': 2, 'REVOKED': 3}
         self.booking_status = {'CONFIRMED': 1, 'CANCELED_MEMBER': 2, 'CANCELED_SYSTEM': 3}
-        
-        # Data storage
-        self.data = {}
-        
+
+        # Member account status distribution
+        self.member_status_ids = [
+            self.account_status['ACTIVE'], self.account_status['INACTIVE'], self.account_status['LOCKED'],
+            self.account_status['SUSPENDED'], self.account_status['CANCELED']
+        ]
+        self.member_status_cum_weights = cumulative([85, 5, 2, 5, 3])
+
+        # Equipment status distribution (OK, NEEDS_SERVICE, OUT_OF_ORDER, RETIRED)
+        self.equipment_status_ids = list(self.equipment_status.values())
+        self.equipment_status_cum_weights = cumulative([88, 4, 5, 3])
+
+        # Streaming CSV output: per-table chunk buffers and row counts (constant memory)
+        self.buffers = {table: [] for table in TABLE_FIELDS}
+        self.row_counts = {table: 0 for table in TABLE_FIELDS}
+        self.files = {}
+        self.writers = {}
+        self.rows_flushed = 0
+        self.io_seconds = 0.0
+
+        # Unique usernames/emails for members and staff (random suffixes collide at 100k+ members)
+        self.usernames = UsernameAllocator()
+
+        # Reference times (one timestamp for every updated_at keeps rows cheap to format)
+        self.now = datetime.now()
+        self.now_str = self.format_datetime(self.now)
+
+        # Weighted-pick tables, filled once gyms and plans exist
+        self.gym_cum_weights = []
+        self.gym_weights = []
+        self.per_item_kinds = []
+        self.bulk_kinds = []
+        self.plan_ids = []
+        self.plan_cum_weights_by_gym = []
+        self.default_plan_cum_weights = []
+
     def generate_all(self):
-        """Generate MVP seed data (accounts and access cards only)."""
+        """Generate MVP seed data (accounts, access cards and the equipment fleet)."""
         print(f"Generating {self.size} MVP seed data...")
         print(f"Configuration: {self.config}")
-        
+
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        
+        self.open_writers()
+
+        self.profiler.start()
+
         # Generate MVP data in order (respecting foreign keys)
         print("\n1. Generating gyms...")
-        self.generate_gyms()
-        
+        with self.profiler.phase('generate_gyms', self.count_rows, self.io_time):
+            self.generate_gyms()
+
         print("2. Generating membership plans...")
-        self.generate_membership_plans()
-        
-        print("3. Generating users (members)...")
-        self.generate_member_users()
-        
+        with self.profiler.phase('generate_membership_plans', self.count_rows, self.io_time):
+            self.generate_membership_plans()
+
+        print("3. Generating users (members) and access cards...")
+        with self.profiler.phase('generate_member_users', self.count_rows, self.io_time):
+            self.generate_member_users()
+
         print("4. Generating users (staff - front desk & admin only)...")
-        self.generate_staff_users()
-        
-        print("5. Generating access cards...")
-        self.generate_access_cards()
-        
-        # Write all CSVs (including empty ones for post-MVP tables)
+        with self.profiler.phase('generate_staff_users', self.count_rows, self.io_time):
+            self.generate_staff_users()
+
+        print("5. Generating equipment (kinds, machines, bulk inventory)...")
+        with self.profiler.phase('generate_equipment', self.count_rows, self.io_time):
+            self.generate_equipment_kinds()
+            self.generate_equipment_items()
+            self.generate_inventory_counts()
+
+        # Flush remaining buffers and close all CSVs (including empty ones for post-MVP tables)
         print("\n6. Writing CSV files...")
-        self.write_all_csvs()
-        
+        # chunk flushes already happened inside the generate_* phases; only the tail is written here
+        with self.profiler.phase('write_all_csvs', lambda: self.rows_flushed, self.io_time):
+            self.write_all_csvs()
+
+        self.profiler.stop()
+
         print("\nSeed data generation complete!")
         self.print_summary()
-    
+
+    def count_rows(self):
+        """Total number of generated rows across all tables."""
+        return sum(self.row_counts.values())
+
+    def io_time(self):
+        """Cumulative seconds spent writing CSV chunks."""
+        return self.io_seconds
+
+    def open_writers(self):
+        """Open one CSV writer per table (every table gets a file, even if empty)."""
+        for table_name, fields in TABLE_FIELDS.items():
+            f = open(self.output_dir / f"{table_name}.csv", 'w', newline='', encoding='utf-8')
+            self.files[table_name] = f
+            # Don't write header - bulkcopy will handle structure
+            self.writers[table_name] = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+
+    def emit(self, table_name, row):
+        """Queue a row for a table; flushes the table's buffer every CSV_CHUNK_ROWS rows."""
+        buffer = self.buffers[table_name]
+        buffer.append(row)
+        self.row_counts[table_name] += 1
+        if len(buffer) >= CSV_CHUNK_ROWS:
+            self.flush(table_name)
+
+    def flush(self, table_name):
+        """Write a table's buffered rows to disk."""
+        buffer = self.buffers[table_name]
+        if not buffer:
+            return
+        io_start = time.perf_counter()
+        self.writers[table_name].writerows(buffer)
+        self.rows_flushed += len(buffer)
+        buffer.clear()
+        self.io_seconds += time.perf_counter() - io_start
+
+    def random_datetime(self, start, end):
+        """Uniform random datetime between two datetimes (cheaper than Faker per row)."""
+        return start + timedelta(seconds=random.uniform(0, (end - start).total_seconds()))
+
     def generate_gyms(self):
         """Generate gym data."""
-        self.data['gym'] = []
-        
         for i in range(self.config['gyms']):
             address = fake.address().replace('\n', ', ')
-            self.data['gym'].append({
+            self.emit('gym', {
                 'id': self.gym_id,
                 'name': fake.company() + ' Fitness',
                 'address': address,
                 'status_id': self.gym_status['ACTIVE'],
                 'created_at': self.format_datetime(fake.date_time_between(start_date='-2y', end_date='-1y')),
-                'updated_at': self.format_datetime(datetime.now())
+                'updated_at': self.now_str
             })
             self.gym_id += 1
-    
+
+        # Zipf-like skew: gym k gets weight 1 / k^skew (skew 0 = uniform)
+        skew = self.config['gym_skew']
+        self.gym_weights = [1.0 / (rank ** skew) for rank in range(1, self.config['gyms'] + 1)]
+        self.gym_cum_weights = cumulative(self.gym_weights)
+
     def generate_membership_plans(self):
         """Generate membership plan data."""
-        self.data['membership_plan'] = []
-        
-        plans = [
-            ('Trial - 7 Days', 'trial', 'monthly', 0.00),
-            ('Basic Monthly', 'basic', 'monthly', 29.99),
-            ('Basic Annual', 'basic', 'annual', 299.99),
-            ('Plus Monthly', 'plus', 'monthly', 49.99),
-            ('Plus Annual', 'plus', 'annual', 499.99),
-        ]
-        
-        for name, tier, cycle, price in plans:
-            self.data['membership_plan'].append({
+        for name, tier, cycle, price in MEMBERSHIP_PLANS:
+            self.emit('membership_plan', {
                 'id': self.membership_plan_id,
                 'name': name,
                 'tier': tier,
@@ -213,86 +615,139 @@ class SeedDataGenerator:
                 'price': price,
                 'status_id': self.plan_status['ACTIVE'],
                 'created_at': self.format_datetime(fake.date_time_between(start_date='-2y', end_date='-1y')),
-                'updated_at': self.format_datetime(datetime.now())
+                'updated_at': self.now_str
             })
+            self.plan_ids.append(self.membership_plan_id)
             self.membership_plan_id += 1
-    
+
+        # Plan distribution per gym: tier weight split evenly across the plans of that tier
+        self.default_plan_cum_weights = self.plan_cum_weights(self.config['plan_mix'])
+        gym_plan_mix = self.config['gym_plan_mix']
+        self.plan_cum_weights_by_gym = [
+            self.plan_cum_weights(gym_plan_mix[str(gym_id)]) if str(gym_id) in gym_plan_mix
+            else self.default_plan_cum_weights
+            for gym_id in range(1, self.gym_id)
+        ]
+
+    def plan_cum_weights(self, tier_mix):
+        """Cumulative plan weights (aligned with self.plan_ids) for a tier -> weight mix."""
+        plans_per_tier = {}
+        for _, tier, _, _ in MEMBERSHIP_PLANS:
+            plans_per_tier[tier] = plans_per_tier.get(tier, 0) + 1
+        weights = [tier_mix.get(tier, 0) / plans_per_tier[tier] for _, tier, _, _ in MEMBERSHIP_PLANS]
+        if sum(weights) <= 0:
+            raise ValueError(f"plan mix {tier_mix} has no positive weights")
+        return cumulative(weights)
+
     def generate_equipment_kinds(self):
-        """Post-MVP: Equipment kinds."""
-        self.data['equip_kind'] = []
-    
+        """Generate equipment kinds from the bank (per_item machines and bulk stock)."""
+        created_str = self.format_datetime(self.now - timedelta(days=730))
+        self.per_item_kinds = []
+        self.bulk_kinds = []
+        for name, mode in EQUIPMENT_KINDS:
+            self.emit('equip_kind', {
+                'id': self.equip_kind_id,
+                'name': name,
+                'mode': mode,
+                'created_at': created_str,
+                'updated_at': self.now_str
+            })
+            if mode == 'per_item':
+                self.per_item_kinds.append((self.equip_kind_id, name))
+            else:
+                self.bulk_kinds.append(self.equip_kind_id)
+            self.equip_kind_id += 1
+
     def generate_member_users(self):
-        """Generate member users and associated member records."""
-        self.data['user'] = []
-        self.data['member'] = []
-        
+        """Generate member users, member records and their access cards (streamed)."""
         num_members = self.config['members']
-        
+
+        # Faker name/domain lookups dominate per-row cost; sample pools once and reuse them
+        pool_size = min(NAME_POOL_SIZE, max(num_members, 1))
+        first_names = [fake.first_name() for _ in range(pool_size)]
+        last_names = [fake.last_name() for _ in range(pool_size)]
+        email_domains = [fake.free_email_domain() for _ in range(DOMAIN_POOL_SIZE)]
+
+        # Access cards are issued inline to ACTIVE members so no member list is kept in memory;
+        # the issue probability is scaled so ~access_cards_pct of all members end up with a card
+        active_share = (self.member_status_cum_weights[0] / self.member_status_cum_weights[-1])
+        card_probability = min(1.0, self.config['access_cards_pct'] / active_share)
+
+        gym_total = self.gym_cum_weights[-1]
+        trial_plan_id = self.plan_ids[0]  # Trial plan
+        two_years_ago = self.now - timedelta(days=730)
+        one_year_ago = self.now - timedelta(days=365)
+        thirty_days_ago = self.now - timedelta(days=30)
+        seven_days_ago = self.now - timedelta(days=7)
+        today = self.now.date()
+        progress_every = max(1_000_000, num_members // 10)
+
         for i in range(num_members):
             # Generate user
-            first_name = fake.first_name()
-            last_name = fake.last_name()
-            username = f"{first_name.lower()}.{last_name.lower()}{random.randint(1, 999)}"
-            
-            user = {
+            first_name = random.choice(first_names)
+            last_name = random.choice(last_names)
+            username = self.usernames.allocate(first_name, last_name)
+
+            status_id = random.choices(self.member_status_ids, cum_weights=self.member_status_cum_weights, k=1)[0]
+            created_at = self.random_datetime(two_years_ago, thirty_days_ago)
+            created_str = self.format_datetime(created_at)
+
+            self.emit('user', {
                 'id': self.user_id,
                 'username': username,
-                'email': f"{username}@{fake.free_email_domain()}",
-                'password_hash': fake.sha256(),
+                'email': self.usernames.email(username, random.choice(email_domains)),
+                'password_hash': '%064x' % random.getrandbits(256),
                 'password_algo': 'argon2id',
-                'password_updated_at': self.format_datetime(fake.date_time_between(start_date='-1y', end_date='now')),
-                'last_login_at': self.format_datetime(fake.date_time_between(start_date='-30d', end_date='now')) if random.random() > 0.2 else '',
+                'password_updated_at': self.format_datetime(self.random_datetime(one_year_ago, self.now)),
+                'last_login_at': self.format_datetime(self.random_datetime(thirty_days_ago, self.now)) if random.random() > 0.2 else '',
                 'profile_photo_path': f"/avatars/{username}.jpg" if random.random() > 0.5 else '',
-                'status_id': random.choices(
-                    list(self.account_status.values()),
-                    weights=[85, 5, 2, 5, 3],
-                    k=1
-                )[0],
-                'created_at': self.format_datetime(fake.date_time_between(start_date='-2y', end_date='-30d')),
-                'updated_at': self.format_datetime(datetime.now())
-            }
-            self.data['user'].append(user)
-            
-            # Generate member
-            # Plan distribution: trial 10%, basic 60%, plus 30%
-            plan_id = random.choices(
-                range(1, self.membership_plan_id),
-                weights=[10, 30, 30, 15, 15],
-                k=1
-            )[0]
-            
-            joined_date = fake.date_between(start_date='-2y', end_date='-7d')
-            is_trial = plan_id == 1  # Trial plan
-            
-            member = {
+                'status_id': status_id,
+                'created_at': created_str,
+                'updated_at': self.now_str
+            })
+
+            # Generate member (home gym drawn from the skewed gym distribution)
+            gym_index = bisect.bisect_left(self.gym_cum_weights, random.random() * gym_total)
+            home_gym_id = gym_index + 1
+            plan_cum_weights = self.plan_cum_weights_by_gym[gym_index]
+            plan_id = self.plan_ids[bisect.bisect_left(plan_cum_weights, random.random() * plan_cum_weights[-1])]
+
+            joined_date = self.random_datetime(two_years_ago, seven_days_ago).date()
+            is_trial = plan_id == trial_plan_id
+            trial_expires_on = joined_date + timedelta(days=7) if is_trial else None
+
+            # Expired trials are stored as EXPIRED (what sp_expire_trials would have done)
+            member_status_id = status_id
+            if is_trial and status_id == self.account_status['ACTIVE'] and trial_expires_on < today:
+                member_status_id = self.account_status['EXPIRED']
+
+            self.emit('member', {
                 'id': self.member_id,
                 'user_id': self.user_id,
                 'membership_plan_id': plan_id,
-                'home_gym_id': random.randint(1, self.gym_id - 1),  # all members have a home gym
+                'home_gym_id': home_gym_id,  # all members have a home gym
                 'joined_on': joined_date.isoformat(),
-                'trial_expires_on': (joined_date + timedelta(days=7)).isoformat() if is_trial else '',
-                'status_id': user['status_id'],
-                'created_at': user['created_at'],
-                'updated_at': user['updated_at']
-            }
-            self.data['member'].append(member)
-            
+                'trial_expires_on': trial_expires_on.isoformat() if is_trial else '',
+                'status_id': member_status_id,
+                'created_at': created_str,
+                'updated_at': self.now_str
+            })
+
+            # cards follow the account status (expired trials keep the card issued during the trial)
+            if status_id == self.account_status['ACTIVE'] and random.random() < card_probability:
+                self.generate_access_card(self.member_id, home_gym_id, created_at)
+
             self.user_id += 1
             self.member_id += 1
-    
+
+            if (i + 1) % progress_every == 0:
+                print(f"  ... {i + 1:,} / {num_members:,} members")
+
     def generate_staff_users(self):
-        """Generate staff users (MVP: front desk and admin only)."""
-        self.data['staff'] = []
-        self.data['trainer'] = []
-        self.data['manager'] = []
-        self.data['floor_manager'] = []
-        self.data['front_desk'] = []
-        self.data['admin'] = []
-        self.data['super_admin'] = []
-        
-        num_front_desk = self.config['front_desk_staff']
-        num_admin = self.config['admin_staff']
-        
+        """Generate staff users (MVP: front desk and admin only), per gym."""
+        num_front_desk = self.config['front_desk_per_gym']
+        num_admin = self.config['admins_per_gym']
+
         # Generate super admin first
         user = {
             'id': self.user_id,
@@ -305,245 +760,232 @@ class SeedDataGenerator:
             'profile_photo_path': '',
             'status_id': self.account_status['ACTIVE'],
             'created_at': self.format_datetime(fake.date_time_between(start_date='-3y', end_date='-2y')),
-            'updated_at': self.format_datetime(datetime.now())
+            'updated_at': self.now_str
         }
-        self.data['user'].append(user)
-        
-        self.data['super_admin'].append({
+        self.emit('user', user)
+
+        self.emit('super_admin', {
             'id': self.super_admin_id,
             'user_id': self.user_id,
             'scope': 'global',
             'created_at': user['created_at'],
             'updated_at': user['updated_at']
         })
-        
+
         self.user_id += 1
         self.super_admin_id += 1
-        
-        # Generate front desk staff
-        for i in range(num_front_desk):
-            first_name = fake.first_name()
-            last_name = fake.last_name()
-            username = f"{first_name.lower()}.{last_name.lower()}.frontdesk"
-            
-            user = {
-                'id': self.user_id,
-                'username': username,
-                'email': f"{username}@fitdb.com",
-                'password_hash': fake.sha256(),
-                'password_algo': 'argon2id',
-                'password_updated_at': self.format_datetime(fake.date_time_between(start_date='-1y', end_date='now')),
-                'last_login_at': self.format_datetime(fake.date_time_between(start_date='-7d', end_date='now')),
-                'profile_photo_path': '',
-                'status_id': self.account_status['ACTIVE'],
-                'created_at': self.format_datetime(fake.date_time_between(start_date='-2y', end_date='-6m')),
-                'updated_at': self.format_datetime(datetime.now())
-            }
-            self.data['user'].append(user)
-            
-            staff = {
-                'id': self.staff_id,
-                'user_id': self.user_id,
-                'gym_id': 1,
-                'status_id': self.account_status['ACTIVE'],
-                'notes': '',
-                'created_at': user['created_at'],
-                'updated_at': user['updated_at']
-            }
-            self.data['staff'].append(staff)
-            
-            self.data['front_desk'].append({
-                'id': self.front_desk_id,
-                'staff_id': self.staff_id,
-                'capabilities': 'check_in,register',
-                'created_at': staff['created_at'],
-                'updated_at': staff['updated_at']
-            })
-            
-            self.user_id += 1
-            self.staff_id += 1
-            self.front_desk_id += 1
-        
-        # Generate admin staff
-        for i in range(num_admin):
-            first_name = fake.first_name()
-            last_name = fake.last_name()
-            username = f"{first_name.lower()}.{last_name.lower()}.admin"
-            
-            user = {
-                'id': self.user_id,
-                'username': username,
-                'email': f"{username}@fitdb.com",
-                'password_hash': fake.sha256(),
-                'password_algo': 'argon2id',
-                'password_updated_at': self.format_datetime(fake.date_time_between(start_date='-1y', end_date='now')),
-                'last_login_at': self.format_datetime(fake.date_time_between(start_date='-7d', end_date='now')),
-                'profile_photo_path': '',
-                'status_id': self.account_status['ACTIVE'],
-                'created_at': self.format_datetime(fake.date_time_between(start_date='-2y', end_date='-6m')),
-                'updated_at': self.format_datetime(datetime.now())
-            }
-            self.data['user'].append(user)
-            
-            staff = {
-                'id': self.staff_id,
-                'user_id': self.user_id,
-                'gym_id': 1,
-                'status_id': self.account_status['ACTIVE'],
-                'notes': '',
-                'created_at': user['created_at'],
-                'updated_at': user['updated_at']
-            }
-            self.data['staff'].append(staff)
-            
-            self.data['admin'].append({
-                'id': self.admin_id,
-                'staff_id': self.staff_id,
-                'scope': 'gym',
-                'created_at': staff['created_at'],
-                'updated_at': staff['updated_at']
-            })
-            
-            self.user_id += 1
-            self.staff_id += 1
-            self.admin_id += 1
-    
-    # Post-MVP: Equipment, sessions, bookings, check-ins (stubbed for schema compatibility)
+
+        for gym_id in range(1, self.gym_id):
+            # Generate front desk staff
+            for i in range(num_front_desk):
+                staff = self.generate_staff_member(gym_id, 'frontdesk')
+                self.emit('front_desk', {
+                    'id': self.front_desk_id,
+                    'staff_id': staff['id'],
+                    'capabilities': 'check_in,register',
+                    'created_at': staff['created_at'],
+                    'updated_at': staff['updated_at']
+                })
+                self.front_desk_id += 1
+
+            # Generate admin staff
+            for i in range(num_admin):
+                staff = self.generate_staff_member(gym_id, 'admin')
+                self.emit('admin', {
+                    'id': self.admin_id,
+                    'staff_id': staff['id'],
+                    'scope': 'gym',
+                    'created_at': staff['created_at'],
+                    'updated_at': staff['updated_at']
+                })
+                self.admin_id += 1
+
+    def generate_staff_member(self, gym_id, role_suffix):
+        """Generate a USER + STAFF pair working at a gym; returns the staff row."""
+        first_name = fake.first_name()
+        last_name = fake.last_name()
+        username = self.usernames.allocate(first_name, last_name, role_suffix)
+
+        user = {
+            'id': self.user_id,
+            'username': username,
+            'email': self.usernames.email(username, 'fitdb.com'),
+            'password_hash': fake.sha256(),
+            'password_algo': 'argon2id',
+            'password_updated_at': self.format_datetime(fake.date_time_between(start_date='-1y', end_date='now')),
+            'last_login_at': self.format_datetime(fake.date_time_between(start_date='-7d', end_date='now')),
+            'profile_photo_path': '',
+            'status_id': self.account_status['ACTIVE'],
+            'created_at': self.format_datetime(fake.date_time_between(start_date='-2y', end_date='-6m')),
+            'updated_at': self.now_str
+        }
+        self.emit('user', user)
+
+        staff = {
+            'id': self.staff_id,
+            'user_id': self.user_id,
+            'gym_id': gym_id,
+            'status_id': self.account_status['ACTIVE'],
+            'notes': '',
+            'created_at': user['created_at'],
+            'updated_at': user['updated_at']
+        }
+        self.emit('staff', staff)
+
+        self.user_id += 1
+        self.staff_id += 1
+        return staff
+
     def generate_equipment_items(self):
-        """Post-MVP: Equipment items."""
-        self.data['equipment_item'] = []
-    
+        """Generate per_item machines for every gym (fleet size follows the gym's member weight)."""
+        mean_weight = sum(self.gym_weights) / len(self.gym_weights)
+        per_kind = self.config['equipment_per_kind']
+        if per_kind == 0:
+            return
+
+        for gym_id, weight in enumerate(self.gym_weights, start=1):
+            gym_per_kind = per_kind * weight / mean_weight
+            for kind_id, kind_name in self.per_item_kinds:
+                prefix = ''.join(word[0] for word in kind_name.split()).upper()
+                count = max(1, round(gym_per_kind * random.uniform(0.5, 1.5)))
+                for _ in range(count):
+                    self.generate_equipment_item(gym_id, kind_id, prefix)
+
+    def generate_equipment_item(self, gym_id, kind_id, serial_prefix):
+        """Generate one machine with counters, due dates and flags as the flush procedure would leave them."""
+        created_at = self.random_datetime(self.now - timedelta(days=730), self.now - timedelta(days=30))
+        age_days = (self.now - created_at).total_seconds() / 86400
+        uses_per_day = random.uniform(*EQUIPMENT_USES_PER_DAY)
+        uses_count = int(age_days * uses_per_day)
+
+        rated_uses = random.choice(EQUIPMENT_RATED_USES)
+        cleaning_interval_uses = random.choice(EQUIPMENT_CLEANING_INTERVAL_USES)
+        cleaning_interval_days = random.choice(EQUIPMENT_CLEANING_INTERVAL_DAYS)
+        status_id = self.equipment_status_ids[
+            bisect.bisect_left(self.equipment_status_cum_weights, random.random() * self.equipment_status_cum_weights[-1])]
+
+        # service: counters since the last repair (never serviced when it covers the whole life)
+        uses_since_service = min(uses_count, int(random.uniform(0, 1.1) * rated_uses))
+        if uses_since_service < uses_count:
+            last_serviced_at = self.format_datetime(self.now - timedelta(days=uses_since_service / uses_per_day))
+        else:
+            last_serviced_at = ''
+        service_required = uses_since_service >= rated_uses or status_id == self.equipment_status['NEEDS_SERVICE']
+        if service_required and status_id == self.equipment_status['OK']:
+            status_id = self.equipment_status['NEEDS_SERVICE']
+
+        # cleaning: uses since the last clean follow from its age at this machine's daily use rate;
+        # due after cleaning_interval_days, or as soon as cleaning_interval_uses was reached
+        last_cleaned_at = max(created_at, self.now - timedelta(days=random.uniform(0, 1.2) * cleaning_interval_days))
+        days_since_clean = (self.now - last_cleaned_at).total_seconds() / 86400
+        uses_since_clean = min(uses_count, int(days_since_clean * uses_per_day))
+        next_clean_due_at = last_cleaned_at + timedelta(days=cleaning_interval_days)
+        if uses_since_clean >= cleaning_interval_uses:
+            next_clean_due_at = min(next_clean_due_at,
+                                    last_cleaned_at + timedelta(days=cleaning_interval_uses / uses_per_day))
+        cleaning_required = next_clean_due_at <= self.now
+
+        self.emit('equipment_item', {
+            'id': self.equipment_item_id,
+            'gym_id': gym_id,
+            'equip_kind_id': kind_id,
+            'status_id': status_id,
+            'serial_no': f"{serial_prefix}-{gym_id:03d}-{self.equipment_item_id:07d}",
+            'uses_count': uses_count,
+            'uses_since_clean': uses_since_clean,
+            'uses_since_service': uses_since_service,
+            'rated_uses': rated_uses,
+            'last_serviced_at': last_serviced_at,
+            'last_cleaned_at': self.format_datetime(last_cleaned_at),
+            'cleaning_interval_uses': cleaning_interval_uses,
+            'cleaning_interval_days': cleaning_interval_days,
+            'next_clean_due_at': self.format_datetime(next_clean_due_at),
+            'service_required': int(service_required),
+            'cleaning_required': int(cleaning_required),
+            'created_at': self.format_datetime(created_at),
+            'updated_at': self.now_str
+        })
+        self.equipment_item_id += 1
+
     def generate_inventory_counts(self):
-        """Post-MVP: Inventory counts."""
-        self.data['inventory_count'] = []
-    
+        """Generate one stock snapshot per gym and bulk kind."""
+        for gym_id in range(1, self.gym_id):
+            for kind_id in self.bulk_kinds:
+                qty_on_floor = random.randint(0, 40)
+                qty_in_storage = random.randint(0, 20)
+                self.emit('inventory_count', {
+                    'id': self.inventory_count_id,
+                    'gym_id': gym_id,
+                    'equip_kind_id': kind_id,
+                    'qty_on_floor': qty_on_floor,
+                    'qty_in_storage': qty_in_storage,
+                    'reorder_needed': int(qty_on_floor + qty_in_storage < 10),
+                    'updated_snapshot_at': self.format_datetime(self.now - timedelta(hours=random.uniform(0, 72))),
+                    'created_at': self.format_datetime(self.now - timedelta(days=365)),
+                    'updated_at': self.now_str
+                })
+                self.inventory_count_id += 1
+
+    # Post-MVP: service logs, sessions, bookings, check-ins (stubbed for schema compatibility)
+
     def generate_service_logs(self):
         """Post-MVP: Service logs."""
-        self.data['service_log'] = []
-    
+        pass
+
     def generate_class_sessions(self):
         """Post-MVP: Class sessions."""
-        self.data['class_session'] = []
-    
+        pass
+
     def generate_trainer_availability(self):
         """Post-MVP: Trainer availability."""
-        self.data['trainer_avail_date'] = []
-    
+        pass
+
     def generate_session_trainers(self):
         """Post-MVP: Session trainer assignments."""
-        self.data['session_trainer'] = []
-    
+        pass
+
     def generate_session_equip_reservations(self):
         """Post-MVP: Session equipment reservations."""
-        self.data['session_equip_reservation'] = []
-    
+        pass
+
     def generate_bookings(self):
         """Post-MVP: Bookings."""
-        self.data['booking'] = []
-    
-    def generate_access_cards(self):
-        """Generate access card data (MVP feature)."""
-        self.data['access_card'] = []
-        
-        # Calculate target: round to nearest 5
-        target_cards = int(len(self.data['member']) * self.config['access_cards_pct'])
-        target_cards = round(target_cards / 5) * 5  # Round to nearest 5
-        
-        # Get active members
-        active_members = [m for m in self.data['member'] 
-                         if m['status_id'] == self.account_status['ACTIVE']]
-        
-        # Select members for cards
-        members_to_issue = random.sample(active_members, min(target_cards, len(active_members)))
-        
-        for member in members_to_issue:
-            gym_id = member['home_gym_id']
-            
-            # Parse created_at properly (it's already formatted)
-            created_str = member['created_at']
-            if '.' in created_str:
-                # Has microseconds
-                created_dt = datetime.strptime(created_str, '%Y-%m-%d %H:%M:%S.%f')
-            else:
-                created_dt = datetime.strptime(created_str, '%Y-%m-%d %H:%M:%S')
-            
-            issued_at = created_dt + timedelta(days=random.randint(0, 7))
-            
-            # All active for MVP (simplify)
-            status_id = self.access_card_status['ACTIVE']
-            revoked_at = ''
-            
-            self.data['access_card'].append({
-                'id': self.access_card_id,
-                'member_id': member['id'],
-                'gym_id': gym_id,
-                'card_uid': fake.uuid4(),
-                'status_id': status_id,
-                'issued_at': self.format_datetime(issued_at),
-                'revoked_at': revoked_at,
-                'created_at': self.format_datetime(issued_at),
-                'updated_at': self.format_datetime(datetime.now())
-            })
-            self.access_card_id += 1
-    
+        pass
+
+    def generate_access_card(self, member_id, gym_id, member_created_at):
+        """Generate an access card for a member (MVP feature)."""
+        issued_at = member_created_at + timedelta(days=random.randint(0, 7))
+        issued_str = self.format_datetime(issued_at)
+
+        # All active for MVP (simplify)
+        self.emit('access_card', {
+            'id': self.access_card_id,
+            'member_id': member_id,
+            'gym_id': gym_id,
+            'card_uid': str(uuid.UUID(int=random.getrandbits(128), version=4)),
+            'status_id': self.access_card_status['ACTIVE'],
+            'issued_at': issued_str,
+            'revoked_at': '',
+            'created_at': issued_str,
+            'updated_at': self.now_str
+        })
+        self.access_card_id += 1
+
     def generate_check_ins(self):
         """Post-MVP: Check-ins."""
-        self.data['check_in'] = []
-    
+        pass
+
     def write_all_csvs(self):
-        """Write all data to CSV files (including empty ones for post-MVP tables)."""
-        # Define tables and their fields
-        tables = {
-            'user': ['id', 'username', 'email', 'password_hash', 'password_algo', 'password_updated_at', 
-                    'last_login_at', 'profile_photo_path', 'status_id', 'created_at', 'updated_at'],
-            'staff': ['id', 'user_id', 'gym_id', 'status_id', 'notes', 'created_at', 'updated_at'],
-            'trainer': ['id', 'staff_id', 'certification', 'bio', 'created_at', 'updated_at'],
-            'manager': ['id', 'staff_id', 'scope', 'created_at', 'updated_at'],
-            'floor_manager': ['id', 'staff_id', 'scope', 'created_at', 'updated_at'],
-            'front_desk': ['id', 'staff_id', 'capabilities', 'created_at', 'updated_at'],
-            'admin': ['id', 'staff_id', 'scope', 'created_at', 'updated_at'],
-            'super_admin': ['id', 'user_id', 'scope', 'created_at', 'updated_at'],
-            'gym': ['id', 'name', 'address', 'status_id', 'created_at', 'updated_at'],
-            'equip_kind': ['id', 'name', 'mode', 'created_at', 'updated_at'],
-            'equipment_item': ['id', 'gym_id', 'equip_kind_id', 'status_id', 'serial_no', 'uses_count',
-                             'rated_uses', 'last_serviced_at', 'last_cleaned_at', 'cleaning_interval_uses',
-                             'cleaning_interval_days', 'next_clean_due_at', 'service_required',
-                             'cleaning_required', 'created_at', 'updated_at'],
-            'inventory_count': ['id', 'gym_id', 'equip_kind_id', 'qty_on_floor', 'qty_in_storage',
-                              'reorder_needed', 'updated_snapshot_at', 'created_at', 'updated_at'],
-            'service_log': ['id', 'equipment_item_id', 'serviced_at', 'action', 'notes', 'staff_id',
-                          'created_at', 'updated_at'],
-            'class_session': ['id', 'gym_id', 'title', 'description', 'starts_at', 'ends_at', 'capacity',
-                            'max_trainers', 'open_for_booking', 'status_id', 'created_at', 'updated_at'],
-            'trainer_avail_date': ['id', 'trainer_id', 'gym_id', 'for_date', 'period', 'status_id',
-                                  'created_at', 'updated_at'],
-            'session_trainer': ['id', 'session_id', 'trainer_id', 'role', 'assigned_at', 'created_at', 'updated_at'],
-            'session_equip_reservation': ['id', 'session_id', 'equip_kind_id', 'quantity', 'created_at', 'updated_at'],
-            'membership_plan': ['id', 'name', 'tier', 'billing_cycle', 'price', 'status_id', 'created_at', 'updated_at'],
-            'member': ['id', 'user_id', 'membership_plan_id', 'home_gym_id', 'joined_on', 'trial_expires_on',
-                      'status_id', 'created_at', 'updated_at'],
-            'booking': ['id', 'session_id', 'member_id', 'status_id', 'booked_at', 'cancellation_reason',
-                       'notes', 'created_at', 'updated_at'],
-            'access_card': ['id', 'member_id', 'gym_id', 'card_uid', 'status_id', 'issued_at', 'revoked_at',
-                          'created_at', 'updated_at'],
-            'check_in': ['id', 'member_id', 'gym_id', 'access_card_id', 'checked_in_at', 'method',
-                        'created_at', 'updated_at']
-        }
-        
-        for table_name, fields in tables.items():
-            # Ensure data key exists (empty list if not populated)
-            if table_name not in self.data:
-                self.data[table_name] = []
-            
-            csv_path = self.output_dir / f"{table_name}.csv"
-            
-            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
-                # Don't write header - bulkcopy will handle structure
-                writer.writerows(self.data[table_name])
-            
-            print(f"  {table_name}.csv ({len(self.data[table_name])} rows)")
-    
+        """Flush all buffered rows and close every CSV (post-MVP tables stay empty)."""
+        total_rows = 0
+        for table_name in TABLE_FIELDS:
+            self.flush(table_name)
+            self.files[table_name].close()
+            print(f"  {table_name}.csv ({self.row_counts[table_name]} rows)")
+            total_rows += self.row_counts[table_name]
+
+        return total_rows
+
     def format_datetime(self, dt):
         """Format datetime for MySQL."""
         if isinstance(dt, datetime):
@@ -551,23 +993,26 @@ class SeedDataGenerator:
         elif isinstance(dt, date):
             return dt.isoformat()
         return dt
-    
+
     def print_summary(self):
         """Print summary of generated MVP data."""
         print("\n" + "=" * 50)
         print("MVP Data Generation Summary")
         print("=" * 50)
         print(f"Size: {self.size}")
-        print(f"Gyms: {len(self.data.get('gym', []))}")
-        print(f"Users: {len(self.data.get('user', []))}")
-        print(f"Members: {len(self.data.get('member', []))}")
-        print(f"Staff: {len(self.data.get('staff', []))}")
-        print(f"  - Front Desk: {len(self.data.get('front_desk', []))}")
-        print(f"  - Admins: {len(self.data.get('admin', []))}")
-        print(f"  - Super Admins: {len(self.data.get('super_admin', []))}")
-        print(f"Membership Plans: {len(self.data.get('membership_plan', []))}")
-        print(f"Access Cards: {len(self.data.get('access_card', []))}")
-        print(f"\nPost-MVP tables (empty CSVs): Equipment, Sessions, Bookings, Check-ins")
+        print(f"Gyms: {self.row_counts['gym']}")
+        print(f"Users: {self.row_counts['user']}")
+        print(f"Members: {self.row_counts['member']}")
+        print(f"Staff: {self.row_counts['staff']}")
+        print(f"  - Front Desk: {self.row_counts['front_desk']}")
+        print(f"  - Admins: {self.row_counts['admin']}")
+        print(f"  - Super Admins: {self.row_counts['super_admin']}")
+        print(f"Membership Plans: {self.row_counts['membership_plan']}")
+        print(f"Access Cards: {self.row_counts['access_card']}")
+        print(f"Equipment Kinds: {self.row_counts['equip_kind']}")
+        print(f"Equipment Items: {self.row_counts['equipment_item']}")
+        print(f"Inventory Counts: {self.row_counts['inventory_count']}")
+        print(f"\nPost-MVP tables (empty CSVs): Service logs, Sessions, Bookings, Check-ins")
         print("=" * 50)
 
 
@@ -584,12 +1029,30 @@ Sizes:
   large:  10000 members (for 1 gym)
   huge:   100000 members (for 1 gym)
 
+Scale options override the size preset (precedence: CLI > --scale-config > --size).
+
+Scale config (JSON):
+  {
+    "members": 5000000,
+    "gyms": 60,
+    "front_desk_per_gym": 4,
+    "admins_per_gym": 1,
+    "gym_skew": 1.1,
+    "access_cards_pct": 0.8,
+    "equipment_per_kind": 6,
+    "plan_mix": {"trial": 10, "basic": 60, "plus": 30},
+    "gym_plan_mix": {"1": {"trial": 5, "basic": 35, "plus": 60}}
+  }
+
 Examples:
   python generate_seed.py --size tiny --output ./csvs
   python generate_seed.py --size medium --output ./csvs
+  python generate_seed.py --size large --profile --profile-top 20 --trace-memory
+  python generate_seed.py --size huge --metrics-json ./seed_metrics.json
+  python generate_seed.py --members 10000000 --gyms 200 --gym-skew 1.0 --plan-mix trial=5,basic=55,plus=40
         """
     )
-    
+
     parser.add_argument(
         '--size',
         choices=['tiny', 'small', 'medium', 'large', 'huge'],
@@ -602,27 +1065,141 @@ Examples:
         default=Path('./csvs'),
         help='Output directory for CSV files (default: ./csvs)'
     )
-    
+    parser.add_argument(
+        '--scale-config',
+        type=Path,
+        default=None,
+        help='JSON file with scale parameters (see below)'
+    )
+    parser.add_argument(
+        '--members',
+        type=int,
+        default=None,
+        help='Number of members (overrides --size)'
+    )
+    parser.add_argument(
+        '--gyms',
+        type=int,
+        default=None,
+        help='Number of gyms (overrides --size)'
+    )
+    parser.add_argument(
+        '--front-desk-per-gym',
+        type=int,
+        default=None,
+        help='Front desk staff per gym'
+    )
+    parser.add_argument(
+        '--admins-per-gym',
+        type=int,
+        default=None,
+        help='Admin staff per gym'
+    )
+    parser.add_argument(
+        '--gym-skew',
+        type=float,
+        default=None,
+        help='Zipf exponent for members across gyms (0 = uniform, ~1 = a few busy flagship gyms)'
+    )
+    parser.add_argument(
+        '--plan-mix',
+        type=parse_plan_mix,
+        default=None,
+        help='Tier weights for every gym, e.g. trial=10,basic=60,plus=30'
+    )
+    parser.add_argument(
+        '--access-cards-pct',
+        type=float,
+        default=None,
+        help='Share of members with an access card (default: 0.80)'
+    )
+    parser.add_argument(
+        '--equipment-per-kind',
+        type=float,
+        default=None,
+        help='Machines of each per_item kind at an average gym (default: 4; busier gyms get more)'
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Print wall time, CPU time, peak RSS and rows/sec for each phase'
+    )
+    parser.add_argument(
+        '--metrics-json',
+        type=Path,
+        default=None,
+        help='Write per-phase metrics to this JSON file (implies --profile)'
+    )
+    parser.add_argument(
+        '--profile-top',
+        type=int,
+        default=0,
+        help='Include the top N functions by cumulative time (cProfile)'
+    )
+    parser.add_argument(
+        '--trace-memory',
+        action='store_true',
+        help='Track Python allocations with tracemalloc (slower; reports top allocation sites)'
+    )
+
     return parser.parse_args()
 
 
 def main():
     """Main execution function."""
     args = parse_arguments()
-    
+
+    overrides = {}
+    if args.scale_config:
+        with open(args.scale_config, 'r', encoding='utf-8') as f:
+            overrides.update(json.load(f))
+    cli_overrides = {
+        'members': args.members,
+        'gyms': args.gyms,
+        'front_desk_per_gym': args.front_desk_per_gym,
+        'admins_per_gym': args.admins_per_gym,
+        'gym_skew': args.gym_skew,
+        'plan_mix': args.plan_mix,
+        'access_cards_pct': args.access_cards_pct,
+        'equipment_per_kind': args.equipment_per_kind,
+    }
+    overrides.update({key: value for key, value in cli_overrides.items() if value is not None})
+
     print("=" * 50)
     print("FitDB Seed Data Generator")
     print("=" * 50)
     print(f"Size: {args.size}")
     print(f"Output: {args.output}")
     print()
-    
-    generator = SeedDataGenerator(args.size, args.output)
+
+    profiling = args.profile or args.metrics_json is not None
+    profiler = PhaseProfiler(
+        enabled=profiling,
+        top_n=args.profile_top,
+        trace_memory=profiling and args.trace_memory
+    )
+
+    try:
+        generator = SeedDataGenerator(args.size, args.output, profiler, overrides)
+    except ValueError as e:
+        print(f"ERROR: Invalid scale configuration: {e}")
+        sys.exit(1)
     generator.generate_all()
-    
+
+    if profiling:
+        report = profiler.report()
+        report['size'] = args.size
+        report['config'] = generator.config
+        profiler.print_report(report)
+        if args.metrics_json:
+            args.metrics_json.parent.mkdir(parents=True, exist_ok=True)
+            with open(args.metrics_json, 'w', encoding='utf-8') as f:
+                json.dump({'generate_seed': report}, f, indent=2)
+            print(f"Metrics written to {args.metrics_json}")
+
     print("\nCSV files generated successfully!")
     print(f"Next step: Run 'make seed' or load with bulkcopy.sql")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,82 @@
+"""
+FitDB Seed CSV Schema
+
+Column order and unique keys of every seed CSV, shared by generate_seed.py and
+validate_seed.py. Kept free of imports so the validator runs without Faker.
+"""
+
+# CSV column order for every table (must match bulkcopy.sql)
+TABLE_FIELDS = {
+    'user': ['id', 'username', 'email', 'password_hash', 'password_algo', 'password_updated_at',
+            'last_login_at', 'profile_photo_path', 'status_id', 'created_at', 'updated_at'],
+    'staff': ['id', 'user_id', 'gym_id', 'status_id', 'notes', 'created_at', 'updated_at'],
+    'trainer': ['id', 'staff_id', 'certification', 'bio', 'created_at', 'updated_at'],
+    'manager': ['id', 'staff_id', 'scope', 'created_at', 'updated_at'],
+    'floor_manager': ['id', 'staff_id', 'scope', 'created_at', 'updated_at'],
+    'front_desk': ['id', 'staff_id', 'capabilities', 'created_at', 'updated_at'],
+    'admin': ['id', 'staff_id', 'scope', 'created_at', 'updated_at'],
+    'super_admin': ['id', 'user_id', 'scope', 'created_at', 'updated_at'],
+    'gym': ['id', 'name', 'address', 'status_id', 'created_at', 'updated_at'],
+    'equip_kind': ['id', 'name', 'mode', 'created_at', 'updated_at'],
+    'equipment_item': ['id', 'gym_id', 'equip_kind_id', 'status_id', 'serial_no', 'uses_count',
+                     'uses_since_clean', 'uses_since_service', 'rated_uses', 'last_serviced_at',
+                     'last_cleaned_at', 'cleaning_interval_uses', 'cleaning_interval_days', 'next_clean_due_at', 'service_required',
+                     'cleaning_required', 'created_at', 'updated_at'],
+    'inventory_count': ['id', 'gym_id', 'equip_kind_id', 'qty_on_floor', 'qty_in_storage',
+                      'reorder_needed', 'updated_snapshot_at', 'created_at', 'updated_at'],
+    'service_log': ['id', 'equipment_item_id', 'serviced_at', 'action', 'notes', 'staff_id',
+                  'created_at', 'updated_at'],
+    'class_session': ['id', 'gym_id', 'title', 'description', 'starts_at', 'ends_at', 'capacity',
+                    'max_trainers', 'open_for_booking', 'status_id', 'created_at', 'updated_at'],
+    'trainer_avail_date': ['id', 'trainer_id', 'gym_id', 'for_date', 'period', 'status_id',
+                          'created_at', 'updated_at'],
+    'session_trainer': ['id', 'session_id', 'trainer_id', 'role', 'assigned_at', 'created_at', 'updated_at'],
+    'session_equip_reservation': ['id', 'session_id', 'equip_kind_id', 'quantity', 'created_at', 'updated_at'],
+    'membership_plan': ['id', 'name', 'tier', 'billing_cycle', 'price', 'status_id', 'created_at', 'updated_at'],
+    'member': ['id', 'user_id', 'membership_plan_id', 'home_gym_id', 'joined_on', 'trial_expires_on',
+              'status_id', 'created_at', 'updated_at'],
+    'booking': ['id', 'session_id', 'member_id', 'status_id', 'booked_at', 'cancellation_reason',
+               'notes', 'created_at', 'updated_at'],
+    'access_card': ['id', 'member_id', 'gym_id', 'card_uid', 'status_id', 'issued_at', 'revoked_at',
+                  'created_at', 'updated_at'],
+    'check_in': ['id', 'member_id', 'gym_id', 'access_card_id', 'checked_in_at', 'method',
+                'created_at', 'updated_at']
+}
+
+# Unique keys per table (first entry is the primary key); mirrors 03_core_tables.sql.
+# String columns listed in COLLATED_KEY_COLUMNS compare case- and accent-insensitively.
+UNIQUE_KEYS = {
+    'user': [('id',), ('username',), ('email',)],
+    'staff': [('id',), ('user_id',)],
+    'trainer': [('id',), ('staff_id',)],
+    'manager': [('id',), ('staff_id',)],
+    'floor_manager': [('id',), ('staff_id',)],
+    'front_desk': [('id',), ('staff_id',)],
+    'admin': [('id',), ('staff_id',)],
+    'super_admin': [('id',), ('user_id',)],
+    'gym': [('id',)],
+    'equip_kind': [('id',), ('name',)],
+    'equipment_item': [('id',), ('gym_id', 'serial_no')],
+    'inventory_count': [('id',), ('gym_id', 'equip_kind_id')],
+    'service_log': [('id',)],
+    'class_session': [('id',)],
+    'trainer_avail_date': [('id',), ('trainer_id', 'for_date', 'period')],
+    'session_trainer': [('id',), ('session_id', 'trainer_id')],
+    'session_equip_reservation': [('id',), ('session_id', 'equip_kind_id')],
+    'membership_plan': [('id',), ('name',)],
+    'member': [('id',), ('user_id',)],
+    'booking': [('id',), ('member_id', 'session_id')],
+    'access_card': [('id',), ('card_uid',)],
+    'check_in': [('id', 'checked_in_at')],
+}
+
+# Unique-key columns compared under the database collation (utf8mb4_0900_ai_ci, build.sql):
+# values that differ only by case or accent collide in these keys
+COLLATED_KEY_COLUMNS = {
+    'user': {'username', 'email'},
+    'equip_kind': {'name'},
+    'equipment_item': {'serial_no'},
+    'trainer_avail_date': {'period'},
+    'membership_plan': {'name'},
+    'access_card': {'card_uid'},
+}
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+# (WIP)
+"""
+FitDB Seed Data Validator
+
+Checks generated CSV files before they are loaded. bulkcopy.sql runs with
+FOREIGN_KEY_CHECKS = 0 and UNIQUE_CHECKS = 0, so a bad dataset would otherwise
+surface deep into a long load (as a trigger error) or not at all.
+
+Every file is streamed once, in foreign-key order (O(n) time):
+    - column count per row (a short/long row silently shifts columns in LOAD DATA)
+    - NOT NULL columns are non-empty
+    - primary and unique keys (username, email, card_uid, composite keys, ...)
+    - foreign keys, including status ids against the indicator tables
+    - CHECK constraints (capacity > 0, ends_at > starts_at, quantities >= 0)
+    - trigger rules enforced during the load: one ACTIVE access card per member,
+      check-in cards belong to the checking-in member
+
+Integer ids are tracked in bitmaps (1 bit per id). String and composite unique
+keys are kept as 64-bit hashes in sorted array('q') chunks, 8 bytes per key per
+row: memory is still O(n), ~160 MB for 10M users with two string keys (a Python
+set would need 50-60 bytes per entry). Duplicate hashes found by merging the
+chunks are confirmed with a second, exact pass over that file only, so a hash
+collision never reports a false duplicate. Keys with an empty (NULL) nullable
+column are skipped, as MySQL allows repeated NULLs in a UNIQUE index. String
+key columns compare like utf8mb4_0900_ai_ci (case-folded, accents stripped),
+so 'Ann' and 'ann' or 'José' and 'jose' are reported as duplicates.
+
+Usage:
+    python validate_seed.py --csv-dir ./csvs
+    python validate_seed.py --csv-dir ./csvs --max-examples 20 --json /tmp/fitdb_validation.json
+"""
+
+import argparse
+import csv
+import heapq
+import json
+import re
+import sys
+import time
+import unicodedata
+from array import array
+from pathlib import Path
+
+from seed_schema import COLLATED_KEY_COLUMNS, TABLE_FIELDS, UNIQUE_KEYS
+
+# Unique-key hashes are sorted in chunks of this many entries
+HASH_CHUNK_ROWS = 1 << 20
+
+SCRIPT_DIR = Path(__file__).parent
+INDICATOR_SQL = SCRIPT_DIR.parent / 'sql' / 'helpers' / '02_indicator_tables.sql'
+
+# Parent tables first, so every FK target is complete before its children are read
+LOAD_ORDER = [
+    'gym', 'equip_kind', 'membership_plan', 'user', 'staff', 'trainer', 'manager', 'floor_manager',
+    'front_desk', 'admin', 'super_admin', 'equipment_item', 'inventory_count', 'service_log',
+    'class_session', 'trainer_avail_date', 'session_trainer', 'session_equip_reservation',
+    'member', 'booking', 'access_card', 'check_in'
+]
+
+
+# Foreign keys per table: column -> referenced table (upper case = indicator table)
+FOREIGN_KEYS = {
+    'user': {'status_id': 'ACCOUNT_STATUS_IND'},
+    'staff': {'user_id': 'user', 'gym_id': 'gym', 'status_id': 'ACCOUNT_STATUS_IND'},
+    'trainer': {'staff_id': 'staff'},
+    'manager': {'staff_id': 'staff'},
+    'floor_manager': {'staff_id': 'staff'},
+    'front_desk': {'staff_id': 'staff'},
+    'admin': {'staff_id': 'staff'},
+    'super_admin': {'user_id': 'user'},
+    'gym': {'status_id': 'GYM_STATUS_IND'},
+    'equipment_item': {'gym_id': 'gym', 'equip_kind_id': 'equip_kind', 'status_id': 'EQUIPMENT_STATUS_IND'},
+    'inventory_count': {'gym_id': 'gym', 'equip_kind_id': 'equip_kind'},
+    'service_log': {'equipment_item_id': 'equipment_item', 'staff_id': 'staff'},
+    'class_session': {'gym_id': 'gym', 'status_id': 'SESSION_STATUS_IND'},
+    'trainer_avail_date': {'trainer_id': 'trainer', 'gym_id': 'gym', 'status_id': 'AVAILABILITY_STATUS_IND'},
+    'session_trainer': {'session_id': 'class_session', 'trainer_id': 'trainer'},
+    'session_equip_reservation': {'session_id': 'class_session', 'equip_kind_id': 'equip_kind'},
+    'membership_plan': {'status_id': 'PLAN_STATUS_IND'},
+    'member': {'user_id': 'user', 'membership_plan_id': 'membership_plan', 'home_gym_id': 'gym',
+               'status_id': 'ACCOUNT_STATUS_IND'},
+    'booking': {'session_id': 'class_session', 'member_id': 'member', 'status_id': 'BOOKING_STATUS_IND'},
+    'access_card': {'member_id': 'member', 'gym_id': 'gym', 'status_id': 'ACCESS_CARD_STATUS_IND'},
+    'check_in': {'member_id': 'member', 'gym_id': 'gym', 'access_card_id': 'access_card'},
+}
+
+# Columns that may be empty (bulkcopy.sql turns '' into NULL for these)
+NULLABLE_COLUMNS = {
+    'user': {'last_login_at', 'profile_photo_path'},
+    'staff': {'notes'},
+    'trainer': {'certification', 'bio'},
+    'equipment_item': {'serial_no', 'last_serviced_at', 'last_cleaned_at', 'next_clean_due_at'},
+    'service_log': {'notes', 'staff_id'},
+    'class_session': {'description'},
+    'member': {'trial_expires_on'},
+    'booking': {'cancellation_reason', 'notes'},
+    'access_card': {'revoked_at'},
+    'check_in': {'access_card_id'},
+}
+
+# CHECK constraints: (description, predicate over the row dict)
+# datetimes are compared as strings; the generator always writes '%Y-%m-%d %H:%M:%S.%f'
+CHECKS = {
+    'class_session': [
+        ('capacity > 0', lambda r: int(r['capacity']) > 0),
+        ('ends_at > starts_at', lambda r: r['ends_at'] > r['starts_at']),
+    ],
+    'equipment_item': [
+        ('uses_count >= 0 AND uses_since_clean >= 0 AND uses_since_service >= 0',
+         lambda r: int(r['uses_count']) >= 0 and int(r['uses_since_clean']) >= 0
+         and int(r['uses_since_service']) >= 0),
+    ],
+    'inventory_count': [
+        ('qty_on_floor >= 0 AND qty_in_storage >= 0',
+         lambda r: int(r['qty_on_floor']) >= 0 and int(r['qty_in_storage']) >= 0),
+    ],
+    'session_equip_reservation': [
+        ('quantity >= 0', lambda r: int(r['quantity']) >= 0),
+    ],
+}
+
+
+def load_indicator_sizes():
+    """Number of rows seeded into each indicator table (ids are 1..n, in insert order)."""
+    sizes = {}
+    codes = {}
+    sql_text = INDICATOR_SQL.read_text(encoding='utf-8')
+    pattern = re.compile(r'INSERT IGNORE INTO (\w+)\(code,label\) VALUES(.*?);', re.DOTALL)
+    for table, values in pattern.findall(sql_text):
+        table_codes = re.findall(r"\('(\w+)',", values)
+        sizes[table] = len(table_codes)
+        codes[table] = {code: index + 1 for index, code in enumerate(table_codes)}
+    return sizes, codes
+
+
+def is_id(text):
+    """True for a non-negative integer id written as plain ASCII digits."""
+    return text.isascii() and text.isdigit()
+
+
+def collation_key(value):
+    """Approximate utf8mb4_0900_ai_ci equality: case-fold, then drop accents (NFKD combining marks)."""
+    if value.isascii():
+        return value.casefold()
+    decomposed = unicodedata.normalize('NFKD', value.casefold())
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def key_values(row, key, collated):
+    """Values of a unique key as the database compares them."""
+    return tuple(collation_key(row[column]) if column in collated else row[column] for column in key)
+
+
+class IdBitmap:
+    """Set of non-negative integer ids stored as one bit per id."""
+
+    def __init__(self):
+        self.bits = bytearray()
+
+    def add(self, value):
+        """Add an id; returns False if it was already present."""
+        if value < 0:
+            raise ValueError(f"negative id {value}")
+        byte, bit = divmod(value, 8)
+        if byte >= len(self.bits):
+            self.bits.extend(bytes(max(byte + 1 - len(self.bits), len(self.bits))))
+        mask = 1 << bit
+        if self.bits[byte] & mask:
+            return False
+        self.bits[byte] |= mask
+        return True
+
+    def __contains__(self, value):
+        byte, bit = divmod(value, 8)
+        return 0 <= byte < len(self.bits) and bool(self.bits[byte] & (1 << bit))
+
+
+class HashChunks:
+    """Multiset of 64-bit key hashes stored as sorted array('q') chunks (8 bytes per entry)."""
+
+    def __init__(self):
+        self.chunks = []
+        self.current = array('q')
+
+    def add(self, key_hash):
+        self.current.append(key_hash)
+        if len(self.current) >= HASH_CHUNK_ROWS:
+            self.seal()
+
+    def seal(self):
+        if self.current:
+            self.chunks.append(array('q', sorted(self.current)))
+            self.current = array('q')
+
+    def duplicates(self):
+        """Hashes added more than once (merges the sorted chunks)."""
+        self.seal()
+        duplicates = set()
+        previous = None
+        for key_hash in heapq.merge(*self.chunks):
+            if key_hash == previous:
+                duplicates.add(key_hash)
+            previous = key_hash
+        self.chunks = []
+        return duplicates
+
+
+class RangeIds:
+    """Id set for indicator tables (ids 1..n)."""
+
+    def __init__(self, size):
+        self.size = size
+
+    def __contains__(self, value):
+        return 1 <= value <= self.size
+
+
+class SeedValidator:
+    """Validates a directory of seed CSVs in a single streaming pass per file."""
+
+    def __init__(self, csv_dir: Path, max_examples: int = 5):
+        self.csv_dir = csv_dir
+        self.max_examples = max_examples
+        self.indicator_sizes, self.indicator_codes = load_indicator_sizes()
+
+        self.ids = {}           # table -> IdBitmap of primary keys seen
+        self.errors = {}        # check name -> {'count': n, 'examples': [...]}
+        self.table_stats = []
+
+        # trigger rules
+        self.active_card_status_id = self.indicator_codes['ACCESS_CARD_STATUS_IND']['ACTIVE']
+        self.members_with_active_card = IdBitmap()
+        self.card_owner = array('q')  # access_card.id -> member_id (0 = unknown)
+
+    def error(self, check, table_name, line_no, detail):
+        """Record a failed check (keeps the first max_examples occurrences)."""
+        entry = self.errors.setdefault(check, {'count': 0, 'examples': []})
+        entry['count'] += 1
+        if len(entry['examples']) < self.max_examples:
+            entry['examples'].append(f"{table_name}.csv:{line_no}: {detail}")
+
+    def target_ids(self, target):
+        """Id set for an FK target table."""
+        if target.isupper():
+            return RangeIds(self.indicator_sizes[target])
+        return self.ids[target]
+
+    def validate_all(self):
+        """Validate every table in FK order; returns True when the dataset is clean."""
+        for table_name in LOAD_ORDER:
+            self.validate_table(table_name)
+        return not self.errors
+
+    def validate_table(self, table_name):
+        """Stream one CSV and run all checks that apply to it."""
+        fields = TABLE_FIELDS[table_name]
+        path = self.csv_dir / f"{table_name}.csv"
+        self.ids[table_name] = IdBitmap()
+        if not path.exists():
+            self.error('missing file', table_name, 0, f"{path} not found")
+            return
+
+        start = time.perf_counter()
+        pk_ids = self.ids[table_name]
+        nullable = NULLABLE_COLUMNS.get(table_name, set())
+        required = [f for f in fields if f not in nullable]
+        foreign_keys = [(column, target, self.target_ids(target), column in nullable)
+                        for column, target in FOREIGN_KEYS.get(table_name, {}).items()]
+        unique_keys = UNIQUE_KEYS[table_name]
+        # single integer id primary keys use the bitmap; everything else hash chunks
+        id_pk = unique_keys[0] == ('id',)
+        collated = COLLATED_KEY_COLUMNS.get(table_name, set())
+        hashed_keys = [(key, [c for c in key if c in nullable], HashChunks())
+                       for key in (unique_keys[1:] if id_pk else unique_keys)]
+        checks = CHECKS.get(table_name, [])
+        rows = 0
+
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            for line_no, values in enumerate(csv.reader(f), start=1):
+                rows += 1
+                if len(values) != len(fields):
+                    self.error('column count', table_name, line_no,
+                               f"expected {len(fields)} columns, got {len(values)}")
+                    continue
+                row = dict(zip(fields, values))
+
+                for column in required:
+                    if row[column] == '':
+                        self.error('not null', table_name, line_no, f"{column} is empty")
+
+                if not is_id(row['id']):
+                    self.error('bad id', table_name, line_no, f"id={row['id']!r}")
+                    continue
+                row_id = int(row['id'])
+
+                # primary / unique keys
+                if id_pk and not pk_ids.add(row_id):
+                    self.error('duplicate key', table_name, line_no, f"id={row_id}")
+                elif not id_pk:
+                    pk_ids.add(row_id)
+                for key, nullable_columns, hashes in hashed_keys:
+                    if any(row[column] == '' for column in nullable_columns):
+                        continue
+                    hashes.add(hash(key_values(row, key, collated)))
+
+                # foreign keys
+                for column, target, target_ids, is_nullable in foreign_keys:
+                    value = row[column]
+                    if value == '' and is_nullable:
+                        continue
+                    if not is_id(value) or int(value) not in target_ids:
+                        self.error('foreign key', table_name, line_no, f"{column}={value!r} not in {target}")
+
+                # CHECK constraints
+                for description, predicate in checks:
+                    try:
+                        passed = predicate(row)
+                    except ValueError:
+                        passed = False
+                    if not passed:
+                        self.error('check constraint', table_name, line_no, description)
+
+                if table_name == 'access_card':
+                    self.check_access_card(row, row_id, line_no)
+                elif table_name == 'check_in':
+                    self.check_check_in(row, line_no)
+
+        for key, nullable_columns, hashes in hashed_keys:
+            duplicates = hashes.duplicates()
+            if duplicates:
+                self.report_duplicates(table_name, path, fields, key, nullable_columns, collated, duplicates)
+
+        elapsed = time.perf_counter() - start
+        self.table_stats.append({
+            'table': table_name,
+            'rows': rows,
+            'wall_s': round(elapsed, 4),
+            'rows_per_s': round(rows / elapsed, 1) if elapsed > 0 else None,
+        })
+
+    def report_duplicates(self, table_name, path, fields, key, nullable_columns, collated, duplicate_hashes):
+        """Second pass over one file: report rows repeating an earlier row's key (exact comparison)."""
+        first_seen = {}  # hash -> set of key values seen with that hash
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            for line_no, values in enumerate(csv.reader(f), start=1):
+                if len(values) != len(fields):
+                    continue
+                row = dict(zip(fields, values))
+                if any(row[column] == '' for column in nullable_columns):
+                    continue
+                values = key_values(row, key, collated)
+                key_hash = hash(values)
+                if key_hash not in duplicate_hashes:
+                    continue
+                seen = first_seen.setdefault(key_hash, set())
+                if values in seen:
+                    key_text = ', '.join(f"{column}={row[column]!r}" for column in key)
+                    self.error('duplicate key', table_name, line_no, key_text)
+                else:
+                    seen.add(values)
+
+    def check_access_card(self, row, card_id, line_no):
+        """One ACTIVE card per member (trg_member_access_card_unique); remember card owners."""
+        if not is_id(row['member_id']):
+            return
+        member_id = int(row['member_id'])
+        if row['status_id'] == str(self.active_card_status_id):
+            if not self.members_with_active_card.add(member_id):
+                self.error('one active card per member', 'access_card', line_no,
+                           f"member_id={member_id} already has an ACTIVE card")
+        if card_id >= len(self.card_owner):
+            self.card_owner.extend([0] * max(card_id + 1 - len(self.card_owner), len(self.card_owner)))
+        self.card_owner[card_id] = member_id
+
+    def check_check_in(self, row, line_no):
+        """Check-in cards must belong to the member (trg_checkin_validation)."""
+        card = row['access_card_id']
+        if not is_id(card) or not is_id(row['member_id']):
+            return
+        card_id = int(card)
+        if card_id < len(self.card_owner) and self.card_owner[card_id] not in (0, int(row['member_id'])):
+            self.error('card belongs to member', 'check_in', line_no,
+                       f"access_card_id={card_id} belongs to member_id={self.card_owner[card_id]}")
+
+    def report(self):
+        """Build the validation report as a JSON-serializable dict."""
+        return {
+            'valid': not self.errors,
+            'tables': self.table_stats,
+            'errors': self.errors,
+        }
+
+    def print_report(self, report, total_wall_s):
+        """Print per-table row counts and any failed checks."""
+        print("\n" + "=" * 60)
+        print("Seed Validation")
+        print("=" * 60)
+        print(f"{'Table':<30}{'Rows':>12}{'Wall (s)':>10}")
+        for stats in report['tables']:
+            print(f"{stats['table']:<30}{stats['rows']:>12}{stats['wall_s']:>10}")
+        print(f"\nTotal wall time: {total_wall_s}s")
+
+        if report['valid']:
+            print("\nAll checks passed.")
+        else:
+            print("\nFAILED checks:")
+            for check, entry in report['errors'].items():
+                print(f"  {check}: {entry['count']} row(s)")
+                for example in entry['examples']:
+                    print(f"    {example}")
+        print("=" * 60)
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Validate generated seed CSVs before loading them',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python validate_seed.py --csv-dir ./csvs
+  python validate_seed.py --csv-dir ./csvs --max-examples 20 --json /tmp/fitdb_validation.json
+
+Exit status is 1 when any check fails, so it can gate `make seed`.
+        """
+    )
+
+    parser.add_argument(
+        '--csv-dir',
+        type=Path,
+        default=Path('./csvs'),
+        help='Directory containing the generated CSV files (default: ./csvs)'
+    )
+    parser.add_argument(
+        '--max-examples',
+        type=int,
+        default=5,
+        help='Failing rows to show per check (default: 5)'
+    )
+    parser.add_argument(
+        '--json',
+        type=Path,
+        default=None,
+        help='Also write the report to this JSON file'
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    """Main execution function."""
+    args = parse_arguments()
+
+    if not args.csv_dir.is_dir():
+        print(f"ERROR: {args.csv_dir} is not a directory")
+        sys.exit(1)
+
+    validator = SeedValidator(args.csv_dir, args.max_examples)
+    start = time.perf_counter()
+    validator.validate_all()
+    total_wall_s = round(time.perf_counter() - start, 4)
+
+    report = validator.report()
+    validator.print_report(report, total_wall_s)
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.json}")
+
+    sys.exit(0 if report['valid'] else 1)
+
+
+if __name__ == "__main__":
+    main()
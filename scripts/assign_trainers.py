@@ -0,0 +1,586 @@
+#!/usr/bin/env python3
+# (WIP)
+"""
+FitDB Trainer Assignment Solver
+
+Fills SESSION_TRAINER for every SCHEDULED CLASS_SESSION in a date window:
+
+    - a trainer is eligible for a session when TRAINER_AVAIL_DATE has an AVAILABLE row
+      for the session's gym, date and period (AM = before noon, PM = after) - every
+      period the session touches
+    - a trainer never works two overlapping sessions (existing assignments included,
+      at any gym)
+    - each session gets up to max_trainers trainers: one 'lead', the rest 'assistant';
+      assistants are only added to a session that has (or just got) a lead
+
+The window is loaded once into memory. Availability is indexed by (gym, date, period),
+and each trainer's commitments are kept as a sorted interval list with a running
+latest-end, so an overlap check is one bisect (even when existing rows already
+overlap). Sessions are processed in start order; sessions starting together all
+overlap each other, so their seats are filled by bipartite matching (augmenting paths),
+lead seats before assistant seats, trying the least-loaded trainers first. Results are
+written with batched multi-row INSERTs in one transaction.
+
+The solver works on a snapshot: do not run two solvers over the same window at once.
+
+Usage:
+    python scripts/assign_trainers.py --from 2025-11-01 --days 30
+    python scripts/assign_trainers.py --from 2025-11-01 --days 7 --dry-run
+    python scripts/assign_trainers.py --benchmark --bench-gyms 1,10,50 --bench-trainers 20,40
+"""
+
+import argparse
+import bisect
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+try:
+    import mysql.connector
+    from mysql.connector import Error
+except ImportError:
+    print("ERROR: mysql-connector-python is not installed.")
+    print("Please run: pip install -r requirements.txt")
+    sys.exit(1)
+
+# Optional: support for .env files
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+INSERT_BATCH_ROWS = 5000
+
+SESSION_TRAINER_INSERT = (
+    "INSERT INTO SESSION_TRAINER (session_id, trainer_id, role, assigned_at) VALUES (%s, %s, %s, %s)"
+)
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Trainer-to-session assignment solver for FitDB',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python scripts/assign_trainers.py --from 2025-11-01 --days 30
+  python scripts/assign_trainers.py --from 2025-11-01 --days 7 --dry-run --json /tmp/assign.json
+  python scripts/assign_trainers.py --benchmark
+  python scripts/assign_trainers.py --benchmark --bench-gyms 1,10,100 --bench-trainers 20,40 --days 30
+
+Benchmark mode builds a synthetic month (no database needed) for every gyms x trainers
+combination, solves it, verifies the result and prints solve time and fill rate.
+
+Environment Variables:
+  DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME (same as init.py)
+        """
+    )
+
+    parser.add_argument('--host', default=os.getenv('DB_HOST', 'localhost'),
+                        help='Database host (default: localhost or DB_HOST env var)')
+    parser.add_argument('--port', type=int, default=int(os.getenv('DB_PORT', '3306')),
+                        help='Database port (default: 3306 or DB_PORT env var)')
+    parser.add_argument('--user', default=os.getenv('DB_USER', 'root'),
+                        help='Database user (default: root or DB_USER env var)')
+    parser.add_argument('--password', default=os.getenv('DB_PASSWORD', ''),
+                        help='Database password (default: empty or DB_PASSWORD env var)')
+    parser.add_argument('--database', default=os.getenv('DB_NAME', 'fitdb'),
+                        help='Database name (default: fitdb or DB_NAME env var)')
+    parser.add_argument('--from', dest='from_date', type=date.fromisoformat, default=date.today(),
+                        help='First day of the window, YYYY-MM-DD (default: today)')
+    parser.add_argument('--days', type=int, default=30,
+                        help='Window length in days (default: 30)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Solve and report without writing SESSION_TRAINER rows')
+    parser.add_argument('--json', type=Path, default=None,
+                        help='Write the summary (and benchmark rows) to this JSON file')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Solve synthetic schedules instead of the database window')
+    parser.add_argument('--bench-gyms', default='1,10,50',
+                        help='Comma-separated gym counts for --benchmark (default: 1,10,50)')
+    parser.add_argument('--bench-trainers', default='20,40',
+                        help='Comma-separated trainers per gym for --benchmark (default: 20,40)')
+    parser.add_argument('--bench-sessions', type=int, default=40,
+                        help='Sessions per gym per day for --benchmark (default: 40)')
+    parser.add_argument('--seed', type=int, default=434,
+                        help='Random seed for --benchmark (default: 434)')
+
+    args = parser.parse_args()
+    if args.days < 1:
+        parser.error('--days must be >= 1')
+    return args
+
+
+class Session:
+    """A session with seats still to fill."""
+
+    __slots__ = ('id', 'gym_id', 'starts_at', 'ends_at', 'open_seats', 'needs_lead', 'slots')
+
+    def __init__(self, session_id, gym_id, starts_at, ends_at, open_seats, needs_lead):
+        self.id = session_id
+        self.gym_id = gym_id
+        self.starts_at = starts_at
+        self.ends_at = ends_at
+        self.open_seats = open_seats
+        self.needs_lead = needs_lead
+        self.slots = session_slots(starts_at, ends_at)
+
+
+def session_slots(starts_at, ends_at):
+    """(date, period) availability slots a session touches (AM = [00:00, 12:00), PM = [12:00, 24:00))."""
+    slots = []
+    day = starts_at.date()
+    while True:
+        midnight = datetime.combine(day, datetime.min.time())
+        noon = midnight + timedelta(hours=12)
+        if starts_at < noon and ends_at > midnight:
+            slots.append((day, 'AM'))
+        if starts_at < noon + timedelta(hours=12) and ends_at > noon:
+            slots.append((day, 'PM'))
+        day += timedelta(days=1)
+        if datetime.combine(day, datetime.min.time()) >= ends_at:
+            return tuple(slots)
+
+
+class AssignmentSolver:
+    """In-memory availability and commitment indexes plus the per-wave matching."""
+
+    def __init__(self):
+        self.available = defaultdict(set)   # (gym_id, date, period) -> trainer ids
+        self.busy_starts = defaultdict(list)  # trainer -> sorted commitment starts
+        self.busy_ends = defaultdict(list)    # trainer -> commitment ends (same order)
+        self.busy_reach = defaultdict(list)   # trainer -> max(ends[:i + 1]) (latest end so far)
+        self.load_minutes = defaultdict(float)
+
+    def add_availability(self, trainer_id, gym_id, for_date, period):
+        self.available[(gym_id, for_date, period)].add(trainer_id)
+
+    def add_commitment(self, trainer_id, starts_at, ends_at):
+        """Record a session the trainer already works (kept sorted by start)."""
+        starts = self.busy_starts[trainer_id]
+        index = bisect.bisect_left(starts, starts_at)
+        starts.insert(index, starts_at)
+        ends = self.busy_ends[trainer_id]
+        ends.insert(index, ends_at)
+        # existing SESSION_TRAINER rows may overlap each other, so ends are not sorted;
+        # keep the running max from the insert point on (lists are one trainer's window)
+        reach = self.busy_reach[trainer_id]
+        reach.insert(index, ends_at)
+        latest = reach[index - 1] if index > 0 else ends_at
+        for i in range(index, len(reach)):
+            latest = max(latest, ends[i])
+            reach[i] = latest
+        self.load_minutes[trainer_id] += (ends_at - starts_at).total_seconds() / 60
+
+    def is_free(self, trainer_id, starts_at, ends_at):
+        """True when no commitment overlaps [starts_at, ends_at)."""
+        starts = self.busy_starts.get(trainer_id)
+        if not starts:
+            return True
+        # the commitments starting before ends_at overlap unless all of them end by starts_at
+        index = bisect.bisect_left(starts, ends_at)
+        return index == 0 or self.busy_reach[trainer_id][index - 1] <= starts_at
+
+    def overlapping_commitments(self):
+        """(trainer_id, starts_at, ends_at) of commitments that start before an earlier one ends."""
+        overlaps = []
+        for trainer_id, starts in self.busy_starts.items():
+            reach = self.busy_reach[trainer_id]
+            for i in range(1, len(starts)):
+                if starts[i] < reach[i - 1]:
+                    overlaps.append((trainer_id, starts[i], self.busy_ends[trainer_id][i]))
+        return overlaps
+
+    def candidates(self, session):
+        """Free trainers available for every slot of the session, least-loaded first."""
+        eligible = None
+        for for_date, period in session.slots:
+            trainers = self.available.get((session.gym_id, for_date, period))
+            if not trainers:
+                return []
+            eligible = set(trainers) if eligible is None else eligible & trainers
+        free = [t for t in eligible if self.is_free(t, session.starts_at, session.ends_at)]
+        free.sort(key=lambda t: (self.load_minutes[t], t))
+        return free
+
+    @staticmethod
+    def match(seat_candidates):
+        """Maximum bipartite matching of seats to trainers (augmenting paths); returns {seat: trainer}."""
+        owner = {}
+
+        def augment(root):
+            # iterative DFS: stack[k] = (seat, candidate iterator), path[k] = trainer tried at level k
+            seen = set()
+            stack = [(root, iter(seat_candidates[root]))]
+            path = []
+            while stack:
+                for trainer in stack[-1][1]:
+                    if trainer in seen:
+                        continue
+                    seen.add(trainer)
+                    path.append(trainer)
+                    if trainer not in owner:
+                        # free trainer found: every seat on the path takes the trainer tried from it
+                        for (seat, _), taken in zip(stack, path):
+                            owner[taken] = seat
+                        return True
+                    stack.append((owner[trainer], iter(seat_candidates[owner[trainer]])))
+                    break
+                else:
+                    stack.pop()
+                    if path:
+                        path.pop()
+            return False
+
+        for seat in range(len(seat_candidates)):
+            if seat_candidates[seat]:
+                augment(seat)
+        return {seat: trainer for trainer, seat in owner.items()}
+
+    def solve(self, sessions):
+        """Assign trainers to sessions; returns [(session_id, trainer_id, role)]."""
+        assignments = []
+        ordered = sorted((s for s in sessions if s.open_seats > 0), key=lambda s: (s.starts_at, s.id))
+
+        start = 0
+        while start < len(ordered):
+            # a wave = sessions starting at the same instant (they all overlap each other)
+            end = start
+            while end < len(ordered) and ordered[end].starts_at == ordered[start].starts_at:
+                end += 1
+            wave = ordered[start:end]
+            start = end
+
+            wave_candidates = [self.candidates(session) for session in wave]
+            taken = set()
+            for role in ('lead', 'assistant'):
+                seats = []
+                seat_candidates = []
+                for session, candidates in zip(wave, wave_candidates):
+                    if role == 'lead':
+                        count = 1 if session.needs_lead else 0
+                    elif session.needs_lead:
+                        # no trainer could take the lead seat: never leave assistants without a lead
+                        count = 0
+                    else:
+                        count = session.open_seats
+                    pool = [t for t in candidates if t not in taken]
+                    for _ in range(count):
+                        seats.append(session)
+                        seat_candidates.append(pool)
+
+                for seat, trainer in self.match(seat_candidates).items():
+                    session = seats[seat]
+                    taken.add(trainer)
+                    session.open_seats -= 1
+                    if role == 'lead':
+                        session.needs_lead = False
+                    self.add_commitment(trainer, session.starts_at, session.ends_at)
+                    assignments.append((session.id, trainer, role))
+
+        return assignments
+
+
+def verify(sessions, assignments, solver, existing):
+    """Re-check the solver output against itself and the existing commitments
+    ({trainer: [(starts_at, ends_at)]}); returns a list of problems (empty when valid)."""
+    problems = []
+    by_id = {s.id: s for s in sessions}
+    per_session = defaultdict(list)
+    per_trainer = defaultdict(list)
+    for trainer_id, intervals in existing.items():
+        per_trainer[trainer_id].extend((starts_at, ends_at, None) for starts_at, ends_at in intervals)
+    for session_id, trainer_id, role in assignments:
+        session = by_id[session_id]
+        per_session[session_id].append((trainer_id, role))
+        per_trainer[trainer_id].append((session.starts_at, session.ends_at, session_id))
+        for for_date, period in session.slots:
+            if trainer_id not in solver.available.get((session.gym_id, for_date, period), ()):
+                problems.append(f"trainer {trainer_id} not available for session {session_id}")
+
+    for session_id, assigned in per_session.items():
+        if len({trainer for trainer, _ in assigned}) != len(assigned):
+            problems.append(f"session {session_id} has a trainer twice")
+        if sum(role == 'lead' for _, role in assigned) > 1:
+            problems.append(f"session {session_id} has more than one lead")
+        if by_id[session_id].needs_lead and any(role == 'assistant' for _, role in assigned):
+            problems.append(f"session {session_id} has assistants but no lead")
+        if by_id[session_id].open_seats < 0:
+            problems.append(f"session {session_id} exceeds max_trainers")
+
+    # every pair of overlapping intervals involving a new assignment (existing-only overlaps
+    # are reported by load_window, not caused by this run)
+    for trainer_id, intervals in per_trainer.items():
+        intervals.sort(key=lambda interval: interval[:2])
+        for i, (_, first_end, first_id) in enumerate(intervals):
+            for next_start, _, next_id in intervals[i + 1:]:
+                if next_start >= first_end:
+                    break
+                if first_id is not None or next_id is not None:
+                    first = first_id if first_id is not None else 'existing'
+                    second = next_id if next_id is not None else 'existing'
+                    problems.append(f"trainer {trainer_id} double-booked: sessions {first} and {second}")
+    return problems
+
+
+def snapshot_commitments(solver):
+    """Copy of the solver's commitments before solving (for verify)."""
+    return {trainer_id: list(zip(starts, solver.busy_ends[trainer_id]))
+            for trainer_id, starts in solver.busy_starts.items()}
+
+
+def load_window(cursor, from_date, days):
+    """Load sessions, availability and existing commitments for the window into a solver."""
+    window_start = datetime.combine(from_date, datetime.min.time())
+    window_end = window_start + timedelta(days=days)
+    solver = AssignmentSolver()
+
+    cursor.execute("""
+        SELECT cs.id, cs.gym_id, cs.starts_at, cs.ends_at, cs.max_trainers,
+               COUNT(st.id) AS assigned, COALESCE(SUM(st.role = 'lead'), 0) AS leads
+        FROM CLASS_SESSION cs
+        JOIN SESSION_STATUS_IND ssi ON ssi.id = cs.status_id
+        LEFT JOIN SESSION_TRAINER st ON st.session_id = cs.id
+        WHERE ssi.code = 'SCHEDULED'
+          AND cs.starts_at >= %s AND cs.starts_at < %s
+        GROUP BY cs.id, cs.gym_id, cs.starts_at, cs.ends_at, cs.max_trainers
+    """, (window_start, window_end))
+    sessions = [
+        Session(session_id, gym_id, starts_at, ends_at, max_trainers - int(assigned), int(leads) == 0)
+        for session_id, gym_id, starts_at, ends_at, max_trainers, assigned, leads in cursor.fetchall()
+    ]
+
+    # sessions may run past the window's last midnight
+    last_day = max((s.ends_at.date() for s in sessions), default=window_end.date())
+    cursor.execute("""
+        SELECT tad.trainer_id, tad.gym_id, tad.for_date, tad.period
+        FROM TRAINER_AVAIL_DATE tad
+        JOIN AVAILABILITY_STATUS_IND asi ON asi.id = tad.status_id
+        JOIN TRAINER t ON t.id = tad.trainer_id
+        JOIN STAFF s ON s.id = t.staff_id
+        JOIN ACCOUNT_STATUS_IND stsi ON stsi.id = s.status_id
+        WHERE asi.code = 'AVAILABLE'
+          AND stsi.code = 'ACTIVE'
+          AND tad.for_date >= %s AND tad.for_date <= %s
+    """, (from_date, last_day))
+    for trainer_id, gym_id, for_date, period in cursor.fetchall():
+        solver.add_availability(trainer_id, gym_id, for_date, period)
+
+    # anything a trainer already works that overlaps the window, at any gym
+    cursor.execute("""
+        SELECT st.trainer_id, cs.starts_at, cs.ends_at
+        FROM CLASS_SESSION cs
+        JOIN SESSION_STATUS_IND ssi ON ssi.id = cs.status_id
+        JOIN SESSION_TRAINER st ON st.session_id = cs.id
+        WHERE ssi.code != 'CANCELED'
+          AND cs.starts_at < %s AND cs.ends_at > %s
+    """, (datetime.combine(last_day, datetime.min.time()) + timedelta(days=1), window_start - timedelta(days=1)))
+    for trainer_id, starts_at, ends_at in cursor.fetchall():
+        solver.add_commitment(trainer_id, starts_at, ends_at)
+
+    return sessions, solver
+
+
+def write_assignments(connection, assignments):
+    """Insert assignments in batched multi-row INSERTs inside one transaction."""
+    assigned_at = datetime.now()
+    cursor = connection.cursor()
+    try:
+        for offset in range(0, len(assignments), INSERT_BATCH_ROWS):
+            batch = assignments[offset:offset + INSERT_BATCH_ROWS]
+            cursor.executemany(SESSION_TRAINER_INSERT, [(session_id, trainer_id, role, assigned_at)
+                                                        for session_id, trainer_id, role in batch])
+        connection.commit()
+    except Error:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def synthetic_schedule(gyms, trainers_per_gym, sessions_per_day, days, rng, from_date):
+    """Build a synthetic window: each trainer is available ~60% of periods, mostly at a home gym."""
+    solver = AssignmentSolver()
+    sessions = []
+    session_id = 1
+    for day_offset in range(days):
+        for_date = from_date + timedelta(days=day_offset)
+        midnight = datetime.combine(for_date, datetime.min.time())
+        for gym in range(1, gyms + 1):
+            for k in range(trainers_per_gym):
+                trainer_id = (gym - 1) * trainers_per_gym + k + 1
+                for period in ('AM', 'PM'):
+                    if rng.random() < 0.6:
+                        # ~10% of shifts are covered at the neighbouring gym
+                        gym_id = gym % gyms + 1 if rng.random() < 0.1 else gym
+                        solver.add_availability(trainer_id, gym_id, for_date, period)
+
+            for _ in range(sessions_per_day):
+                starts_at = midnight + timedelta(hours=rng.randint(6, 20), minutes=rng.choice((0, 30)))
+                ends_at = starts_at + timedelta(minutes=rng.choice((45, 60, 90)))
+                max_trainers = rng.choices((1, 2, 3), weights=(60, 30, 10))[0]
+                sessions.append(Session(session_id, gym, starts_at, ends_at, max_trainers, True))
+                session_id += 1
+    return sessions, solver
+
+
+def run_benchmark(args):
+    """Solve synthetic schedules for every gyms x trainers combination."""
+    gym_counts = [int(v) for v in args.bench_gyms.split(',')]
+    trainer_counts = [int(v) for v in args.bench_trainers.split(',')]
+    rng = random.Random(args.seed)
+    rows = []
+
+    print("=" * 100)
+    print(f"Trainer Assignment Benchmark ({args.days} days, {args.bench_sessions} sessions/gym/day)")
+    print("=" * 100)
+    print(f"{'Gyms':>6}{'Trainers':>10}{'Sessions':>10}{'Seats':>10}{'Filled':>10}{'Fill %':>8}"
+          f"{'Led %':>8}{'Build s':>9}{'Solve s':>9}{'Sessions/s':>12}{'Valid':>8}")
+    for gyms in gym_counts:
+        for trainers_per_gym in trainer_counts:
+            build_start = time.perf_counter()
+            sessions, solver = synthetic_schedule(gyms, trainers_per_gym, args.bench_sessions, args.days,
+                                                  rng, args.from_date)
+            build_s = time.perf_counter() - build_start
+            seats = sum(s.open_seats for s in sessions)
+            existing = snapshot_commitments(solver)
+
+            solve_start = time.perf_counter()
+            assignments = solver.solve(sessions)
+            solve_s = time.perf_counter() - solve_start
+
+            problems = verify(sessions, assignments, solver, existing)
+            led = sum(not s.needs_lead for s in sessions)
+            row = {
+                'gyms': gyms,
+                'trainers': gyms * trainers_per_gym,
+                'sessions': len(sessions),
+                'seats': seats,
+                'filled': len(assignments),
+                'fill_pct': round(100 * len(assignments) / seats, 1) if seats else 0.0,
+                'led_pct': round(100 * led / len(sessions), 1) if sessions else 0.0,
+                'build_s': round(build_s, 3),
+                'solve_s': round(solve_s, 3),
+                'sessions_per_s': round(len(sessions) / solve_s) if solve_s > 0 else None,
+                'valid': not problems,
+            }
+            rows.append(row)
+            print(f"{gyms:>6}{row['trainers']:>10}{row['sessions']:>10}{seats:>10}{row['filled']:>10}"
+                  f"{row['fill_pct']:>8}{row['led_pct']:>8}{row['build_s']:>9}{row['solve_s']:>9}"
+                  f"{str(row['sessions_per_s']):>12}{'yes' if row['valid'] else 'NO':>8}")
+            for problem in problems[:5]:
+                print(f"    {problem}")
+    print("=" * 100)
+    return rows
+
+
+def main():
+    """Main execution function."""
+    args = parse_arguments()
+
+    if args.benchmark:
+        rows = run_benchmark(args)
+        if args.json:
+            args.json.parent.mkdir(parents=True, exist_ok=True)
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump({'benchmark': rows}, f, indent=2)
+            print(f"Results written to {args.json}")
+        if not all(row['valid'] for row in rows):
+            sys.exit(1)
+        return
+
+    connect_kwargs = {
+        'host': args.host,
+        'port': args.port,
+        'user': args.user,
+        'password': args.password,
+        'database': args.database,
+    }
+
+    print("=" * 50)
+    print("FitDB Trainer Assignment")
+    print("=" * 50)
+    print(f"Window: {args.from_date} + {args.days} days")
+
+    try:
+        connection = mysql.connector.connect(**connect_kwargs)
+        cursor = connection.cursor()
+        load_start = time.perf_counter()
+        sessions, solver = load_window(cursor, args.from_date, args.days)
+        cursor.close()
+        load_s = time.perf_counter() - load_start
+    except Error as e:
+        print("ERROR: Failed to load the scheduling window")
+        print(f"Details: {e}")
+        sys.exit(1)
+
+    overlaps = solver.overlapping_commitments()
+    if overlaps:
+        print(f"WARNING: {len(overlaps)} existing SESSION_TRAINER commitments overlap an earlier one "
+              "for the same trainer (no new work is added on top of them):")
+        for trainer_id, starts_at, ends_at in overlaps[:10]:
+            print(f"  trainer {trainer_id}: {starts_at} - {ends_at}")
+
+    seats = sum(s.open_seats for s in sessions)
+    existing = snapshot_commitments(solver)
+    solve_start = time.perf_counter()
+    assignments = solver.solve(sessions)
+    solve_s = time.perf_counter() - solve_start
+
+    problems = verify(sessions, assignments, solver, existing)
+    if problems:
+        print("ERROR: Solver produced an invalid assignment; nothing was written")
+        for problem in problems[:20]:
+            print(f"  {problem}")
+        sys.exit(1)
+
+    write_s = 0.0
+    if not args.dry_run and assignments:
+        write_start = time.perf_counter()
+        try:
+            write_assignments(connection, assignments)
+        except Error as e:
+            print("ERROR: Failed to write SESSION_TRAINER rows (rolled back)")
+            print(f"Details: {e}")
+            sys.exit(1)
+        write_s = time.perf_counter() - write_start
+    connection.close()
+
+    unled = [s.id for s in sessions if s.needs_lead]
+    summary = {
+        'from': args.from_date.isoformat(),
+        'days': args.days,
+        'sessions': len(sessions),
+        'open_seats': seats,
+        'assigned': len(assignments),
+        'leads': sum(role == 'lead' for _, _, role in assignments),
+        'sessions_without_lead': len(unled),
+        'existing_overlaps': len(overlaps),
+        'load_s': round(load_s, 3),
+        'solve_s': round(solve_s, 3),
+        'write_s': round(write_s, 3),
+        'dry_run': args.dry_run,
+    }
+
+    print(f"Sessions:        {summary['sessions']} ({seats} open seats)")
+    print(f"Assigned:        {summary['assigned']} ({summary['leads']} leads)")
+    print(f"Without a lead:  {summary['sessions_without_lead']}" + (f" e.g. {unled[:10]}" if unled else ""))
+    print(f"Time:            load {summary['load_s']}s, solve {summary['solve_s']}s, write {summary['write_s']}s"
+          + (" (dry run, nothing written)" if args.dry_run else ""))
+    print("=" * 50)
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+# (WIP)
+"""
+FitDB Equipment Usage Ingestion
+
+Applies machine-usage events (one event = one use of an EQUIPMENT_ITEM) to the
+database without turning every use into a row UPDATE:
+
+    batched    - events are coalesced in memory into {item: (uses, last_used_at)};
+                 every --flush-events events or --flush-interval seconds (also while
+                 the input is idle, e.g. a quiet tail -f) the batch is bulk-inserted into EQUIPMENT_USAGE_STAGE and applied set-wise by
+                 CALL sp_flush_equipment_usage (one UPDATE + one audit row per item
+                 per flush; due dates and service/cleaning flags are recomputed there)
+    per-event  - baseline for comparison: one autocommitted UPDATE (and audit row)
+                 per event with the same flag logic
+
+Events come from a file/stdin ("equipment_item_id[,used_at]" per line) or are
+simulated over the seeded fleet with a Zipf skew (a few machines are always busy).
+
+If a flush fails after staging, the rows stay in EQUIPMENT_USAGE_STAGE under the
+printed batch id and can be re-applied with CALL sp_flush_equipment_usage(<id>, @n).
+
+Usage:
+    python scripts/equipment_usage.py --simulate 200000
+    python scripts/equipment_usage.py --simulate 20000 --mode per-event
+    tail -f usage.log | python scripts/equipment_usage.py --input -
+"""
+
+import argparse
+import bisect
+import json
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import mysql.connector
+    from mysql.connector import Error
+except ImportError:
+    print("ERROR: mysql-connector-python is not installed.")
+    print("Please run: pip install -r requirements.txt")
+    sys.exit(1)
+
+# Optional: support for .env files
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+STAGE_INSERT = (
+    "INSERT INTO EQUIPMENT_USAGE_STAGE (batch_id, equipment_item_id, uses, last_used_at) "
+    "VALUES (%s, %s, %s, %s)"
+)
+
+# File/stdin events are read on a background thread; at most this many wait in the queue
+READ_AHEAD_EVENTS = 50000
+
+# Single-table UPDATE assignments are evaluated left to right, so the flag expressions
+# below already see the incremented counters (mirrors sp_flush_equipment_usage)
+PER_EVENT_UPDATE = """
+UPDATE EQUIPMENT_ITEM
+SET uses_count = uses_count + 1,
+    uses_since_clean = uses_since_clean + 1,
+    uses_since_service = uses_since_service + 1,
+    next_clean_due_at = IF(uses_since_clean >= cleaning_interval_uses,
+                           LEAST(COALESCE(next_clean_due_at, %(used_at)s), %(used_at)s), next_clean_due_at),
+    cleaning_required = cleaning_required OR uses_since_clean >= cleaning_interval_uses,
+    service_required = service_required OR uses_since_service >= rated_uses,
+    status_id = IF(status_id = %(ok)s AND service_required, %(needs_service)s, status_id)
+WHERE id = %(item_id)s
+"""
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Batched equipment usage ingestion for FitDB',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python scripts/equipment_usage.py --simulate 200000
+  python scripts/equipment_usage.py --simulate 200000 --flush-events 20000 --json /tmp/usage.json
+  python scripts/equipment_usage.py --simulate 20000 --mode per-event
+  python scripts/equipment_usage.py --input usage.log
+
+Input format (--input):
+  one event per line: equipment_item_id[,used_at]   (used_at defaults to the read time)
+
+Environment Variables:
+  DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME (same as init.py)
+        """
+    )
+
+    parser.add_argument('--host', default=os.getenv('DB_HOST', 'localhost'),
+                        help='Database host (default: localhost or DB_HOST env var)')
+    parser.add_argument('--port', type=int, default=int(os.getenv('DB_PORT', '3306')),
+                        help='Database port (default: 3306 or DB_PORT env var)')
+    parser.add_argument('--user', default=os.getenv('DB_USER', 'root'),
+                        help='Database user (default: root or DB_USER env var)')
+    parser.add_argument('--password', default=os.getenv('DB_PASSWORD', ''),
+                        help='Database password (default: empty or DB_PASSWORD env var)')
+    parser.add_argument('--database', default=os.getenv('DB_NAME', 'fitdb'),
+                        help='Database name (default: fitdb or DB_NAME env var)')
+
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--simulate', type=int, default=None, metavar='EVENTS',
+                        help='Generate this many synthetic events over the seeded fleet (default source)')
+    source.add_argument('--input', default=None, metavar='FILE',
+                        help="Read events from a file ('-' = stdin)")
+
+    parser.add_argument('--mode', choices=['batched', 'per-event'], default='batched',
+                        help='batched (coalesce + set-wise flush) or per-event baseline (default: batched)')
+    parser.add_argument('--flush-events', type=int, default=5000,
+                        help='Flush after this many events (default: 5000)')
+    parser.add_argument('--flush-interval', type=float, default=1.0,
+                        help='Flush at least this often in seconds (default: 1.0)')
+    parser.add_argument('--skew', type=float, default=1.0,
+                        help='Zipf exponent over machines for --simulate (default: 1.0)')
+    parser.add_argument('--seed', type=int, default=433,
+                        help='Random seed for --simulate (default: 433)')
+    parser.add_argument('--json', type=Path, default=None,
+                        help='Write the run summary to this JSON file')
+
+    args = parser.parse_args()
+    if args.simulate is None and args.input is None:
+        args.simulate = 100000
+    if args.flush_events < 1 or args.flush_interval <= 0:
+        parser.error('--flush-events must be >= 1 and --flush-interval must be > 0')
+    return args
+
+
+class UsageCoalescer:
+    """Aggregates usage events per machine until the next flush."""
+
+    def __init__(self):
+        self.pending = {}
+        self.events = 0
+
+    def add(self, item_id, used_at):
+        entry = self.pending.get(item_id)
+        if entry is None:
+            self.pending[item_id] = [1, used_at]
+        else:
+            entry[0] += 1
+            if used_at > entry[1]:
+                entry[1] = used_at
+        self.events += 1
+
+    def drain(self):
+        """Return the pending (item_id, uses, last_used_at) rows and reset."""
+        rows = [(item_id, uses, used_at) for item_id, (uses, used_at) in self.pending.items()]
+        self.pending = {}
+        self.events = 0
+        return rows
+
+
+class UsageWriter:
+    """Writes usage to the database (batched flushes or the per-event baseline)."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.cursor = connection.cursor()
+        self.flush_latencies = []
+        self.items_updated = 0
+        self.statements = 0
+        self.cursor.execute("SELECT code, id FROM EQUIPMENT_STATUS_IND WHERE code IN ('OK', 'NEEDS_SERVICE')")
+        self.status = dict(self.cursor.fetchall())
+
+    def audit_seq(self):
+        """Highest EQUIPMENT_ITEM_AUD sequence number (for the audit-row delta)."""
+        self.cursor.execute("SELECT COALESCE(MAX(seq_no), 0) FROM EQUIPMENT_ITEM_AUD")
+        return self.cursor.fetchone()[0]
+
+    def flush(self, rows):
+        """Stage one coalesced batch and apply it with sp_flush_equipment_usage."""
+        if not rows:
+            return
+        batch_id = random.getrandbits(63)
+        start = time.perf_counter()
+        try:
+            self.cursor.executemany(STAGE_INSERT, [(batch_id, item_id, uses, used_at)
+                                                   for item_id, uses, used_at in rows])
+            self.connection.commit()
+            result = self.cursor.callproc('sp_flush_equipment_usage', (batch_id, 0))
+        except Error:
+            print(f"ERROR: Flush of batch {batch_id} failed ({len(rows)} items staged)")
+            raise
+        self.flush_latencies.append(time.perf_counter() - start)
+        self.items_updated += result[1] or 0
+        self.statements += 2
+
+    def apply_event(self, item_id, used_at):
+        """Per-event baseline: one autocommitted UPDATE per use."""
+        start = time.perf_counter()
+        self.cursor.execute(PER_EVENT_UPDATE, {
+            'item_id': item_id,
+            'used_at': used_at,
+            'ok': self.status['OK'],
+            'needs_service': self.status['NEEDS_SERVICE'],
+        })
+        self.connection.commit()
+        self.flush_latencies.append(time.perf_counter() - start)
+        self.items_updated += self.cursor.rowcount
+        self.statements += 1
+
+    def close(self):
+        self.cursor.close()
+
+
+def load_fleet(cursor):
+    """Item ids of machines that can be used (not retired or out of order)."""
+    cursor.execute("""
+        SELECT ei.id
+        FROM EQUIPMENT_ITEM ei
+        JOIN EQUIPMENT_STATUS_IND esi ON esi.id = ei.status_id
+        WHERE esi.code IN ('OK', 'NEEDS_SERVICE')
+        ORDER BY ei.id
+    """)
+    return [row[0] for row in cursor.fetchall()]
+
+
+def simulated_events(item_ids, count, skew, rng):
+    """Yield (item_id, used_at) events; machine rank k is used with weight 1 / k^skew."""
+    order = list(item_ids)
+    rng.shuffle(order)
+    running = 0.0
+    cum_weights = []
+    for rank in range(1, len(order) + 1):
+        running += 1.0 / (rank ** skew)
+        cum_weights.append(running)
+    for _ in range(count):
+        index = bisect.bisect_left(cum_weights, rng.random() * running)
+        yield order[min(index, len(order) - 1)], datetime.now()
+
+
+def file_events(path):
+    """Yield (item_id, used_at) events from 'equipment_item_id[,used_at]' lines."""
+    handle = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+    try:
+        for line_no, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            item, _, used_at = line.partition(',')
+            try:
+                yield int(item), datetime.fromisoformat(used_at.strip()) if used_at else datetime.now()
+            except ValueError:
+                print(f"WARNING: skipping malformed line {line_no}: {line}")
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def with_idle_ticks(events, tick_s):
+    """
+    Yield events from a background reader, plus None whenever tick_s passes without one.
+
+    A blocking source (stdin, tail -f) would otherwise stall ingest() between events,
+    leaving coalesced usage unflushed for as long as the input stays quiet.
+    """
+    pending = queue.Queue(READ_AHEAD_EVENTS)
+    end = object()
+    failure = []
+
+    def read():
+        try:
+            for event in events:
+                pending.put(event)
+        except Exception as e:  # noqa: BLE001 - re-raised on the consuming thread
+            failure.append(e)
+        finally:
+            pending.put(end)
+
+    threading.Thread(target=read, name='usage-reader', daemon=True).start()
+    while True:
+        try:
+            event = pending.get(timeout=tick_s)
+        except queue.Empty:
+            yield None
+            continue
+        if event is end:
+            break
+        yield event
+    if failure:
+        raise failure[0]
+
+
+def ingest(events, writer, mode, flush_events, flush_interval):
+    """
+    Consume events; returns (event count, elapsed seconds).
+
+    A None event is an idle tick (see with_idle_ticks): nothing to add, but the
+    flush interval is still checked.
+    """
+    coalescer = UsageCoalescer()
+    total = 0
+    start = time.perf_counter()
+    last_flush = start
+
+    try:
+        for event in events:
+            if event is not None:
+                total += 1
+                if mode == 'per-event':
+                    writer.apply_event(*event)
+                    continue
+                coalescer.add(*event)
+            now = time.perf_counter()
+            if coalescer.events >= flush_events or (coalescer.events and now - last_flush >= flush_interval):
+                writer.flush(coalescer.drain())
+                last_flush = now
+            elif not coalescer.events:
+                last_flush = now
+    except KeyboardInterrupt:
+        print("Interrupted; flushing pending usage...")
+
+    writer.flush(coalescer.drain())
+    return total, time.perf_counter() - start
+
+
+def percentile_ms(values, p):
+    """Nearest-rank percentile of a list of seconds, in milliseconds."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000, 2)
+
+
+def main():
+    """Main execution function."""
+    args = parse_arguments()
+
+    connect_kwargs = {
+        'host': args.host,
+        'port': args.port,
+        'user': args.user,
+        'password': args.password,
+        'database': args.database,
+    }
+
+    try:
+        connection = mysql.connector.connect(**connect_kwargs)
+    except Error as e:
+        print("ERROR: Failed to connect to the database")
+        print(f"Details: {e}")
+        sys.exit(1)
+
+    writer = UsageWriter(connection)
+    if args.simulate is not None:
+        item_ids = load_fleet(writer.cursor)
+        if not item_ids:
+            print("ERROR: No usable EQUIPMENT_ITEM rows; seed the database first (make seed)")
+            sys.exit(1)
+        events = simulated_events(item_ids, args.simulate, args.skew, random.Random(args.seed))
+        source = f"simulated ({args.simulate} events over {len(item_ids)} machines, skew {args.skew})"
+    else:
+        events = with_idle_ticks(file_events(args.input), args.flush_interval / 4)
+        source = 'stdin' if args.input == '-' else args.input
+
+    print("=" * 50)
+    print("FitDB Equipment Usage Ingestion")
+    print("=" * 50)
+    print(f"Mode:   {args.mode}")
+    print(f"Source: {source}")
+    if args.mode == 'batched':
+        print(f"Flush:  every {args.flush_events} events or {args.flush_interval}s")
+    print()
+
+    audit_before = writer.audit_seq()
+    try:
+        total, elapsed = ingest(events, writer, args.mode, args.flush_events, args.flush_interval)
+    except Error as e:
+        print(f"Details: {e}")
+        sys.exit(1)
+    audit_rows = writer.audit_seq() - audit_before
+    writer.close()
+    connection.close()
+
+    summary = {
+        'mode': args.mode,
+        'events': total,
+        'elapsed_s': round(elapsed, 3),
+        'events_per_s': round(total / elapsed, 1) if elapsed > 0 else None,
+        'statements': writer.statements,
+        'item_updates': writer.items_updated,
+        'audit_rows': audit_rows,
+        'latency_label': 'flush' if args.mode == 'batched' else 'update',
+        'latency_p50_ms': percentile_ms(writer.flush_latencies, 50),
+        'latency_p95_ms': percentile_ms(writer.flush_latencies, 95),
+        'latency_max_ms': percentile_ms(writer.flush_latencies, 100),
+    }
+
+    print("=" * 50)
+    print(f"Events:        {summary['events']} in {summary['elapsed_s']}s ({summary['events_per_s']}/s)")
+    print(f"Statements:    {summary['statements']}")
+    print(f"Item updates:  {summary['item_updates']}")
+    print(f"Audit rows:    {summary['audit_rows']}")
+    print(f"{summary['latency_label'].capitalize()} latency: p50={summary['latency_p50_ms']}ms  "
+          f"p95={summary['latency_p95_ms']}ms  max={summary['latency_max_ms']}ms")
+    print("=" * 50)
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
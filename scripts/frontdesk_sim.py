@@ -0,0 +1,632 @@
+#!/usr/bin/env python3
+# (WIP)
+"""
+FitDB Front-Desk Workload Simulator
+
+Drives an open-loop mix of front-desk operations against a seeded database:
+
+    check_in      - card-scan INSERT into CHECK_IN (fires trg_checkin_validation)
+    lookup        - CALL sp_get_user_account_info
+    register      - CALL sp_front_desk_create_user_account
+    card_reissue  - revoke the member's ACTIVE card and issue a new one
+
+Arrivals are generated on a schedule that does not wait for earlier requests
+to finish (open loop), so when the database falls behind, requests queue up and
+the queueing delay shows in the reported latency. Latency is measured from the
+*scheduled* arrival time, not from when a worker picked the request up.
+
+The workload profile (JSON, or YAML if PyYAML is installed) sets the operation
+mix, arrival rate, number of gyms, gym skew, burstiness and rate phases such as
+a morning rush. See scripts/workloads/*.json.
+
+Usage:
+    python scripts/frontdesk_sim.py --profile scripts/workloads/morning_rush.json
+    python scripts/frontdesk_sim.py --profile scripts/workloads/steady.json --json /tmp/sim.json
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import mysql.connector
+    from mysql.connector import Error
+except ImportError:
+    print("ERROR: mysql-connector-python is not installed.")
+    print("Please run: pip install -r requirements.txt")
+    sys.exit(1)
+
+# Optional: support for .env files
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+# Optional: YAML workload profiles
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+OPERATIONS = ('check_in', 'lookup', 'register', 'card_reissue')
+
+DEFAULT_PROFILE = {
+    'name': 'default',
+    'duration_s': 60,
+    'rate_per_s': 20.0,
+    'mix': {'check_in': 0.80, 'lookup': 0.12, 'register': 0.03, 'card_reissue': 0.05},
+    'gyms': 0,              # 0 = every gym in the database
+    'gym_skew': 0.0,        # Zipf exponent over gyms (0 = uniform)
+    'burstiness': 1.0,      # coefficient of variation of inter-arrival gaps (1 = Poisson)
+    'phases': [],           # [{'at_s': 30, 'rate_multiplier': 4.0}, ...]
+    'workers': 32,          # database connections
+    'max_outstanding': 5000,
+    'report_interval_s': 5,
+    'key_sample': 200000,   # max cards/users loaded from the seeded database
+    'seed': 437,
+}
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Open-loop front-desk workload simulator for FitDB',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python scripts/frontdesk_sim.py --profile scripts/workloads/morning_rush.json
+  python scripts/frontdesk_sim.py --profile scripts/workloads/steady.json --duration 30 --rate 100
+
+Environment Variables:
+  DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME (same as init.py)
+        """
+    )
+
+    parser.add_argument('--host', default=os.getenv('DB_HOST', 'localhost'),
+                        help='Database host (default: localhost or DB_HOST env var)')
+    parser.add_argument('--port', type=int, default=int(os.getenv('DB_PORT', '3306')),
+                        help='Database port (default: 3306 or DB_PORT env var)')
+    parser.add_argument('--user', default=os.getenv('DB_USER', 'root'),
+                        help='Database user (default: root or DB_USER env var)')
+    parser.add_argument('--password', default=os.getenv('DB_PASSWORD', ''),
+                        help='Database password (default: empty or DB_PASSWORD env var)')
+    parser.add_argument('--database', default=os.getenv('DB_NAME', 'fitdb'),
+                        help='Database name (default: fitdb or DB_NAME env var)')
+    parser.add_argument('--profile', type=Path, default=None,
+                        help='Workload profile (.json, or .yaml/.yml with PyYAML)')
+    parser.add_argument('--duration', type=float, default=None,
+                        help='Override the profile duration in seconds')
+    parser.add_argument('--rate', type=float, default=None,
+                        help='Override the profile base arrival rate (requests/sec)')
+    parser.add_argument('--json', type=Path, default=None,
+                        help='Write the time series and summary to this JSON file')
+
+    return parser.parse_args()
+
+
+def load_profile(path):
+    """Load a workload profile and fill in defaults."""
+    profile = dict(DEFAULT_PROFILE)
+    if path is None:
+        return profile
+
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix in ('.yaml', '.yml'):
+            if not YAML_AVAILABLE:
+                print("ERROR: PyYAML is not installed; use a .json profile or run: pip install pyyaml")
+                sys.exit(1)
+            loaded = yaml.safe_load(f)
+        else:
+            loaded = json.load(f)
+
+    profile.update(loaded or {})
+    unknown = set(profile['mix']) - set(OPERATIONS)
+    if unknown:
+        raise ValueError(f"Unknown operations in mix: {', '.join(sorted(unknown))}")
+    if sum(profile['mix'].values()) <= 0:
+        raise ValueError("Operation mix weights must sum to more than 0")
+    return profile
+
+
+class ArrivalProcess:
+    """
+    Open-loop arrival schedule.
+
+    Gaps between arrivals are gamma distributed with mean 1/rate and coefficient
+    of variation `burstiness` (1.0 is a Poisson process, >1 is burstier).
+    `phases` scale the base rate from a given offset onwards.
+    """
+
+    def __init__(self, rate_per_s, burstiness, phases, rng):
+        self.rate_per_s = rate_per_s
+        self.shape = 1.0 / (burstiness ** 2) if burstiness > 0 else None
+        self.phases = sorted(phases, key=lambda p: p['at_s'])
+        self.phase_starts = [p['at_s'] for p in self.phases]
+        self.rng = rng
+
+    def rate_at(self, offset_s):
+        """Arrival rate in effect at the given offset."""
+        index = bisect.bisect_right(self.phase_starts, offset_s) - 1
+        multiplier = self.phases[index]['rate_multiplier'] if index >= 0 else 1.0
+        return self.rate_per_s * multiplier
+
+    def next_gap(self, offset_s):
+        """Seconds until the next arrival."""
+        rate = self.rate_at(offset_s)
+        if rate <= 0:
+            return 0.1
+        if self.shape is None:
+            return 1.0 / rate
+        return self.rng.gammavariate(self.shape, 1.0 / (rate * self.shape))
+
+
+class KeyPool:
+    """Realistic keys drawn from the seeded database, grouped by gym."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.gym_ids = []
+        self.gym_cum_weights = []
+        self.cards_by_gym = defaultdict(list)    # gym_id -> [(card_id, member_id)]
+        self.user_ids = []
+        self.front_desk_by_gym = defaultdict(list)
+        self.front_desk_any = []
+        self.plan_ids = []
+        self.card_in_flight = set()
+        self.card_status = {}
+
+    def load(self, cursor, gyms, gym_skew, sample):
+        """Load keys, restricting to the first `gyms` gyms (0 = all)."""
+        cursor.execute("SELECT id FROM GYM g WHERE g.status_id = (SELECT id FROM GYM_STATUS_IND WHERE code = 'ACTIVE') ORDER BY id")
+        self.gym_ids = [row[0] for row in cursor.fetchall()]
+        if gyms:
+            self.gym_ids = self.gym_ids[:gyms]
+        if not self.gym_ids:
+            raise RuntimeError("No active gyms found; seed the database first")
+
+        # Zipf weights: gym k gets weight 1 / k^skew
+        total = 0.0
+        for rank in range(1, len(self.gym_ids) + 1):
+            total += 1.0 / (rank ** gym_skew)
+            self.gym_cum_weights.append(total)
+
+        gym_placeholders = ', '.join(['%s'] * len(self.gym_ids))
+        cursor.execute(
+            "SELECT ac.id, ac.member_id, ac.gym_id "
+            "FROM ACCESS_CARD ac "
+            "JOIN MEMBER m ON m.id = ac.member_id "
+            "WHERE ac.status_id = (SELECT id FROM ACCESS_CARD_STATUS_IND WHERE code = 'ACTIVE') "
+            "AND m.status_id = (SELECT id FROM ACCOUNT_STATUS_IND WHERE code = 'ACTIVE') "
+            f"AND ac.gym_id IN ({gym_placeholders}) "
+            "LIMIT %s",
+            (*self.gym_ids, sample)
+        )
+        for card_id, member_id, gym_id in cursor.fetchall():
+            self.cards_by_gym[gym_id].append((card_id, member_id))
+
+        cursor.execute("SELECT user_id FROM MEMBER LIMIT %s", (sample,))
+        self.user_ids = [row[0] for row in cursor.fetchall()]
+
+        cursor.execute(
+            "SELECT u.id, s.gym_id FROM FRONT_DESK fd "
+            "JOIN STAFF s ON s.id = fd.staff_id "
+            "JOIN USER u ON u.id = s.user_id "
+            "WHERE u.status_id = (SELECT id FROM ACCOUNT_STATUS_IND WHERE code = 'ACTIVE')"
+        )
+        for user_id, gym_id in cursor.fetchall():
+            self.front_desk_by_gym[gym_id].append(user_id)
+            self.front_desk_any.append(user_id)
+
+        cursor.execute(
+            "SELECT mp.id FROM MEMBERSHIP_PLAN mp "
+            "JOIN PLAN_STATUS_IND psi ON psi.id = mp.status_id WHERE psi.code = 'ACTIVE'"
+        )
+        self.plan_ids = [row[0] for row in cursor.fetchall()]
+
+        cursor.execute("SELECT code, id FROM ACCESS_CARD_STATUS_IND")
+        self.card_status = dict(cursor.fetchall())
+
+    def pick_gym(self):
+        """Pick a gym according to the skewed distribution."""
+        point = self.rng.random() * self.gym_cum_weights[-1]
+        return self.gym_ids[bisect.bisect_left(self.gym_cum_weights, point)]
+
+    def pick_card(self, gym_id, reserve=False):
+        """Pick an ACTIVE (card_id, member_id) at a gym; optionally reserve it while in flight."""
+        cards = self.cards_by_gym.get(gym_id)
+        if not cards:
+            return None
+        for _ in range(5):
+            index = self.rng.randrange(len(cards))
+            card_id, member_id = cards[index]
+            if card_id in self.card_in_flight:
+                continue
+            if reserve:
+                self.card_in_flight.add(card_id)
+            return index, card_id, member_id
+        return None
+
+    def replace_card(self, gym_id, index, old_card_id, new_card_id):
+        """Swap a reissued card into the pool (called on the event loop thread)."""
+        self.card_in_flight.discard(old_card_id)
+        cards = self.cards_by_gym[gym_id]
+        if new_card_id is not None and index < len(cards) and cards[index][0] == old_card_id:
+            cards[index] = (new_card_id, cards[index][1])
+
+
+class Operations:
+    """Blocking database operations, run on worker threads (one connection per thread)."""
+
+    def __init__(self, connect_kwargs, keys):
+        self.connect_kwargs = connect_kwargs
+        self.keys = keys
+        self.local = threading.local()
+
+    def connection(self):
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None or not conn.is_connected():
+            conn = mysql.connector.connect(autocommit=True, **self.connect_kwargs)
+            self.local.conn = conn
+        return conn
+
+    def check_in(self, gym_id, card_id, member_id):
+        """Card-scan check-in."""
+        conn = self.connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                "INSERT INTO CHECK_IN (member_id, gym_id, access_card_id, method) VALUES (%s, %s, %s, 'scan')",
+                (member_id, gym_id, card_id)
+            )
+        finally:
+            cursor.close()
+
+    def lookup(self, user_id):
+        """Account lookup through sp_get_user_account_info."""
+        conn = self.connection()
+        cursor = conn.cursor()
+        try:
+            cursor.callproc('sp_get_user_account_info', (user_id,))
+            for result in cursor.stored_results():
+                result.fetchall()
+        finally:
+            cursor.close()
+
+    def register(self, gym_id, plan_id, staff_user_id):
+        """New account through sp_front_desk_create_user_account."""
+        conn = self.connection()
+        cursor = conn.cursor()
+        tag = f"sim_{uuid.uuid4().hex[:16]}"
+        try:
+            result = cursor.callproc('sp_front_desk_create_user_account', (
+                tag, f"{tag}@example.com", uuid.uuid4().hex, 'argon2id',
+                plan_id, gym_id, staff_user_id, None, None, None, None
+            ))
+        finally:
+            cursor.close()
+        # the procedure traps SQL errors and reports them through p_result_message
+        if result[7] is None:
+            raise RuntimeError(result[10] or 'registration failed')
+
+    def card_reissue(self, gym_id, card_id, member_id):
+        """Revoke the member's ACTIVE card and issue a replacement; returns the new card id."""
+        conn = self.connection()
+        cursor = conn.cursor()
+        active = self.keys.card_status['ACTIVE']
+        revoked = self.keys.card_status['REVOKED']
+        try:
+            conn.start_transaction()
+            cursor.execute(
+                "UPDATE ACCESS_CARD SET status_id = %s, revoked_at = NOW(6) WHERE id = %s AND status_id = %s",
+                (revoked, card_id, active)
+            )
+            if cursor.rowcount != 1:
+                raise RuntimeError('card was no longer active')
+            cursor.execute(
+                "INSERT INTO ACCESS_CARD (member_id, gym_id, card_uid, status_id, issued_at) "
+                "VALUES (%s, %s, %s, %s, NOW(6))",
+                (member_id, gym_id, f"SIM_{uuid.uuid4().hex}", active)
+            )
+            new_card_id = cursor.lastrowid
+            conn.commit()
+            return new_card_id
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+
+class Recorder:
+    """Collects per-window throughput, latency percentiles and errors."""
+
+    def __init__(self, interval_s):
+        self.interval_s = interval_s
+        self.windows = defaultdict(lambda: defaultdict(lambda: {'latencies': [], 'errors': 0, 'arrivals': 0}))
+        self.totals = defaultdict(lambda: {'latencies': [], 'errors': 0, 'arrivals': 0, 'dropped': 0})
+        self.error_samples = defaultdict(lambda: defaultdict(int))
+
+    def window(self, offset_s):
+        """Index of the reporting window containing the offset."""
+        return int(offset_s // self.interval_s)
+
+    def arrival(self, op, offset_s):
+        """Record a scheduled arrival."""
+        self.windows[self.window(offset_s)][op]['arrivals'] += 1
+        self.totals[op]['arrivals'] += 1
+
+    def dropped(self, op):
+        """Record an arrival shed because too many requests were outstanding."""
+        self.totals[op]['dropped'] += 1
+
+    def completed(self, op, offset_s, latency_s, error=None):
+        """Record a finished request (attributed to the window it was scheduled in)."""
+        bucket = self.windows[self.window(offset_s)][op]
+        if error is None:
+            bucket['latencies'].append(latency_s)
+            self.totals[op]['latencies'].append(latency_s)
+        else:
+            bucket['errors'] += 1
+            self.totals[op]['errors'] += 1
+            self.error_samples[op][str(error)[:120]] += 1
+
+    @staticmethod
+    def summarize(latencies, errors, arrivals, seconds):
+        """Throughput, error rate and latency percentiles for one group of requests."""
+        ordered = sorted(latencies)
+
+        def pct(p):
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000, 2)
+
+        done = len(ordered) + errors
+        return {
+            'arrivals': arrivals,
+            'completed': len(ordered),
+            'errors': errors,
+            'error_rate': round(errors / done, 4) if done else 0.0,
+            'throughput_per_s': round(len(ordered) / seconds, 1) if seconds > 0 else None,
+            'p50_ms': pct(0.50),
+            'p95_ms': pct(0.95),
+            'p99_ms': pct(0.99),
+            'max_ms': round(ordered[-1] * 1000, 2) if ordered else None,
+        }
+
+    def timeseries(self):
+        """Per-window stats across all operations."""
+        series = []
+        for index in sorted(self.windows):
+            ops = self.windows[index]
+            latencies = [lat for bucket in ops.values() for lat in bucket['latencies']]
+            errors = sum(bucket['errors'] for bucket in ops.values())
+            arrivals = sum(bucket['arrivals'] for bucket in ops.values())
+            entry = {'t_s': index * self.interval_s}
+            entry.update(self.summarize(latencies, errors, arrivals, self.interval_s))
+            series.append(entry)
+        return series
+
+    def summary(self, elapsed_s):
+        """Per-operation stats for the whole run."""
+        result = {}
+        for op, totals in self.totals.items():
+            result[op] = self.summarize(totals['latencies'], totals['errors'], totals['arrivals'], elapsed_s)
+            result[op]['dropped'] = totals['dropped']
+            result[op]['top_errors'] = dict(sorted(self.error_samples[op].items(), key=lambda e: -e[1])[:5])
+        return result
+
+
+class Simulator:
+    """Schedules arrivals on the event loop and runs operations on a thread pool."""
+
+    def __init__(self, profile, operations, keys):
+        self.profile = profile
+        self.operations = operations
+        self.keys = keys
+        self.rng = keys.rng
+        self.recorder = Recorder(profile['report_interval_s'])
+        self.executor = ThreadPoolExecutor(max_workers=profile['workers'])
+        self.outstanding = 0
+        self.ops = [op for op in OPERATIONS if profile['mix'].get(op, 0) > 0]
+        self.op_weights = [profile['mix'][op] for op in self.ops]
+
+    def build_call(self, op):
+        """Draw keys for an operation; returns (callable, on_success) or None when no key is available."""
+        gym_id = self.keys.pick_gym()
+        if op == 'check_in':
+            picked = self.keys.pick_card(gym_id)
+            if picked is None:
+                return None
+            _, card_id, member_id = picked
+            return (lambda: self.operations.check_in(gym_id, card_id, member_id)), None
+        if op == 'lookup':
+            if not self.keys.user_ids:
+                return None
+            user_id = self.rng.choice(self.keys.user_ids)
+            return (lambda: self.operations.lookup(user_id)), None
+        if op == 'register':
+            staff = self.keys.front_desk_by_gym.get(gym_id) or self.keys.front_desk_any
+            if not staff or not self.keys.plan_ids:
+                return None
+            staff_user_id = self.rng.choice(staff)
+            plan_id = self.rng.choice(self.keys.plan_ids)
+            return (lambda: self.operations.register(gym_id, plan_id, staff_user_id)), None
+        if op == 'card_reissue':
+            picked = self.keys.pick_card(gym_id, reserve=True)
+            if picked is None:
+                return None
+            index, card_id, member_id = picked
+
+            def on_done(new_card_id):
+                self.keys.replace_card(gym_id, index, card_id, new_card_id)
+
+            return (lambda: self.operations.card_reissue(gym_id, card_id, member_id)), on_done
+        raise ValueError(f"Unknown operation: {op}")
+
+    async def run_one(self, op, call, on_done, scheduled_at, start):
+        """Run one request on the pool; latency counts from the scheduled arrival."""
+        loop = asyncio.get_running_loop()
+        offset = scheduled_at - start
+        error = None
+        value = None
+        try:
+            value = await loop.run_in_executor(self.executor, call)
+        except Exception as e:  # noqa: BLE001 - every failure is a data point
+            error = e
+        finally:
+            self.outstanding -= 1
+            if on_done is not None:
+                on_done(value)
+        self.recorder.completed(op, offset, time.perf_counter() - scheduled_at, error)
+
+    async def report_progress(self, start, duration):
+        """Print a progress line for each completed reporting window."""
+        interval = self.profile['report_interval_s']
+        while time.perf_counter() - start < duration:
+            await asyncio.sleep(interval)
+            elapsed = time.perf_counter() - start
+            window = self.recorder.windows.get(self.recorder.window(elapsed - interval), {})
+            latencies = [lat for bucket in window.values() for lat in bucket['latencies']]
+            errors = sum(bucket['errors'] for bucket in window.values())
+            stats = Recorder.summarize(latencies, errors, 0, interval)
+            print(f"  t={elapsed:6.1f}s  done/s={stats['throughput_per_s']:>7}  p50={stats['p50_ms']}ms  "
+                  f"p99={stats['p99_ms']}ms  errors={errors}  outstanding={self.outstanding}")
+
+    async def run(self):
+        """Generate arrivals for the profile duration, then drain outstanding requests."""
+        duration = self.profile['duration_s']
+        arrivals = ArrivalProcess(self.profile['rate_per_s'], self.profile['burstiness'],
+                                  self.profile['phases'], self.rng)
+        tasks = set()
+        start = time.perf_counter()
+        progress = asyncio.create_task(self.report_progress(start, duration))
+        next_at = start
+
+        while True:
+            next_at += arrivals.next_gap(next_at - start)
+            if next_at - start >= duration:
+                break
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            op = self.rng.choices(self.ops, weights=self.op_weights, k=1)[0]
+            self.recorder.arrival(op, next_at - start)
+            if self.outstanding >= self.profile['max_outstanding']:
+                self.recorder.dropped(op)
+                continue
+            built = self.build_call(op)
+            if built is None:
+                self.recorder.completed(op, next_at - start, 0.0, 'no key available')
+                continue
+            call, on_done = built
+            self.outstanding += 1
+            task = asyncio.create_task(self.run_one(op, call, on_done, next_at, start))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        if tasks:
+            await asyncio.gather(*tasks)
+        progress.cancel()
+        elapsed = time.perf_counter() - start
+        self.executor.shutdown(wait=True)
+        return elapsed
+
+
+def print_summary(profile, summary, elapsed_s):
+    """Print per-operation totals."""
+    print("\n" + "=" * 96)
+    print(f"Front-Desk Simulation Summary: {profile['name']} ({elapsed_s:.1f}s)")
+    print("=" * 96)
+    print(f"{'Operation':<14}{'Arrivals':>10}{'Done':>10}{'Err %':>8}{'Dropped':>9}{'Thru/s':>9}"
+          f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    for op in OPERATIONS:
+        if op not in summary:
+            continue
+        s = summary[op]
+        print(f"{op:<14}{s['arrivals']:>10}{s['completed']:>10}{s['error_rate'] * 100:>8.2f}{s['dropped']:>9}"
+              f"{str(s['throughput_per_s']):>9}{str(s['p50_ms']):>9}{str(s['p95_ms']):>9}{str(s['p99_ms']):>9}"
+              f"{str(s['max_ms']):>9}")
+        for message, count in s['top_errors'].items():
+            print(f"    {count:>6}x  {message}")
+    print("=" * 96)
+
+
+def main():
+    """Main execution function."""
+    args = parse_arguments()
+
+    try:
+        profile = load_profile(args.profile)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: Invalid workload profile: {e}")
+        sys.exit(1)
+    if args.duration is not None:
+        profile['duration_s'] = args.duration
+    if args.rate is not None:
+        profile['rate_per_s'] = args.rate
+
+    connect_kwargs = {
+        'host': args.host,
+        'port': args.port,
+        'user': args.user,
+        'password': args.password,
+        'database': args.database,
+    }
+
+    rng = random.Random(profile['seed'])
+    keys = KeyPool(rng)
+    try:
+        connection = mysql.connector.connect(**connect_kwargs)
+        cursor = connection.cursor()
+        keys.load(cursor, profile['gyms'], profile['gym_skew'], profile['key_sample'])
+        cursor.close()
+        connection.close()
+    except (Error, RuntimeError) as e:
+        print("ERROR: Failed to load keys from the seeded database")
+        print(f"Details: {e}")
+        sys.exit(1)
+
+    print("=" * 50)
+    print("FitDB Front-Desk Simulator")
+    print("=" * 50)
+    print(f"Profile:  {profile['name']}")
+    print(f"Duration: {profile['duration_s']}s @ {profile['rate_per_s']}/s base rate")
+    print(f"Mix:      {profile['mix']}")
+    print(f"Gyms:     {len(keys.gym_ids)} (skew {profile['gym_skew']})")
+    print(f"Cards:    {sum(len(c) for c in keys.cards_by_gym.values())}")
+    print()
+
+    simulator = Simulator(profile, Operations(connect_kwargs, keys), keys)
+    elapsed = asyncio.run(simulator.run())
+
+    summary = simulator.recorder.summary(elapsed)
+    print_summary(profile, summary, elapsed)
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'profile': profile,
+                'elapsed_s': round(elapsed, 3),
+                'summary': summary,
+                'timeseries': simulator.recorder.timeseries(),
+            }, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
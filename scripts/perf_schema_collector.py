@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+# (WIP)
+"""
+FitDB performance_schema Collector
+
+Attributes server-side cost to the triggers, stored procedures and views that
+make up FitDB. Trigger and procedure bodies run inside the parent INSERT/CALL,
+so their cost is invisible from the client; performance_schema records them as
+separate stored programs.
+
+The collector:
+  1. enables the statement/stage instruments and consumers it needs
+  2. snapshots the summary tables
+  3. runs a workload (a SQL file and/or a shell command)
+  4. snapshots again and reports the difference as a ranked hot-spot list
+  5. restores the instrument, consumer and object settings it changed
+
+Sources:
+  - triggers & procedures: events_statements_summary_by_program
+  - views:                 events_statements_summary_by_digest (digests that reference a vw_*)
+  - stages:                events_stages_summary_global_by_event_name
+
+performance_schema must be enabled at server start (performance_schema=ON in
+my.cnf); the instruments and consumers are switched on at runtime. The
+connecting user needs UPDATE on performance_schema setup tables.
+
+Usage:
+    python scripts/perf_schema_collector.py --sql sql/perf_workload.sql --repeat 50
+    python scripts/perf_schema_collector.py --command "make seed SEED_SIZE=small" --json /tmp/hotspots.json
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+try:
+    import mysql.connector
+    from mysql.connector import Error
+except ImportError:
+    print("ERROR: mysql-connector-python is not installed.")
+    print("Please run: pip install -r requirements.txt")
+    sys.exit(1)
+
+# Optional: support for .env files
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+# performance_schema timers are in picoseconds
+PICO_PER_MS = 1_000_000_000
+
+COMMENT_PATTERN = re.compile(r'(^|\s)--(\s.*)?$')
+VIEW_NAME_PATTERN = re.compile(r'`?(vw_\w+)`?', re.IGNORECASE)
+
+CONSUMERS = (
+    'events_statements_current',
+    'events_statements_history',
+    'events_statements_history_long',
+    'events_stages_current',
+    'events_stages_history_long',
+    'statements_digest',
+)
+
+PROGRAM_COLUMNS = (
+    'COUNT_STAR', 'SUM_TIMER_WAIT', 'COUNT_STATEMENTS', 'SUM_STATEMENTS_WAIT',
+    'SUM_ROWS_EXAMINED', 'SUM_ROWS_SENT', 'SUM_ROWS_AFFECTED',
+    'SUM_SELECT_SCAN', 'SUM_NO_INDEX_USED', 'SUM_LOCK_TIME',
+)
+
+# setup_objects rows (every object of these types in our schema) switched on for the run;
+# the '%' wildcard is passed as a parameter since the connector does not unescape '%%'
+OBJECT_TYPES = ('TRIGGER', 'PROCEDURE', 'FUNCTION', 'EVENT', 'TABLE')
+ALL_OBJECTS = '%'
+
+DIGEST_COLUMNS = (
+    'COUNT_STAR', 'SUM_TIMER_WAIT', 'SUM_ROWS_EXAMINED', 'SUM_ROWS_SENT',
+    'SUM_ROWS_AFFECTED', 'SUM_SELECT_SCAN', 'SUM_NO_INDEX_USED', 'SUM_LOCK_TIME',
+)
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Rank FitDB triggers, procedures and views by server-side cost',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Run a SQL workload 50 times and rank hot spots
+  python scripts/perf_schema_collector.py --sql sql/perf_workload.sql --repeat 50
+
+  # Profile an external workload (e.g. a seed load or the front-desk simulator)
+  python scripts/perf_schema_collector.py --command "make seed SEED_SIZE=small"
+
+Environment Variables:
+  DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME (same as init.py)
+        """
+    )
+
+    parser.add_argument('--host', default=os.getenv('DB_HOST', 'localhost'),
+                        help='Database host (default: localhost or DB_HOST env var)')
+    parser.add_argument('--port', type=int, default=int(os.getenv('DB_PORT', '3306')),
+                        help='Database port (default: 3306 or DB_PORT env var)')
+    parser.add_argument('--user', default=os.getenv('DB_USER', 'root'),
+                        help='Database user (default: root or DB_USER env var)')
+    parser.add_argument('--password', default=os.getenv('DB_PASSWORD', ''),
+                        help='Database password (default: empty or DB_PASSWORD env var)')
+    parser.add_argument('--database', default=os.getenv('DB_NAME', 'fitdb'),
+                        help='Database name (default: fitdb or DB_NAME env var)')
+    parser.add_argument('--sql', type=Path, default=None,
+                        help='SQL workload file to execute (no DELIMITER blocks)')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='Number of times to run the SQL workload (default: 1)')
+    parser.add_argument('--command', default=None,
+                        help='Shell command to run as the workload')
+    parser.add_argument('--top', type=int, default=25,
+                        help='Number of hot spots to print (default: 25)')
+    parser.add_argument('--json', type=Path, default=None,
+                        help='Write the full report to this JSON file')
+
+    return parser.parse_args()
+
+
+def save_instrumentation(cursor, database):
+    """Snapshot the setup rows enable_instrumentation() changes, for restore_instrumentation()."""
+    cursor.execute(
+        "SELECT NAME, ENABLED, TIMED FROM performance_schema.setup_instruments "
+        "WHERE NAME LIKE 'statement/%' OR NAME LIKE 'stage/%'"
+    )
+    instruments = cursor.fetchall()
+    placeholders = ', '.join(['%s'] * len(CONSUMERS))
+    cursor.execute(
+        f"SELECT NAME, ENABLED FROM performance_schema.setup_consumers WHERE NAME IN ({placeholders})",
+        CONSUMERS
+    )
+    consumers = cursor.fetchall()
+    cursor.execute(
+        "SELECT OBJECT_TYPE, ENABLED, TIMED FROM performance_schema.setup_objects "
+        "WHERE OBJECT_SCHEMA = %s AND OBJECT_NAME = %s",
+        (database, ALL_OBJECTS)
+    )
+    objects = {row[0]: row[1:] for row in cursor.fetchall()}
+    return {'instruments': instruments, 'consumers': consumers, 'objects': objects}
+
+
+def restore_instrumentation(cursor, database, saved):
+    """Put instruments, consumers and setup_objects back the way save_instrumentation() found them."""
+    cursor.executemany(
+        "UPDATE performance_schema.setup_instruments SET ENABLED = %s, TIMED = %s WHERE NAME = %s",
+        [(enabled, timed, name) for name, enabled, timed in saved['instruments']]
+    )
+    cursor.executemany(
+        "UPDATE performance_schema.setup_consumers SET ENABLED = %s WHERE NAME = %s",
+        [(enabled, name) for name, enabled in saved['consumers']]
+    )
+    for object_type in OBJECT_TYPES:
+        if object_type in saved['objects']:
+            enabled, timed = saved['objects'][object_type]
+            cursor.execute(
+                "UPDATE performance_schema.setup_objects SET ENABLED = %s, TIMED = %s "
+                "WHERE OBJECT_TYPE = %s AND OBJECT_SCHEMA = %s AND OBJECT_NAME = %s",
+                (enabled, timed, object_type, database, ALL_OBJECTS)
+            )
+        else:
+            cursor.execute(
+                "DELETE FROM performance_schema.setup_objects "
+                "WHERE OBJECT_TYPE = %s AND OBJECT_SCHEMA = %s AND OBJECT_NAME = %s",
+                (object_type, database, ALL_OBJECTS)
+            )
+
+
+def check_performance_schema(cursor):
+    """Fail early when performance_schema was not enabled at server start."""
+    cursor.execute("SELECT @@performance_schema")
+    if not cursor.fetchone()[0]:
+        raise RuntimeError("performance_schema is OFF; set performance_schema=ON in my.cnf and restart MySQL")
+
+
+def enable_instrumentation(cursor, database):
+    """Switch on the statement/stage instruments, consumers and stored-program objects."""
+
+    cursor.execute(
+        "UPDATE performance_schema.setup_instruments SET ENABLED = 'YES', TIMED = 'YES' "
+        "WHERE NAME LIKE 'statement/%' OR NAME LIKE 'stage/%'"
+    )
+    placeholders = ', '.join(['%s'] * len(CONSUMERS))
+    cursor.execute(
+        f"UPDATE performance_schema.setup_consumers SET ENABLED = 'YES' WHERE NAME IN ({placeholders})",
+        CONSUMERS
+    )
+    # make sure triggers, procedures and tables in our schema are instrumented
+    for object_type in OBJECT_TYPES:
+        cursor.execute(
+            "INSERT INTO performance_schema.setup_objects (OBJECT_TYPE, OBJECT_SCHEMA, OBJECT_NAME, ENABLED, TIMED) "
+            "VALUES (%s, %s, %s, 'YES', 'YES') "
+            "ON DUPLICATE KEY UPDATE ENABLED = 'YES', TIMED = 'YES'",
+            (object_type, database, ALL_OBJECTS)
+        )
+
+
+def snapshot_programs(cursor, database):
+    """Snapshot per-program (trigger/procedure/function/event) statement totals."""
+    columns = ', '.join(PROGRAM_COLUMNS)
+    cursor.execute(
+        f"SELECT OBJECT_TYPE, OBJECT_NAME, {columns} "
+        "FROM performance_schema.events_statements_summary_by_program "
+        "WHERE OBJECT_SCHEMA = %s",
+        (database,)
+    )
+    return {(row[0], row[1]): dict(zip(PROGRAM_COLUMNS, row[2:])) for row in cursor.fetchall()}
+
+
+def snapshot_digests(cursor, database):
+    """Snapshot statement digests that reference a view."""
+    columns = ', '.join(DIGEST_COLUMNS)
+    cursor.execute(
+        f"SELECT DIGEST, DIGEST_TEXT, {columns} "
+        "FROM performance_schema.events_statements_summary_by_digest "
+        "WHERE SCHEMA_NAME = %s AND DIGEST_TEXT LIKE '%%vw\\_%%'",
+        (database,)
+    )
+    return {row[0]: {'text': row[1], **dict(zip(DIGEST_COLUMNS, row[2:]))} for row in cursor.fetchall()}
+
+
+def snapshot_stages(cursor):
+    """Snapshot global stage totals."""
+    cursor.execute(
+        "SELECT EVENT_NAME, COUNT_STAR, SUM_TIMER_WAIT "
+        "FROM performance_schema.events_stages_summary_global_by_event_name "
+        "WHERE COUNT_STAR > 0"
+    )
+    return {row[0]: {'COUNT_STAR': row[1], 'SUM_TIMER_WAIT': row[2]} for row in cursor.fetchall()}
+
+
+def snapshot(cursor, database):
+    """Take one snapshot of every summary table we diff."""
+    return {
+        'programs': snapshot_programs(cursor, database),
+        'digests': snapshot_digests(cursor, database),
+        'stages': snapshot_stages(cursor),
+    }
+
+
+def diff_counters(before, after, columns):
+    """Subtract two counter dicts (missing 'before' entries count as zero)."""
+    return {col: int(after.get(col) or 0) - int((before or {}).get(col) or 0) for col in columns}
+
+
+def load_trigger_tables(cursor, database):
+    """Map trigger name -> 'TIMING EVENT ON TABLE' for context in the report."""
+    cursor.execute(
+        "SELECT TRIGGER_NAME, ACTION_TIMING, EVENT_MANIPULATION, EVENT_OBJECT_TABLE "
+        "FROM information_schema.TRIGGERS WHERE TRIGGER_SCHEMA = %s",
+        (database,)
+    )
+    return {row[0]: f"{row[1]} {row[2]} ON {row[3]}" for row in cursor.fetchall()}
+
+
+def build_hotspots(before, after, trigger_tables):
+    """Diff two snapshots into a list of hot spots ranked by total time."""
+    hotspots = []
+
+    for key, counters in after['programs'].items():
+        delta = diff_counters(before['programs'].get(key), counters, PROGRAM_COLUMNS)
+        if delta['COUNT_STAR'] <= 0:
+            continue
+        object_type, name = key
+        hotspots.append({
+            'type': object_type.lower(),
+            'name': name,
+            'context': trigger_tables.get(name, ''),
+            'calls': delta['COUNT_STAR'],
+            'total_ms': delta['SUM_TIMER_WAIT'] / PICO_PER_MS,
+            'statements': delta['COUNT_STATEMENTS'],
+            'rows_examined': delta['SUM_ROWS_EXAMINED'],
+            'rows_affected': delta['SUM_ROWS_AFFECTED'],
+            'full_scans': delta['SUM_SELECT_SCAN'],
+            'no_index_used': delta['SUM_NO_INDEX_USED'],
+        })
+
+    # views have no program entry; attribute each digest to every view it references
+    views = {}
+    for digest, counters in after['digests'].items():
+        delta = diff_counters(before['digests'].get(digest), counters, DIGEST_COLUMNS)
+        if delta['COUNT_STAR'] <= 0:
+            continue
+        for view_name in set(name.lower() for name in VIEW_NAME_PATTERN.findall(counters['text'] or '')):
+            view = views.setdefault(view_name, {
+                'type': 'view',
+                'name': view_name,
+                'context': '',
+                'calls': 0,
+                'total_ms': 0.0,
+                'statements': 0,
+                'rows_examined': 0,
+                'rows_affected': 0,
+                'full_scans': 0,
+                'no_index_used': 0,
+            })
+            view['calls'] += delta['COUNT_STAR']
+            view['total_ms'] += delta['SUM_TIMER_WAIT'] / PICO_PER_MS
+            view['statements'] += delta['COUNT_STAR']
+            view['rows_examined'] += delta['SUM_ROWS_EXAMINED']
+            view['rows_affected'] += delta['SUM_ROWS_AFFECTED']
+            view['full_scans'] += delta['SUM_SELECT_SCAN']
+            view['no_index_used'] += delta['SUM_NO_INDEX_USED']
+    hotspots.extend(views.values())
+
+    for spot in hotspots:
+        spot['total_ms'] = round(spot['total_ms'], 3)
+        spot['avg_us'] = round(spot['total_ms'] * 1000 / spot['calls'], 1)
+        spot['rows_examined_per_call'] = round(spot['rows_examined'] / spot['calls'], 1)
+
+    hotspots.sort(key=lambda spot: spot['total_ms'], reverse=True)
+    return hotspots
+
+
+def build_stages(before, after):
+    """Diff stage totals, ranked by time."""
+    stages = []
+    for name, counters in after['stages'].items():
+        delta = diff_counters(before['stages'].get(name), counters, ('COUNT_STAR', 'SUM_TIMER_WAIT'))
+        if delta['COUNT_STAR'] <= 0:
+            continue
+        stages.append({
+            'stage': name,
+            'count': delta['COUNT_STAR'],
+            'total_ms': round(delta['SUM_TIMER_WAIT'] / PICO_PER_MS, 3),
+        })
+    stages.sort(key=lambda stage: stage['total_ms'], reverse=True)
+    return stages
+
+
+def split_statements(sql_text):
+    """Split a DELIMITER-free SQL script into statements, dropping `--` comments."""
+    lines = [COMMENT_PATTERN.sub('', line) for line in sql_text.splitlines()]
+    return [statement.strip() for statement in '\n'.join(lines).split(';') if statement.strip()]
+
+
+def drain_results(cursor):
+    """Read every result set of the last statement (a CALL returns its SELECTs plus a status result)."""
+    while True:
+        if cursor.with_rows:
+            cursor.fetchall()
+        if not cursor.nextset():
+            break
+
+
+def run_sql_workload(connection, statements, repeat):
+    """Run a list of statements `repeat` times on the given connection."""
+    cursor = connection.cursor()
+    for _ in range(repeat):
+        for statement in statements:
+            cursor.execute(statement)
+            drain_results(cursor)
+        connection.commit()
+    cursor.close()
+
+
+def print_report(hotspots, stages, wall_s, top):
+    """Print the ranked hot-spot report."""
+    print("\n" + "=" * 110)
+    print(f"FitDB Hot Spots (workload wall time: {wall_s}s)")
+    print("=" * 110)
+    print(f"{'#':>3}  {'Type':<10}{'Name':<38}{'Calls':>9}{'Total ms':>12}{'Avg us':>10}"
+          f"{'Rows ex/call':>14}{'Scans':>8}{'NoIdx':>7}")
+    for rank, spot in enumerate(hotspots[:top], start=1):
+        print(f"{rank:>3}  {spot['type']:<10}{spot['name'][:37]:<38}{spot['calls']:>9}{spot['total_ms']:>12}"
+              f"{spot['avg_us']:>10}{spot['rows_examined_per_call']:>14}{spot['full_scans']:>8}{spot['no_index_used']:>7}")
+        if spot['context']:
+            print(f"     {'':<10}{spot['context']}")
+
+    if stages:
+        print("\nTop stages:")
+        for stage in stages[:10]:
+            print(f"  {stage['total_ms']:>12} ms  {stage['count']:>9}x  {stage['stage']}")
+    print("=" * 110)
+
+
+def main():
+    """Main execution function."""
+    args = parse_arguments()
+
+    if not args.sql and not args.command:
+        print("ERROR: provide a workload with --sql and/or --command")
+        sys.exit(1)
+
+    statements = []
+    if args.sql:
+        if not args.sql.exists():
+            print(f"ERROR: workload file {args.sql} not found")
+            sys.exit(1)
+        statements = split_statements(args.sql.read_text(encoding='utf-8'))
+
+    try:
+        connection = mysql.connector.connect(
+            host=args.host,
+            port=args.port,
+            user=args.user,
+            password=args.password,
+            database=args.database
+        )
+        cursor = connection.cursor()
+        check_performance_schema(cursor)
+        saved = save_instrumentation(cursor, args.database)
+    except (Error, RuntimeError) as e:
+        print("ERROR: Failed to prepare performance_schema")
+        print(f"Details: {e}")
+        sys.exit(1)
+
+    # the setup tables are server-wide: always switch back what we switched on
+    try:
+        try:
+            enable_instrumentation(cursor, args.database)
+            connection.commit()
+            trigger_tables = load_trigger_tables(cursor, args.database)
+            before = snapshot(cursor, args.database)
+        except Error as e:
+            print("ERROR: Failed to prepare performance_schema")
+            print(f"Details: {e}")
+            sys.exit(1)
+
+        wall_start = time.perf_counter()
+        try:
+            if statements:
+                print(f"Running {args.sql} x{args.repeat}...")
+                run_sql_workload(connection, statements, args.repeat)
+            if args.command:
+                print(f"Running: {args.command}")
+                subprocess.run(args.command, shell=True, check=True)
+        except (Error, subprocess.CalledProcessError) as e:
+            print("ERROR: Workload failed")
+            print(f"Details: {e}")
+            sys.exit(1)
+        wall_s = round(time.perf_counter() - wall_start, 3)
+
+        after = snapshot(cursor, args.database)
+    finally:
+        try:
+            connection.rollback()
+            restore_instrumentation(cursor, args.database, saved)
+            connection.commit()
+        except Error as e:
+            print(f"WARNING: Failed to restore performance_schema settings: {e}")
+        cursor.close()
+        connection.close()
+
+    hotspots = build_hotspots(before, after, trigger_tables)
+    stages = build_stages(before, after)
+    print_report(hotspots, stages, wall_s, args.top)
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'workload_wall_s': wall_s, 'hotspots': hotspots, 'stages': stages}, f, indent=2)
+        print(f"Report written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# (WIP)
+"""
+FitDB Bulk Copy Profiler
+
+Runs sql/bulkcopy.sql statement by statement through mysql-connector and
+records wall time, rows loaded and rows/sec for every LOAD DATA table load.
+Results can be merged into the metrics JSON written by
+`generate_seed.py --metrics-json` so generation and load phases can be compared
+side by side.
+
+CPU time and peak RSS are only reported for the client process; the server-side
+cost of a load shows up as wall time.
+
+Must be run from the project root (bulkcopy.sql uses paths relative to it).
+
+Usage:
+    python scripts/profile_bulkcopy.py --user root --password secret
+    python scripts/profile_bulkcopy.py --metrics-json /tmp/fitdb_seed_metrics.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+try:
+    import mysql.connector
+    from mysql.connector import Error
+except ImportError:
+    print("ERROR: mysql-connector-python is not installed.")
+    print("Please run: pip install -r requirements.txt")
+    sys.exit(1)
+
+# Optional: support for .env files
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+COMMENT_PATTERN = re.compile(r'(^|\s)--(\s.*)?$')
+LOAD_TABLE_PATTERN = re.compile(r'^\s*LOAD\s+DATA\b.*?\bINTO\s+TABLE\s+`?(\w+)`?', re.IGNORECASE | re.DOTALL)
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Profile each table load in bulkcopy.sql',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Load and print per-table timings
+  python scripts/profile_bulkcopy.py --user root --password secret
+
+  # Merge results into the generator's metrics file
+  python scripts/profile_bulkcopy.py --metrics-json /tmp/fitdb_seed_metrics.json
+        """
+    )
+
+    parser.add_argument('--host', default=os.getenv('DB_HOST', 'localhost'),
+                        help='Database host (default: localhost or DB_HOST env var)')
+    parser.add_argument('--port', type=int, default=int(os.getenv('DB_PORT', '3306')),
+                        help='Database port (default: 3306 or DB_PORT env var)')
+    parser.add_argument('--user', default=os.getenv('DB_USER', 'root'),
+                        help='Database user (default: root or DB_USER env var)')
+    parser.add_argument('--password', default=os.getenv('DB_PASSWORD', ''),
+                        help='Database password (default: empty or DB_PASSWORD env var)')
+    parser.add_argument('--database', default=os.getenv('DB_NAME', 'fitdb'),
+                        help='Database name (default: fitdb or DB_NAME env var)')
+    parser.add_argument('--sql', type=Path, default=Path('sql/bulkcopy.sql'),
+                        help='Bulk copy script to run (default: sql/bulkcopy.sql)')
+    parser.add_argument('--metrics-json', type=Path, default=None,
+                        help='Merge load metrics into this JSON file (created if missing)')
+
+    return parser.parse_args()
+
+
+def split_statements(sql_text):
+    """Split a DELIMITER-free SQL script into statements, dropping `--` comments."""
+    lines = [COMMENT_PATTERN.sub('', line) for line in sql_text.splitlines()]
+    statements = []
+    for statement in '\n'.join(lines).split(';'):
+        statement = statement.strip()
+        if statement:
+            statements.append(statement)
+    return statements
+
+
+def run_bulkcopy(connection, statements):
+    """Execute statements in order, timing each LOAD DATA; returns per-table metrics."""
+    cursor = connection.cursor()
+    loads = []
+
+    for statement in statements:
+        match = LOAD_TABLE_PATTERN.match(statement)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        cursor.execute(statement)
+        if cursor.with_rows:
+            cursor.fetchall()
+        if not match:
+            continue
+        wall_s = time.perf_counter() - wall_start
+        rows = max(cursor.rowcount, 0)
+        loads.append({
+            'phase': f"load {match.group(1)}",
+            'table': match.group(1),
+            'wall_s': round(wall_s, 4),
+            'cpu_s': round(time.process_time() - cpu_start, 4),
+            'rows': rows,
+            'rows_per_s': round(rows / wall_s, 1) if wall_s > 0 else None,
+            'warnings': cursor.warning_count,
+        })
+
+    cursor.close()
+    return loads
+
+
+def print_report(loads, total_wall_s):
+    """Print per-table load metrics."""
+    print("\n" + "=" * 70)
+    print("Bulk Copy Profile")
+    print("=" * 70)
+    print(f"{'Table':<30}{'Wall (s)':>10}{'Rows':>10}{'Rows/s':>12}{'Warnings':>8}")
+    for load in loads:
+        rows_per_s = load['rows_per_s'] if load['rows_per_s'] is not None else '-'
+        print(f"{load['table']:<30}{load['wall_s']:>10}{load['rows']:>10}{rows_per_s:>12}{load['warnings']:>8}")
+    print(f"\nTotal wall time (including COMMIT and summary): {total_wall_s}s")
+    print("=" * 70)
+
+
+def main():
+    """Main execution function."""
+    args = parse_arguments()
+
+    if not args.sql.exists():
+        print(f"ERROR: {args.sql} not found (run from the project root)")
+        sys.exit(1)
+
+    statements = split_statements(args.sql.read_text(encoding='utf-8'))
+
+    try:
+        connection = mysql.connector.connect(
+            host=args.host,
+            port=args.port,
+            user=args.user,
+            password=args.password,
+            database=args.database,
+            allow_local_infile=True
+        )
+    except Error as e:
+        print("ERROR: Failed to connect to MySQL Server")
+        print(f"Details: {e}")
+        sys.exit(1)
+
+    total_start = time.perf_counter()
+    try:
+        loads = run_bulkcopy(connection, statements)
+    except Error as e:
+        print("ERROR: Bulk copy failed")
+        print(f"Details: {e}")
+        connection.close()
+        sys.exit(1)
+    total_wall_s = round(time.perf_counter() - total_start, 4)
+    connection.close()
+
+    print_report(loads, total_wall_s)
+
+    if args.metrics_json:
+        metrics = {}
+        if args.metrics_json.exists():
+            with open(args.metrics_json, 'r', encoding='utf-8') as f:
+                metrics = json.load(f)
+        metrics['bulkcopy'] = {'total_wall_s': total_wall_s, 'phases': loads}
+        args.metrics_json.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.metrics_json, 'w', encoding='utf-8') as f:
+            json.dump(metrics, f, indent=2)
+        print(f"Metrics written to {args.metrics_json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -50,6 +50,12 @@ SOURCE ./helpers/08_views.sql;
 -- 0.4.9 stored procedures
 SOURCE ./helpers/09_procedures.sql;
 
+-- 0.4.10 partition maintenance (CHECK_IN archive tables, procedures, initial partitions)
+SOURCE ./helpers/10_partitions.sql;
+
+-- 0.4.11 scheduled events (partition maintenance, trial expiry, equipment due refresh)
+SOURCE ./helpers/11_events.sql;
+
 -- 0.5 Role grants
 -- 0.5.1 grant admin user full privileges
 GRANT ALL PRIVILEGES ON `fitdb`.* TO 'fitdb_admin'@'%';
@@ -71,6 +77,8 @@ GRANT SELECT ON `fitdb`.vw_member_checkin_history     TO r_member, r_front_desk,
 GRANT SELECT ON `fitdb`.vw_front_desk_staff           TO r_manager, r_admin_gym;
 GRANT SELECT ON `fitdb`.vw_membership_plan_details    TO r_manager, r_admin_gym;
 GRANT SELECT ON `fitdb`.vw_gym_access_permissions     TO r_manager, r_admin_gym;
+GRANT SELECT ON `fitdb`.vw_cleaning_due               TO r_floor_manager, r_manager, r_admin_gym;
+GRANT SELECT ON `fitdb`.vw_service_due                TO r_floor_manager, r_manager, r_admin_gym;
 
 -- Post-MVP: Session/booking views (not yet implemented)
 -- GRANT SELECT ON `fitdb`.vw_sessions_open            TO r_member;
@@ -85,8 +93,6 @@ GRANT SELECT ON `fitdb`.vw_gym_access_permissions     TO r_manager, r_admin_gym;
 
 -- Post-MVP: Equipment management views (not yet implemented)
 -- GRANT SELECT ON `fitdb`.vw_equipment_status         TO r_floor_manager, r_manager;
--- GRANT SELECT ON `fitdb`.vw_cleaning_due             TO r_floor_manager;
--- GRANT SELECT ON `fitdb`.vw_service_due              TO r_floor_manager;
 -- GRANT SELECT ON `fitdb`.vw_equipment_demand         TO r_manager, r_admin_gym;
 
 -- Post-MVP: Front desk views (not yet implemented)
@@ -98,6 +104,10 @@ GRANT SELECT ON `fitdb`.vw_gym_access_permissions     TO r_manager, r_admin_gym;
 GRANT EXECUTE ON PROCEDURE `fitdb`.sp_create_user_account              TO r_member;  -- self-registration
 GRANT EXECUTE ON PROCEDURE `fitdb`.sp_front_desk_create_user_account   TO r_front_desk, r_manager, r_admin_gym;
 GRANT EXECUTE ON PROCEDURE `fitdb`.sp_get_user_account_info            TO r_member, r_front_desk, r_manager, r_admin_gym;
+GRANT EXECUTE ON PROCEDURE `fitdb`.sp_log_equipment_service            TO r_floor_manager, r_manager, r_admin_gym;
+GRANT EXECUTE ON PROCEDURE `fitdb`.sp_flush_equipment_usage            TO r_floor_manager, r_admin_gym;  -- usage ingestion
+GRANT EXECUTE ON PROCEDURE `fitdb`.sp_refresh_equipment_due            TO r_floor_manager, r_admin_gym;
+GRANT INSERT ON `fitdb`.EQUIPMENT_USAGE_STAGE                          TO r_floor_manager;  -- staged before the flush
 
 -- Post-MVP: Booking procedures (not yet implemented)
 -- GRANT EXECUTE ON PROCEDURE `fitdb`.sp_book_session        TO r_plus_member;
@@ -124,7 +134,6 @@ GRANT EXECUTE ON PROCEDURE `fitdb`.sp_get_user_account_info            TO r_memb
 -- GRANT EXECUTE ON PROCEDURE `fitdb`.sp_access_card_revoke  TO r_front_desk, r_manager, r_admin_gym;
 
 -- Post-MVP: Equipment management procedures (not yet implemented)
--- GRANT EXECUTE ON PROCEDURE `fitdb`.sp_log_equipment_service TO r_floor_manager, r_manager, r_admin_gym;
 -- GRANT EXECUTE ON PROCEDURE `fitdb`.sp_snapshot_inventory    TO r_floor_manager, r_manager, r_admin_gym;
 
 -- 0.5.6 admin roles
@@ -134,12 +134,14 @@ INTO TABLE EQUIPMENT_ITEM
 FIELDS TERMINATED BY ',' 
 OPTIONALLY ENCLOSED BY '"'
 LINES TERMINATED BY '\n'
-(id, gym_id, equip_kind_id, status_id, @serial_no, uses_count, rated_uses, 
- @last_serviced_at, last_cleaned_at, cleaning_interval_uses, cleaning_interval_days,
- next_clean_due_at, service_required, cleaning_required, created_at, updated_at)
+(id, gym_id, equip_kind_id, status_id, @serial_no, uses_count, uses_since_clean, uses_since_service,
+ rated_uses, @last_serviced_at, @last_cleaned_at, cleaning_interval_uses, cleaning_interval_days,
+ @next_clean_due_at, service_required, cleaning_required, created_at, updated_at)
 SET 
   serial_no = NULLIF(@serial_no, ''),
-  last_serviced_at = NULLIF(@last_serviced_at, '');
+  last_serviced_at = NULLIF(@last_serviced_at, ''),
+  last_cleaned_at = NULLIF(@last_cleaned_at, ''),
+  next_clean_due_at = NULLIF(@next_clean_due_at, '');
 
 -- 14. Load INVENTORY_COUNT data
 LOAD DATA LOCAL INFILE 'data/csvs/inventory_count.csv'
@@ -235,6 +237,10 @@ SET UNIQUE_CHECKS = 1;
 SET AUTOCOMMIT = 1;
 SET @DISABLE_AUTO_TRIGGERS = 0;
 
+-- Materialize any trial that expired between generation and load (normally done by ev_expire_trials)
+CALL sp_expire_trials(10000, @expired_trials);
+SELECT @expired_trials AS ExpiredTrials;
+
 -- Display summary of loaded data
 SELECT 'Data loading complete!' AS Status;
 
@@ -20,7 +20,8 @@ CREATE TABLE BOOKING_STATUS_IND LIKE ACCOUNT_STATUS_IND;
 
 -- 2.4 status values inserted
 INSERT IGNORE INTO ACCOUNT_STATUS_IND(code,label) VALUES
- ('ACTIVE','Active'),('INACTIVE','Inactive'),('LOCKED','Locked'),('SUSPENDED','Suspended'),('CANCELED','Canceled');
+ ('ACTIVE','Active'),('INACTIVE','Inactive'),('LOCKED','Locked'),('SUSPENDED','Suspended'),('CANCELED','Canceled'),
+ ('EXPIRED','Expired trial');  -- set by sp_expire_trials (materialized so member status filters can use an index)
 INSERT IGNORE INTO GYM_STATUS_IND(code,label) VALUES ('ACTIVE','Active'),('INACTIVE','Inactive');
 INSERT IGNORE INTO EQUIPMENT_STATUS_IND(code,label) VALUES ('OK','Ok'),('NEEDS_SERVICE','Needs service'),('OUT_OF_ORDER','Out of order'),('RETIRED','Retired');
 INSERT IGNORE INTO SESSION_STATUS_IND(code,label) VALUES ('SCHEDULED','Scheduled'),('CANCELED','Canceled'),('COMPLETED','Completed');
@@ -121,7 +121,9 @@ CREATE TABLE EQUIPMENT_ITEM (
   status_id BIGINT NOT NULL,
   serial_no VARCHAR(255) NULL,
   uses_count INT NOT NULL DEFAULT 0,
-  rated_uses INT NOT NULL DEFAULT 10000,
+  uses_since_clean INT NOT NULL DEFAULT 0,    -- reset by a 'clean' service log entry
+  uses_since_service INT NOT NULL DEFAULT 0,  -- reset by a 'repair'/'replace' service log entry
+  rated_uses INT NOT NULL DEFAULT 10000,      -- uses between services
   last_serviced_at DATETIME(6) NULL,
   last_cleaned_at DATETIME(6) NULL,
   cleaning_interval_uses INT NOT NULL DEFAULT 1000,
@@ -134,7 +136,22 @@ CREATE TABLE EQUIPMENT_ITEM (
   CONSTRAINT fk_eitem_gym   FOREIGN KEY (gym_id) REFERENCES GYM(id),
   CONSTRAINT fk_eitem_kind  FOREIGN KEY (equip_kind_id) REFERENCES EQUIP_KIND(id),
   CONSTRAINT fk_eitem_stat  FOREIGN KEY (status_id) REFERENCES EQUIPMENT_STATUS_IND(id),
-  UNIQUE KEY uk_eitem_serial_per_gym (gym_id, serial_no)
+  UNIQUE KEY uk_eitem_serial_per_gym (gym_id, serial_no),
+  CHECK (uses_count >= 0 AND uses_since_clean >= 0 AND uses_since_service >= 0)
+) ENGINE=InnoDB;
+
+-- 3.3.3.1 equipment usage staging table
+-- usage is coalesced by scripts/equipment_usage.py and staged here (one row per item per flush batch);
+-- sp_flush_equipment_usage applies a batch to EQUIPMENT_ITEM set-wise, so each machine row is updated
+-- (and audited) once per flush instead of once per use
+CREATE TABLE EQUIPMENT_USAGE_STAGE (
+  batch_id BIGINT NOT NULL,
+  equipment_item_id BIGINT NOT NULL,
+  uses INT NOT NULL,
+  last_used_at DATETIME(6) NOT NULL,
+  created_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+  PRIMARY KEY (batch_id, equipment_item_id),
+  CHECK (uses > 0)
 ) ENGINE=InnoDB;
 
 -- 3.3.4 inventory count table
@@ -298,8 +315,12 @@ CREATE TABLE ACCESS_CARD (
 ) ENGINE=InnoDB;
 
 -- 3.5.5 check in table
+-- range-partitioned by month on checked_in_at (the fastest-growing table; most reads touch recent days)
+-- partitioned tables cannot have foreign keys, so references are checked in trg_checkin_validation
+-- and checked_in_at is part of the primary key (every unique key must include the partition column)
+-- monthly partitions are created/archived by sp_checkin_partition_maintenance (see 10_partitions.sql, scheduled in 11_events.sql)
 CREATE TABLE CHECK_IN (
-  id BIGINT PRIMARY KEY AUTO_INCREMENT,
+  id BIGINT NOT NULL AUTO_INCREMENT,
   member_id BIGINT NOT NULL,
   gym_id BIGINT NOT NULL,
   access_card_id BIGINT NULL,
@@ -307,7 +328,10 @@ CREATE TABLE CHECK_IN (
   method ENUM('scan','manual') NOT NULL,
   created_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
   updated_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
-  CONSTRAINT fk_checkin_member FOREIGN KEY (member_id) REFERENCES MEMBER(id),
-  CONSTRAINT fk_checkin_gym    FOREIGN KEY (gym_id)    REFERENCES GYM(id),
-  CONSTRAINT fk_checkin_card   FOREIGN KEY (access_card_id) REFERENCES ACCESS_CARD(id)
-) ENGINE=InnoDB;
\ No newline at end of file
+  PRIMARY KEY (id, checked_in_at)
+) ENGINE=InnoDB
+PARTITION BY RANGE COLUMNS (checked_in_at) (
+  -- monthly partitions are split off this catch-all at build time (10_partitions.sql)
+  PARTITION p_future VALUES LESS THAN (MAXVALUE)
+);
+
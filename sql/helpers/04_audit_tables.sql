@@ -318,7 +318,7 @@ CREATE TABLE CHECK_IN_AUD (
   updated_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
   KEY k_ckinaud_entity_seq (base_entity_id, seq_no),
   KEY k_ckinaud_actor_seq (actor_user_id, seq_no),
-  CONSTRAINT fk_ckinaud_checkin FOREIGN KEY (base_entity_id) REFERENCES CHECK_IN(id),
+  -- no FK to CHECK_IN: partitioned tables cannot be referenced by foreign keys
   CONSTRAINT fk_ckinaud_actor FOREIGN KEY (actor_user_id) REFERENCES USER(id)
 ) ENGINE=InnoDB;
 
@@ -129,6 +129,16 @@ BEGIN
     DECLARE v_member_plan_tier VARCHAR(32);
     DECLARE v_member_home_gym_id BIGINT;
     
+    -- CHECK_IN is partitioned and cannot carry foreign keys, so enforce member/gym references here
+    -- (the access card reference is enforced by the card ownership check below)
+    IF NOT EXISTS (SELECT 1 FROM MEMBER WHERE id = NEW.member_id) THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Check-in member does not exist';
+    END IF;
+    
+    IF NOT EXISTS (SELECT 1 FROM GYM WHERE id = NEW.gym_id) THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Check-in gym does not exist';
+    END IF;
+    
     -- if access card is provided, validate its status
     IF NEW.access_card_id IS NOT NULL THEN
         SELECT acsi.code INTO v_card_status_code
@@ -172,6 +182,59 @@ BEGIN
     END IF;
 END$$
 
+-- 5.6.1 check-in reference update
+-- keeps member/gym/card references valid when an existing check-in is edited (no FKs on CHECK_IN)
+CREATE TRIGGER trg_checkin_reference_update
+BEFORE UPDATE ON CHECK_IN
+FOR EACH ROW
+BEGIN
+    IF NEW.member_id != OLD.member_id AND NOT EXISTS (SELECT 1 FROM MEMBER WHERE id = NEW.member_id) THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Check-in member does not exist';
+    END IF;
+    
+    IF NEW.gym_id != OLD.gym_id AND NOT EXISTS (SELECT 1 FROM GYM WHERE id = NEW.gym_id) THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Check-in gym does not exist';
+    END IF;
+    
+    IF NEW.access_card_id IS NOT NULL AND NOT (NEW.access_card_id <=> OLD.access_card_id)
+       AND NOT EXISTS (SELECT 1 FROM ACCESS_CARD WHERE id = NEW.access_card_id) THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Check-in access card does not exist';
+    END IF;
+END$$
+
+-- 5.6.2 check-in reference delete guards
+-- CHECK_IN has no FKs (partitioned), so these replace their ON DELETE RESTRICT: members, gyms and cards
+-- with check-ins (live or archived) cannot be deleted; each lookup is a ref on a CHECK_IN index
+CREATE TRIGGER trg_member_checkin_deletion_guard
+BEFORE DELETE ON MEMBER
+FOR EACH ROW
+BEGIN
+    IF EXISTS (SELECT 1 FROM CHECK_IN WHERE member_id = OLD.id)
+       OR EXISTS (SELECT 1 FROM CHECK_IN_ARCHIVE WHERE member_id = OLD.id) THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Cannot delete member with check-in history';
+    END IF;
+END$$
+
+CREATE TRIGGER trg_gym_checkin_deletion_guard
+BEFORE DELETE ON GYM
+FOR EACH ROW
+BEGIN
+    IF EXISTS (SELECT 1 FROM CHECK_IN WHERE gym_id = OLD.id)
+       OR EXISTS (SELECT 1 FROM CHECK_IN_ARCHIVE WHERE gym_id = OLD.id) THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Cannot delete gym with check-in history';
+    END IF;
+END$$
+
+CREATE TRIGGER trg_access_card_checkin_deletion_guard
+BEFORE DELETE ON ACCESS_CARD
+FOR EACH ROW
+BEGIN
+    IF EXISTS (SELECT 1 FROM CHECK_IN WHERE access_card_id = OLD.id)
+       OR EXISTS (SELECT 1 FROM CHECK_IN_ARCHIVE WHERE access_card_id = OLD.id) THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Cannot delete access card with check-in history';
+    END IF;
+END$$
+
 -- 5.7 user login update
 -- maintains last login timestamp consistency
 CREATE TRIGGER trg_user_login_update
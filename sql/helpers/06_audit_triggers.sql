@@ -699,6 +699,8 @@ BEGIN
       'status_id', NEW.status_id,
       'serial_no', NEW.serial_no,
       'uses_count', NEW.uses_count,
+      'uses_since_clean', NEW.uses_since_clean,
+      'uses_since_service', NEW.uses_since_service,
       'rated_uses', NEW.rated_uses,
       'last_serviced_at', NEW.last_serviced_at,
       'last_cleaned_at', NEW.last_cleaned_at,
@@ -726,6 +728,8 @@ BEGIN
       'status_id', NEW.status_id,
       'serial_no', NEW.serial_no,
       'uses_count', NEW.uses_count,
+      'uses_since_clean', NEW.uses_since_clean,
+      'uses_since_service', NEW.uses_since_service,
       'rated_uses', NEW.rated_uses,
       'last_serviced_at', NEW.last_serviced_at,
       'last_cleaned_at', NEW.last_cleaned_at,
@@ -753,6 +757,8 @@ BEGIN
       'status_id', OLD.status_id,
       'serial_no', OLD.serial_no,
       'uses_count', OLD.uses_count,
+      'uses_since_clean', OLD.uses_since_clean,
+      'uses_since_service', OLD.uses_since_service,
       'rated_uses', OLD.rated_uses,
       'last_serviced_at', OLD.last_serviced_at,
       'last_cleaned_at', OLD.last_cleaned_at,
@@ -6,22 +6,36 @@ CREATE INDEX idx_user_last_login    ON USER(last_login_at);
 CREATE INDEX idx_user_login_status  ON USER(last_login_at, status_id);
 CREATE INDEX idx_staff_gym_status   ON STAFF(gym_id, status_id);
 
--- The following indexes (equipment, sessions, bookings, etc) are planned for post-MVP implementation.
--- They are commented out for now.
+-- 7.1.1 members (status filters in the member views; sp_expire_trials finds ACTIVE trials past expiry)
+CREATE INDEX idx_member_status_trial ON MEMBER(status_id, trial_expires_on);
 
- /*
 -- 7.2 equipment
-CREATE INDEX idx_eitem_gym_kind   ON EQUIPMENT_ITEM(gym_id, equip_kind_id);
-CREATE INDEX idx_eitem_status     ON EQUIPMENT_ITEM(status_id);
+-- "needs cleaning now" is next_clean_due_at <= NOW() (usage-triggered cleanings set it to the flush time),
+-- so vw_cleaning_due and sp_refresh_equipment_due are range scans on idx_eitem_clean_due
+CREATE INDEX idx_eitem_gym_kind    ON EQUIPMENT_ITEM(gym_id, equip_kind_id);
+CREATE INDEX idx_eitem_status      ON EQUIPMENT_ITEM(status_id);
+CREATE INDEX idx_eitem_clean_due   ON EQUIPMENT_ITEM(next_clean_due_at);
+CREATE INDEX idx_eitem_service_due ON EQUIPMENT_ITEM(service_required, gym_id);
 
 -- 7.3 sessions & availability
+-- scripts/assign_trainers.py loads a whole window across gyms (starts_at / for_date ranges);
+-- per-trainer availability lookups use uk_tavail_trainer_date_period
 CREATE INDEX idx_csession_gym_starts ON CLASS_SESSION(gym_id, starts_at);
+CREATE INDEX idx_csession_starts     ON CLASS_SESSION(starts_at);
 CREATE INDEX idx_csession_state_open ON CLASS_SESSION(status_id, open_for_booking);
-CREATE INDEX idx_tavail_tr_date      ON TRAINER_AVAIL_DATE(trainer_id, for_date, period);
+CREATE INDEX idx_tavail_date_gym     ON TRAINER_AVAIL_DATE(for_date, gym_id, period);
 
--- 7.4 bookings & checking in
-CREATE INDEX idx_booking_member_time ON BOOKING(member_id, booked_at);
-CREATE INDEX idx_booking_status      ON BOOKING(status_id);
+-- 7.5 check-ins (partitioned; indexes are local to each monthly partition, so they stay
+-- month-sized and recent-history lookups only touch the partitions in range)
 CREATE INDEX idx_checkin_member_time ON CHECK_IN(member_id, checked_in_at);
 CREATE INDEX idx_checkin_gym_time    ON CHECK_IN(gym_id, checked_in_at);
+CREATE INDEX idx_checkin_card        ON CHECK_IN(access_card_id);
+
+-- The following indexes (bookings, etc) are planned for post-MVP implementation.
+-- They are commented out for now.
+
+ /*
+-- 7.4 bookings (check-in indexes are enabled in 7.5)
+CREATE INDEX idx_booking_member_time ON BOOKING(member_id, booked_at);
+CREATE INDEX idx_booking_status      ON BOOKING(status_id);
 */
@@ -42,11 +42,8 @@ SELECT
     acsi.code as card_status,
     acsi.label as card_status_label,
     -- computed fields
-    CASE 
-        WHEN mp.tier = 'trial' AND m.trial_expires_on < CURDATE() THEN 'EXPIRED'
-        WHEN mp.tier = 'trial' AND m.trial_expires_on >= CURDATE() THEN 'ACTIVE'
-        ELSE msi.code
-    END as effective_member_status,
+    -- expired trials are stored as EXPIRED by sp_expire_trials, so the status column is already effective
+    msi.code as effective_member_status,
     CASE 
         WHEN mp.tier = 'trial' THEN DATEDIFF(m.trial_expires_on, CURDATE())
         ELSE NULL
@@ -82,11 +79,7 @@ SELECT
     ac.issued_at,
     ac.revoked_at,
     acsi.code as card_status,
-    CASE 
-        WHEN mp.tier = 'trial' AND m.trial_expires_on < CURDATE() THEN 'EXPIRED'
-        WHEN mp.tier = 'trial' AND m.trial_expires_on >= CURDATE() THEN 'ACTIVE'
-        ELSE msi.code
-    END as effective_status
+    msi.code as effective_status
 FROM MEMBER m
 JOIN USER u ON m.user_id = u.id
 JOIN ACCOUNT_STATUS_IND msi ON m.status_id = msi.id
@@ -94,7 +87,9 @@ JOIN MEMBERSHIP_PLAN mp ON m.membership_plan_id = mp.id
 LEFT JOIN GYM g ON m.home_gym_id = g.id
 LEFT JOIN ACCESS_CARD ac ON m.id = ac.member_id
 LEFT JOIN ACCESS_CARD_STATUS_IND acsi ON ac.status_id = acsi.id
-WHERE msi.code = 'ACTIVE' AND u.status_id = (SELECT id FROM ACCOUNT_STATUS_IND WHERE code = 'ACTIVE');
+-- stored status (expired trials are EXPIRED, not ACTIVE): index range scan on idx_member_status_trial
+WHERE m.status_id = (SELECT id FROM ACCOUNT_STATUS_IND WHERE code = 'ACTIVE')
+  AND u.status_id = (SELECT id FROM ACCOUNT_STATUS_IND WHERE code = 'ACTIVE');
 
 -- 8.2.3 access card management view
 -- view for access card management
@@ -222,8 +217,8 @@ SELECT
     COUNT(CASE WHEN msi.code = 'SUSPENDED' THEN m.id END) as suspended_members,
     COUNT(CASE WHEN msi.code = 'CANCELED' THEN m.id END) as canceled_members,
     -- trial specific statistics
-    COUNT(CASE WHEN mp.tier = 'trial' AND m.trial_expires_on < CURDATE() THEN m.id END) as expired_trials,
-    COUNT(CASE WHEN mp.tier = 'trial' AND m.trial_expires_on >= CURDATE() THEN m.id END) as active_trials,
+    COUNT(CASE WHEN msi.code = 'EXPIRED' THEN m.id END) as expired_trials,
+    COUNT(CASE WHEN mp.tier = 'trial' AND msi.code = 'ACTIVE' THEN m.id END) as active_trials,
     -- revenue estimation (for active plans)
     CASE 
         WHEN mp.billing_cycle = 'monthly' THEN mp.price * COUNT(CASE WHEN msi.code = 'ACTIVE' THEN m.id END)
@@ -263,4 +258,57 @@ LEFT JOIN MEMBER m ON mp.id = m.membership_plan_id
     AND ((mp.tier IN ('trial', 'basic') AND m.home_gym_id = g.id) OR mp.tier = 'plus')
     AND m.status_id = (SELECT id FROM ACCOUNT_STATUS_IND WHERE code = 'ACTIVE')
 WHERE gsi.code = 'ACTIVE' AND psi.code = 'ACTIVE'
-GROUP BY g.id, g.name, g.address, gsi.code, gsi.label, mp.tier, mp.name;
\ No newline at end of file
+GROUP BY g.id, g.name, g.address, gsi.code, gsi.label, mp.tier, mp.name;
+
+-- 8.2.8 cleaning due view
+-- equipment that needs cleaning now (range scan on idx_eitem_clean_due; kept current by
+-- sp_flush_equipment_usage for usage-based due and sp_refresh_equipment_due for day-based due)
+CREATE VIEW vw_cleaning_due AS
+SELECT 
+    ei.id as equipment_item_id,
+    ei.serial_no,
+    ek.name as equip_kind_name,
+    g.id as gym_id,
+    g.name as gym_name,
+    esi.code as equipment_status,
+    ei.uses_since_clean,
+    ei.cleaning_interval_uses,
+    ei.last_cleaned_at,
+    ei.cleaning_interval_days,
+    ei.next_clean_due_at,
+    ei.cleaning_required,
+    -- computed fields
+    CASE 
+        WHEN ei.uses_since_clean >= ei.cleaning_interval_uses THEN 'USES'
+        ELSE 'DAYS'
+    END as due_reason,
+    TIMESTAMPDIFF(HOUR, ei.next_clean_due_at, NOW()) as hours_overdue
+FROM EQUIPMENT_ITEM ei
+JOIN EQUIP_KIND ek ON ei.equip_kind_id = ek.id
+JOIN GYM g ON ei.gym_id = g.id
+JOIN EQUIPMENT_STATUS_IND esi ON ei.status_id = esi.id
+WHERE ei.next_clean_due_at <= NOW()
+  AND esi.code != 'RETIRED';
+
+-- 8.2.9 service due view
+-- equipment past its rated uses since the last repair/replace (ref lookup on idx_eitem_service_due)
+CREATE VIEW vw_service_due AS
+SELECT 
+    ei.id as equipment_item_id,
+    ei.serial_no,
+    ek.name as equip_kind_name,
+    g.id as gym_id,
+    g.name as gym_name,
+    esi.code as equipment_status,
+    ei.uses_count,
+    ei.uses_since_service,
+    ei.rated_uses,
+    ei.last_serviced_at,
+    -- computed fields
+    ei.uses_since_service - ei.rated_uses as uses_over_rated
+FROM EQUIPMENT_ITEM ei
+JOIN EQUIP_KIND ek ON ei.equip_kind_id = ek.id
+JOIN GYM g ON ei.gym_id = g.id
+JOIN EQUIPMENT_STATUS_IND esi ON ei.status_id = esi.id
+WHERE ei.service_required = TRUE
+  AND esi.code != 'RETIRED';
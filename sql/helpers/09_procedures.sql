@@ -145,9 +145,9 @@ BEGIN
     END IF;
     
     -- call the main account creation procedure
-    CALL CreateUserAccount(p_username, p_email, p_password_hash, p_password_algo, 
-                          p_membership_plan_id, p_home_gym_id, p_staff_user_id,
-                          p_user_id, p_member_id, p_access_card_id, p_result_message);
+    CALL sp_create_user_account(p_username, p_email, p_password_hash, p_password_algo, 
+                                p_membership_plan_id, p_home_gym_id, p_staff_user_id,
+                                p_user_id, p_member_id, p_access_card_id, p_result_message);
 END$$
 
 -- 9.3 get user account info procedure
@@ -189,4 +189,211 @@ BEGIN
     WHERE u.id = p_user_id;
 END$$
 
+-- 9.4 expire trials procedure
+-- moves ACTIVE trial members past trial_expires_on to EXPIRED in batches of p_batch_size
+-- (one short transaction per batch; trg_aud_member_update writes a MEMBER_AUD row per member)
+-- members whose user is LOCKED/INACTIVE are left alone (trg_member_status_user_consistency requires SUSPENDED)
+CREATE PROCEDURE sp_expire_trials(
+    IN p_batch_size INT,
+    OUT p_expired_count INT
+)
+BEGIN
+    DECLARE v_active_status_id BIGINT;
+    DECLARE v_expired_status_id BIGINT;
+    DECLARE v_batch_rows INT DEFAULT 0;
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        ROLLBACK;
+        RESIGNAL;
+    END;
+
+    IF p_batch_size IS NULL OR p_batch_size < 1 THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Batch size must be at least 1';
+    END IF;
+
+    SET p_expired_count = 0;
+
+    SELECT id INTO v_active_status_id FROM ACCOUNT_STATUS_IND WHERE code = 'ACTIVE';
+    SELECT id INTO v_expired_status_id FROM ACCOUNT_STATUS_IND WHERE code = 'EXPIRED';
+    IF v_expired_status_id IS NULL THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Expired status not found';
+    END IF;
+
+    REPEAT
+        START TRANSACTION;
+
+        -- range scan on idx_member_status_trial (status_id, trial_expires_on); expired rows leave the range
+        UPDATE MEMBER
+        SET status_id = v_expired_status_id
+        WHERE status_id = v_active_status_id
+          AND trial_expires_on < CURDATE()
+          AND membership_plan_id IN (SELECT id FROM MEMBERSHIP_PLAN WHERE tier = 'trial')
+          AND NOT EXISTS (
+              SELECT 1 FROM USER u
+              JOIN ACCOUNT_STATUS_IND asi ON u.status_id = asi.id
+              WHERE u.id = MEMBER.user_id AND asi.code IN ('LOCKED', 'INACTIVE')
+          )
+        ORDER BY trial_expires_on
+        LIMIT p_batch_size;
+
+        SET v_batch_rows = ROW_COUNT();
+        SET p_expired_count = p_expired_count + v_batch_rows;
+
+        COMMIT;
+    UNTIL v_batch_rows < p_batch_size END REPEAT;
+END$$
+
+-- 9.5 flush equipment usage procedure
+-- applies one coalesced usage batch from EQUIPMENT_USAGE_STAGE set-wise: counters, usage-based cleaning due,
+-- service flags and OK -> NEEDS_SERVICE are computed in one pass, then written with a single UPDATE
+-- (one row change, and one EQUIPMENT_ITEM_AUD row, per item per batch instead of per use)
+-- the new values are computed into a temporary table first because multi-table UPDATE assignments
+-- may see each other's results; items missing from EQUIPMENT_ITEM are dropped with the batch
+CREATE PROCEDURE sp_flush_equipment_usage(
+    IN p_batch_id BIGINT,
+    OUT p_items_updated INT
+)
+BEGIN
+    DECLARE v_ok_status_id BIGINT;
+    DECLARE v_needs_service_status_id BIGINT;
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        ROLLBACK;
+        RESIGNAL;
+    END;
+
+    SELECT id INTO v_ok_status_id FROM EQUIPMENT_STATUS_IND WHERE code = 'OK';
+    SELECT id INTO v_needs_service_status_id FROM EQUIPMENT_STATUS_IND WHERE code = 'NEEDS_SERVICE';
+
+    CREATE TEMPORARY TABLE IF NOT EXISTS tmp_equipment_usage_apply (
+        equipment_item_id BIGINT PRIMARY KEY,
+        uses_count INT NOT NULL,
+        uses_since_clean INT NOT NULL,
+        uses_since_service INT NOT NULL,
+        next_clean_due_at DATETIME(6) NULL,
+        cleaning_required BOOLEAN NOT NULL,
+        service_required BOOLEAN NOT NULL,
+        status_id BIGINT NOT NULL
+    ) ENGINE=InnoDB;
+    DELETE FROM tmp_equipment_usage_apply;
+
+    START TRANSACTION;
+
+    -- lock the batch's items in id order (concurrent flushers never deadlock on each other)
+    INSERT INTO tmp_equipment_usage_apply (equipment_item_id, uses_count, uses_since_clean, uses_since_service,
+                                           next_clean_due_at, cleaning_required, service_required, status_id)
+    SELECT
+        ei.id,
+        ei.uses_count + s.uses,
+        ei.uses_since_clean + s.uses,
+        ei.uses_since_service + s.uses,
+        -- reaching the use interval makes the item due now (keeps "due" a single range on next_clean_due_at)
+        CASE
+            WHEN ei.uses_since_clean + s.uses >= ei.cleaning_interval_uses
+            THEN LEAST(COALESCE(ei.next_clean_due_at, s.last_used_at), s.last_used_at)
+            ELSE ei.next_clean_due_at
+        END,
+        ei.cleaning_required OR ei.uses_since_clean + s.uses >= ei.cleaning_interval_uses,
+        ei.service_required OR ei.uses_since_service + s.uses >= ei.rated_uses,
+        CASE
+            WHEN ei.status_id = v_ok_status_id AND ei.uses_since_service + s.uses >= ei.rated_uses
+            THEN v_needs_service_status_id
+            ELSE ei.status_id
+        END
+    FROM EQUIPMENT_USAGE_STAGE s
+    JOIN EQUIPMENT_ITEM ei ON ei.id = s.equipment_item_id
+    WHERE s.batch_id = p_batch_id
+    ORDER BY ei.id
+    FOR UPDATE;
+
+    UPDATE EQUIPMENT_ITEM ei
+    JOIN tmp_equipment_usage_apply t ON t.equipment_item_id = ei.id
+    SET ei.uses_count = t.uses_count,
+        ei.uses_since_clean = t.uses_since_clean,
+        ei.uses_since_service = t.uses_since_service,
+        ei.next_clean_due_at = t.next_clean_due_at,
+        ei.cleaning_required = t.cleaning_required,
+        ei.service_required = t.service_required,
+        ei.status_id = t.status_id;
+
+    SET p_items_updated = ROW_COUNT();
+
+    DELETE FROM EQUIPMENT_USAGE_STAGE WHERE batch_id = p_batch_id;
+
+    COMMIT;
+
+    DELETE FROM tmp_equipment_usage_apply;
+END$$
+
+-- 9.6 refresh equipment due procedure
+-- flags items whose day-based cleaning date has passed (range scan on idx_eitem_clean_due)
+CREATE PROCEDURE sp_refresh_equipment_due(
+    OUT p_flagged_count INT
+)
+BEGIN
+    UPDATE EQUIPMENT_ITEM
+    SET cleaning_required = TRUE
+    WHERE next_clean_due_at <= NOW()
+      AND cleaning_required = FALSE;
+
+    SET p_flagged_count = ROW_COUNT();
+END$$
+
+-- 9.7 log equipment service procedure
+-- records a SERVICE_LOG entry and resets the matching counters:
+-- 'clean' resets cleaning (next due = now + cleaning_interval_days), 'repair'/'replace' reset service
+CREATE PROCEDURE sp_log_equipment_service(
+    IN p_equipment_item_id BIGINT,
+    IN p_action VARCHAR(16),
+    IN p_notes TEXT,
+    IN p_staff_id BIGINT,
+    OUT p_service_log_id BIGINT,
+    OUT p_result_message VARCHAR(255)
+)
+BEGIN
+    DECLARE v_ok_status_id BIGINT;
+    DECLARE v_needs_service_status_id BIGINT;
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        ROLLBACK;
+        GET DIAGNOSTICS CONDITION 1
+            p_result_message = MESSAGE_TEXT;
+        SET p_service_log_id = NULL;
+    END;
+
+    START TRANSACTION;
+
+    IF NOT EXISTS (SELECT 1 FROM EQUIPMENT_ITEM WHERE id = p_equipment_item_id) THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Equipment item not found';
+    END IF;
+
+    SELECT id INTO v_ok_status_id FROM EQUIPMENT_STATUS_IND WHERE code = 'OK';
+    SELECT id INTO v_needs_service_status_id FROM EQUIPMENT_STATUS_IND WHERE code = 'NEEDS_SERVICE';
+
+    INSERT INTO SERVICE_LOG (equipment_item_id, serviced_at, action, notes, staff_id)
+    VALUES (p_equipment_item_id, NOW(6), p_action, p_notes, p_staff_id);
+
+    SET p_service_log_id = LAST_INSERT_ID();
+
+    IF p_action = 'clean' THEN
+        UPDATE EQUIPMENT_ITEM
+        SET uses_since_clean = 0,
+            last_cleaned_at = NOW(6),
+            next_clean_due_at = NOW(6) + INTERVAL cleaning_interval_days DAY,
+            cleaning_required = FALSE
+        WHERE id = p_equipment_item_id;
+    ELSEIF p_action IN ('repair', 'replace') THEN
+        UPDATE EQUIPMENT_ITEM
+        SET uses_since_service = 0,
+            last_serviced_at = NOW(6),
+            service_required = FALSE,
+            status_id = CASE WHEN status_id = v_needs_service_status_id THEN v_ok_status_id ELSE status_id END
+        WHERE id = p_equipment_item_id;
+    END IF;
+
+    SET p_result_message = CONCAT('Service logged. Service Log ID: ', p_service_log_id);
+
+    COMMIT;
+END$$
+
 DELIMITER ;
\ No newline at end of file
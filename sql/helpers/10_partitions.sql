@@ -0,0 +1,159 @@
+-- 10) Partition Maintenance
+
+-- 10.1 check-in archive tables
+-- CHECK_IN_ARCHIVE mirrors CHECK_IN (columns, indexes and monthly partitions); old months are moved into
+-- it by exchanging partitions through the unpartitioned CHECK_IN_XCHG (each exchange swaps tablespaces,
+-- and WITHOUT VALIDATION skips the per-row bound scan, so the cost does not grow with the month's rows)
+-- created after 07_indexes.sql so the index sets match (EXCHANGE PARTITION requires identical structure)
+CREATE TABLE CHECK_IN_ARCHIVE LIKE CHECK_IN;
+
+CREATE TABLE CHECK_IN_XCHG LIKE CHECK_IN;
+ALTER TABLE CHECK_IN_XCHG REMOVE PARTITIONING;
+
+DELIMITER $$
+
+-- 10.2 add check-in partitions procedure
+-- splits monthly partitions (pYYYYMM, one per calendar month) off the p_future catch-all up to p_through;
+-- on an unsplit table the first partition is p_history (everything before p_from's month)
+-- REORGANIZE copies every row in p_future, so it is only cheap while p_future is empty: the procedure
+-- refuses when p_future has rows (maintenance fell more than months_ahead behind, or future-dated rows)
+-- and leaves that split to be done by hand in a maintenance window
+CREATE PROCEDURE sp_checkin_add_partitions(
+    IN p_table_name VARCHAR(64),
+    IN p_from DATE,
+    IN p_through DATE
+)
+BEGIN
+    DECLARE v_last_bound DATETIME;
+    DECLARE v_month_start DATE;
+    DECLARE v_next_month DATE;
+    DECLARE v_partitions TEXT DEFAULT '';
+    DECLARE v_message VARCHAR(128);
+
+    -- highest existing upper bound (NULL when only p_future exists)
+    SELECT MAX(CAST(TRIM(BOTH '''' FROM PARTITION_DESCRIPTION) AS DATETIME)) INTO v_last_bound
+    FROM INFORMATION_SCHEMA.PARTITIONS
+    WHERE TABLE_SCHEMA = DATABASE()
+      AND TABLE_NAME = p_table_name
+      AND PARTITION_DESCRIPTION != 'MAXVALUE';
+
+    IF v_last_bound IS NULL THEN
+        SET v_month_start = DATE_FORMAT(p_from, '%Y-%m-01');
+        SET v_partitions = CONCAT('PARTITION p_history VALUES LESS THAN (''', v_month_start, '''), ');
+    ELSE
+        SET v_month_start = DATE(v_last_bound);
+    END IF;
+
+    -- one partition per month until p_through's month is covered
+    WHILE v_month_start <= p_through DO
+        SET v_next_month = DATE_ADD(v_month_start, INTERVAL 1 MONTH);
+        SET v_partitions = CONCAT(v_partitions,
+            'PARTITION p', DATE_FORMAT(v_month_start, '%Y%m'), ' VALUES LESS THAN (''', v_next_month, '''), ');
+        SET v_month_start = v_next_month;
+    END WHILE;
+
+    IF v_partitions != '' THEN
+        SET @v_future_has_rows = 0;
+        SET @v_sql = CONCAT('SELECT EXISTS (SELECT 1 FROM ', p_table_name,
+            ' PARTITION (p_future)) INTO @v_future_has_rows');
+        PREPARE stmt FROM @v_sql;
+        EXECUTE stmt;
+        DEALLOCATE PREPARE stmt;
+
+        IF @v_future_has_rows THEN
+            SET v_message = CONCAT(p_table_name, '.p_future has rows; splitting it would copy them');
+            SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = v_message;
+        END IF;
+
+        -- p_future is empty, so the reorganize only rewrites metadata
+        SET @v_sql = CONCAT('ALTER TABLE ', p_table_name, ' REORGANIZE PARTITION p_future INTO (',
+            v_partitions, 'PARTITION p_future VALUES LESS THAN (MAXVALUE))');
+        PREPARE stmt FROM @v_sql;
+        EXECUTE stmt;
+        DEALLOCATE PREPARE stmt;
+    END IF;
+END$$
+
+-- 10.3 archive check-in partitions procedure
+-- moves every CHECK_IN partition whose months end on or before p_before into CHECK_IN_ARCHIVE, then drops it
+-- live pX -> CHECK_IN_XCHG -> archive pX: the exchanges swap tablespaces rather than copying rows, and the
+-- drop removes an already-empty partition
+CREATE PROCEDURE sp_checkin_archive_partitions(
+    IN p_before DATE
+)
+BEGIN
+    DECLARE v_partition_name VARCHAR(64);
+    DECLARE v_done BOOLEAN DEFAULT FALSE;
+
+    WHILE NOT v_done DO
+        SET v_partition_name = NULL;
+
+        -- oldest live partition that lies entirely before the cutoff
+        SELECT PARTITION_NAME INTO v_partition_name
+        FROM INFORMATION_SCHEMA.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE()
+          AND TABLE_NAME = 'CHECK_IN'
+          AND PARTITION_DESCRIPTION != 'MAXVALUE'
+          AND CAST(TRIM(BOTH '''' FROM PARTITION_DESCRIPTION) AS DATETIME) <= p_before
+        ORDER BY PARTITION_ORDINAL_POSITION
+        LIMIT 1;
+
+        IF v_partition_name IS NULL THEN
+            SET v_done = TRUE;
+        ELSE
+            -- the archive must have a partition with the same name and bounds
+            IF NOT EXISTS (
+                SELECT 1 FROM INFORMATION_SCHEMA.PARTITIONS
+                WHERE TABLE_SCHEMA = DATABASE()
+                  AND TABLE_NAME = 'CHECK_IN_ARCHIVE'
+                  AND PARTITION_NAME = v_partition_name
+            ) THEN
+                SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'CHECK_IN_ARCHIVE is missing a partition matching CHECK_IN';
+            END IF;
+
+            SET @v_sql = CONCAT('ALTER TABLE CHECK_IN EXCHANGE PARTITION ', v_partition_name,
+                ' WITH TABLE CHECK_IN_XCHG WITHOUT VALIDATION');
+            PREPARE stmt FROM @v_sql;
+            EXECUTE stmt;
+            DEALLOCATE PREPARE stmt;
+
+            SET @v_sql = CONCAT('ALTER TABLE CHECK_IN_ARCHIVE EXCHANGE PARTITION ', v_partition_name,
+                ' WITH TABLE CHECK_IN_XCHG WITHOUT VALIDATION');
+            PREPARE stmt FROM @v_sql;
+            EXECUTE stmt;
+            DEALLOCATE PREPARE stmt;
+
+            SET @v_sql = CONCAT('ALTER TABLE CHECK_IN DROP PARTITION ', v_partition_name);
+            PREPARE stmt FROM @v_sql;
+            EXECUTE stmt;
+            DEALLOCATE PREPARE stmt;
+        END IF;
+    END WHILE;
+END$$
+
+-- 10.4 check-in partition maintenance procedure
+-- keeps p_months_ahead months of empty partitions ready and archives months older than p_retain_months
+-- (run daily, so new months are split off p_future months before any row can land in it)
+CREATE PROCEDURE sp_checkin_partition_maintenance(
+    IN p_months_ahead INT,
+    IN p_retain_months INT
+)
+BEGIN
+    DECLARE v_through DATE;
+    DECLARE v_archive_before DATE;
+
+    SET v_through = DATE_ADD(CURDATE(), INTERVAL p_months_ahead MONTH);
+    SET v_archive_before = DATE_SUB(DATE_FORMAT(CURDATE(), '%Y-%m-01'), INTERVAL p_retain_months MONTH);
+
+    -- archive gets the same months so exchanged partitions always have a matching target;
+    -- archiving runs before the CHECK_IN split so a refused split does not hold up retention
+    CALL sp_checkin_add_partitions('CHECK_IN_ARCHIVE', v_archive_before, v_through);
+    CALL sp_checkin_archive_partitions(v_archive_before);
+    CALL sp_checkin_add_partitions('CHECK_IN', v_archive_before, v_through);
+END$$
+
+DELIMITER ;
+
+-- 10.5 initial partitions
+-- 24 months of history (matches the seed generator's date range) and 3 months ahead
+CALL sp_checkin_partition_maintenance(3, 24);
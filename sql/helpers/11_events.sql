@@ -0,0 +1,25 @@
+-- 11) Scheduled Events
+-- require event_scheduler=ON (the MySQL 8 default)
+
+-- 11.1 check-in partition maintenance event
+-- keeps 3 months of CHECK_IN partitions ready and archives months older than 24 (see 10_partitions.sql)
+CREATE EVENT ev_checkin_partition_maintenance
+ON SCHEDULE EVERY 1 DAY
+STARTS (CURDATE() + INTERVAL 1 DAY + INTERVAL 2 HOUR)
+COMMENT 'Create upcoming CHECK_IN partitions and archive months past retention'
+DO CALL sp_checkin_partition_maintenance(3, 24);
+
+-- 11.2 trial expiry event
+-- moves ACTIVE trials past trial_expires_on to EXPIRED just after midnight, 1000 members per transaction
+CREATE EVENT ev_expire_trials
+ON SCHEDULE EVERY 1 DAY
+STARTS (CURDATE() + INTERVAL 1 DAY + INTERVAL 5 MINUTE)
+COMMENT 'Materialize expired trial memberships (sp_expire_trials)'
+DO CALL sp_expire_trials(1000, @expired_trials);
+
+-- 11.3 equipment due refresh event
+-- flags equipment whose day-based cleaning date passed (usage-based due is set at flush time)
+CREATE EVENT ev_refresh_equipment_due
+ON SCHEDULE EVERY 15 MINUTE
+COMMENT 'Flag equipment past next_clean_due_at (sp_refresh_equipment_due)'
+DO CALL sp_refresh_equipment_due(@flagged_equipment);
@@ -0,0 +1,34 @@
+-- CHECK_IN Partition Checks for FitDB
+-- Shows the current monthly layout and EXPLAINs the common check-in reads.
+-- The `partitions` column of each EXPLAIN must list only the months in the query's date range;
+-- a query that lists every partition is not pruning (e.g. it wraps checked_in_at in a function).
+
+-- 1. current layout (TABLE_ROWS is an estimate)
+SELECT TABLE_NAME, PARTITION_NAME, PARTITION_DESCRIPTION AS less_than, TABLE_ROWS
+FROM INFORMATION_SCHEMA.PARTITIONS
+WHERE TABLE_SCHEMA = DATABASE()
+  AND TABLE_NAME IN ('CHECK_IN', 'CHECK_IN_ARCHIVE')
+ORDER BY TABLE_NAME, PARTITION_ORDINAL_POSITION;
+
+-- 2. member's recent history through the view (expect: current month, maybe the previous one)
+EXPLAIN
+SELECT checkin_id, checked_in_at, gym_name
+FROM vw_member_checkin_history
+WHERE member_id = 1
+  AND checked_in_at >= NOW() - INTERVAL 30 DAY
+ORDER BY checked_in_at DESC;
+
+-- 3. daily occupancy per gym (expect: current month only)
+EXPLAIN
+SELECT gym_id, COUNT(*) AS check_ins
+FROM CHECK_IN
+WHERE checked_in_at >= CURDATE()
+  AND checked_in_at < CURDATE() + INTERVAL 1 DAY
+GROUP BY gym_id;
+
+-- 4. anti-pattern for comparison (expect: every partition; rewrite as a range like query 3)
+EXPLAIN
+SELECT gym_id, COUNT(*) AS check_ins
+FROM CHECK_IN
+WHERE DATE(checked_in_at) = CURDATE()
+GROUP BY gym_id;
@@ -0,0 +1,33 @@
+-- Performance Workload for FitDB
+-- Representative write/read mix used by scripts/perf_schema_collector.py
+-- Each pass creates one account (USER + MEMBER + auto ACCESS_CARD), checks the member in,
+-- updates the user and card, and reads through the MVP views.
+-- No DELIMITER blocks: the collector runs this file statement by statement.
+
+-- 1. account creation (sp_create_user_account -> USER/MEMBER/ACCESS_CARD triggers + audit triggers)
+SET @perf_tag = CONCAT('perf_', UUID_SHORT());
+CALL sp_create_user_account(
+    @perf_tag, CONCAT(@perf_tag, '@example.com'), SHA2(@perf_tag, 256), 'argon2id',
+    (SELECT id FROM MEMBERSHIP_PLAN WHERE tier = 'basic' ORDER BY id LIMIT 1),
+    (SELECT id FROM GYM ORDER BY id LIMIT 1),
+    NULL, @perf_user_id, @perf_member_id, @perf_card_id, @perf_msg);
+
+-- 2. card-scan check-in (trg_checkin_validation + audit trigger)
+INSERT INTO CHECK_IN (member_id, gym_id, access_card_id, method)
+SELECT m.id, m.home_gym_id, @perf_card_id, 'scan'
+FROM MEMBER m WHERE m.id = @perf_member_id;
+
+-- 3. user updates (trg_user_password_updated, trg_user_login_update + audit trigger)
+UPDATE USER SET last_login_at = NOW(6) WHERE id = @perf_user_id;
+UPDATE USER SET password_hash = SHA2(CONCAT(@perf_tag, 'rotated'), 256) WHERE id = @perf_user_id;
+
+-- 4. account lookup
+CALL sp_get_user_account_info(@perf_user_id);
+
+-- 5. view reads
+SELECT * FROM vw_user_account_info WHERE user_id = @perf_user_id;
+SELECT COUNT(*) FROM vw_active_members;
+SELECT * FROM vw_access_card_management WHERE member_id = @perf_member_id;
+SELECT * FROM vw_member_checkin_history WHERE member_id = @perf_member_id;
+SELECT * FROM vw_membership_plan_details;
+SELECT * FROM vw_gym_access_permissions;
@@ -0,0 +1,104 @@
+"""Tests for scripts/assign_trainers.py (run with: make test)."""
+
+import random
+import sys
+import unittest
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from assign_trainers import (  # noqa: E402
+    AssignmentSolver, Session, snapshot_commitments, synthetic_schedule, verify,
+)
+
+DAY = date(2025, 11, 3)
+NINE = datetime(2025, 11, 3, 9, 0)
+
+
+def session(session_id, starts_at, minutes, max_trainers, gym_id=1, needs_lead=True):
+    return Session(session_id, gym_id, starts_at, starts_at + timedelta(minutes=minutes), max_trainers, needs_lead)
+
+
+def solver_with(trainers, gym_id=1):
+    solver = AssignmentSolver()
+    for trainer_id in trainers:
+        solver.add_availability(trainer_id, gym_id, DAY, 'AM')
+    return solver
+
+
+class DoubleBookingTest(unittest.TestCase):
+    """Existing commitments that already overlap each other (e.g. rows entered by hand)."""
+
+    def setUp(self):
+        self.solver = solver_with([1])
+        self.solver.add_commitment(1, NINE, NINE + timedelta(hours=3))
+        self.solver.add_commitment(1, NINE + timedelta(hours=1), NINE + timedelta(hours=2))
+
+    def test_overlap_is_reported(self):
+        self.assertEqual(self.solver.overlapping_commitments(),
+                         [(1, NINE + timedelta(hours=1), NINE + timedelta(hours=2))])
+
+    def test_busy_until_the_latest_end(self):
+        # 11:00-11:30 starts after the inner commitment ends but inside the outer one
+        self.assertFalse(self.solver.is_free(1, NINE + timedelta(hours=2), NINE + timedelta(hours=2, minutes=30)))
+        self.assertTrue(self.solver.is_free(1, NINE + timedelta(hours=3), NINE + timedelta(hours=4)))
+
+    def test_solver_never_books_into_the_overlap(self):
+        existing = snapshot_commitments(self.solver)
+        sessions = [session(1, NINE + timedelta(hours=2), 30, 1)]
+        self.assertEqual(self.solver.solve(sessions), [])
+        self.assertEqual(verify(sessions, [], self.solver, existing), [])
+
+    def test_verify_checks_new_assignments_against_existing(self):
+        existing = snapshot_commitments(self.solver)
+        sessions = [session(5, NINE + timedelta(hours=2), 30, 1)]
+        problems = verify(sessions, [(5, 1, 'lead')], self.solver, existing)
+        self.assertIn("trainer 1 double-booked: sessions existing and 5", problems)
+
+
+class LeadSeatTest(unittest.TestCase):
+
+    def test_assistants_only_with_a_lead(self):
+        # two sessions at 09:00, one trainer: only one session can be staffed
+        solver = solver_with([1])
+        sessions = [session(1, NINE, 60, 3), session(2, NINE, 60, 3)]
+        assignments = solver.solve(sessions)
+        self.assertEqual(assignments, [(1, 1, 'lead')])
+
+    def test_session_missing_its_lead_gets_no_assistants(self):
+        # loaded from the database with an assistant already assigned and no lead; every
+        # available trainer is busy, so the lead seat stays open and no assistant is added
+        solver = solver_with([1, 2])
+        for trainer_id in (1, 2):
+            solver.add_commitment(trainer_id, NINE, NINE + timedelta(hours=1))
+        sessions = [session(1, NINE, 60, 1)]
+        self.assertEqual(solver.solve(sessions), [])
+
+    def test_every_session_with_assistants_has_a_lead(self):
+        sessions, solver = synthetic_schedule(3, 8, 40, 5, random.Random(7), DAY)
+        existing = snapshot_commitments(solver)
+        assignments = solver.solve(sessions)
+        roles = {}
+        for session_id, _, role in assignments:
+            roles.setdefault(session_id, []).append(role)
+        for session_roles in roles.values():
+            self.assertEqual(session_roles.count('lead'), 1)
+        self.assertEqual(verify(sessions, assignments, solver, existing), [])
+
+    def test_verify_flags_assistants_without_a_lead(self):
+        solver = solver_with([1])
+        sessions = [session(1, NINE, 60, 2)]
+        problems = verify(sessions, [(1, 1, 'assistant')], solver, {})
+        self.assertIn("session 1 has assistants but no lead", problems)
+
+
+class BenchmarkScheduleTest(unittest.TestCase):
+
+    def test_synthetic_schedule_has_no_existing_conflicts(self):
+        _, solver = synthetic_schedule(5, 10, 40, 3, random.Random(1), DAY)
+        self.assertEqual(solver.overlapping_commitments(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+"""Tests for scripts/equipment_usage.py (run with: make test)."""
+
+import sys
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from equipment_usage import ingest, with_idle_ticks  # noqa: E402
+
+
+class RecordingWriter:
+    """Stands in for UsageWriter; remembers when each batch was flushed."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.flushes = []
+
+    def flush(self, rows):
+        if rows:
+            self.flushes.append((time.perf_counter() - self.started, sorted(item for item, _, _ in rows)))
+
+
+class IngestTest(unittest.TestCase):
+
+    def test_stalled_input_still_flushes_on_the_interval(self):
+        def stalling_events():
+            yield 1, datetime.now()
+            yield 2, datetime.now()
+            time.sleep(0.6)
+            yield 3, datetime.now()
+
+        writer = RecordingWriter()
+        total, _ = ingest(with_idle_ticks(stalling_events(), 0.02), writer, 'batched', 1000, 0.1)
+        self.assertEqual(total, 3)
+        (first_at, first_items), (_, last_items) = writer.flushes
+        self.assertEqual(first_items, [1, 2])
+        self.assertLess(first_at, 0.5)
+        self.assertEqual(last_items, [3])
+
+    def test_reader_errors_reach_the_caller(self):
+        def failing_events():
+            yield 1, datetime.now()
+            raise OSError('input closed')
+
+        with self.assertRaises(OSError):
+            ingest(with_idle_ticks(failing_events(), 0.02), RecordingWriter(), 'batched', 1000, 0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Tests for data/validate_seed.py (run with: make test)."""
+
+import csv
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'data'))
+
+from seed_schema import TABLE_FIELDS  # noqa: E402
+from validate_seed import SeedValidator  # noqa: E402
+
+
+def write_csvs(csv_dir, tables):
+    """Write one headerless CSV per table; tables not given are written empty."""
+    for table_name, fields in TABLE_FIELDS.items():
+        rows = tables.get(table_name, [])
+        with open(csv_dir / f"{table_name}.csv", 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+            writer.writerows(rows)
+
+
+def gym(gym_id):
+    return {'id': gym_id, 'name': f"Gym {gym_id}", 'address': '1 Main St', 'status_id': 1,
+            'created_at': '2025-01-01 00:00:00.000000', 'updated_at': '2025-01-01 00:00:00.000000'}
+
+
+def user(user_id, username, email):
+    return {'id': user_id, 'username': username, 'email': email, 'password_hash': 'x',
+            'password_algo': 'bcrypt', 'password_updated_at': '2025-01-01 00:00:00.000000', 'status_id': 1,
+            'created_at': '2025-01-01 00:00:00.000000', 'updated_at': '2025-01-01 00:00:00.000000'}
+
+
+class ValidateSeedTest(unittest.TestCase):
+
+    def validate(self, tables):
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_dir = Path(tmp)
+            write_csvs(csv_dir, tables)
+            validator = SeedValidator(csv_dir, max_examples=10)
+            validator.validate_all()
+            return validator.errors
+
+    def test_negative_and_non_numeric_ids_are_bad_ids(self):
+        errors = self.validate({'gym': [gym(-1), gym('abc'), gym('+3'), gym(1), gym(2)]})
+        self.assertEqual(errors['bad id']['count'], 3)
+        self.assertNotIn('duplicate key', errors)
+
+    def test_negative_id_does_not_alias_another_id(self):
+        rows = [gym(gym_id) for gym_id in range(1, 17)] + [gym(-1)]
+        errors = self.validate({'gym': rows})
+        self.assertEqual(errors['bad id']['count'], 1)
+        self.assertNotIn('duplicate key', errors)
+
+    def test_negative_card_id_is_rejected(self):
+        card = {'id': -1, 'member_id': 1, 'gym_id': 1, 'card_uid': 'C1', 'status_id': 1,
+                'issued_at': '2025-01-01 00:00:00.000000', 'revoked_at': '',
+                'created_at': '2025-01-01 00:00:00.000000', 'updated_at': '2025-01-01 00:00:00.000000'}
+        errors = self.validate({'gym': [gym(1)], 'access_card': [card]})
+        self.assertEqual(errors['bad id']['examples'], ["access_card.csv:1: id='-1'"])
+
+    def test_keys_collide_by_case_and_accent(self):
+        errors = self.validate({'user': [
+            user(1, 'ann', 'ann@example.com'),
+            user(2, 'ANN', 'ann2@example.com'),
+            user(3, 'jose', 'jose@example.com'),
+            user(4, 'José', 'JOSE@example.com'),
+        ]})
+        self.assertEqual(errors['duplicate key']['count'], 3)
+        self.assertEqual(errors['duplicate key']['examples'], [
+            "user.csv:2: username='ANN'",
+            "user.csv:4: username='José'",
+            "user.csv:4: email='JOSE@example.com'",
+        ])
+
+    def test_null_serial_numbers_do_not_collide(self):
+        def item(item_id, serial_no):
+            return {'id': item_id, 'gym_id': 1, 'equip_kind_id': 1, 'status_id': 1, 'serial_no': serial_no,
+                    'uses_count': 0, 'uses_since_clean': 0, 'uses_since_service': 0, 'rated_uses': 1,
+                    'cleaning_interval_uses': 1, 'cleaning_interval_days': 1,
+                    'service_required': 0, 'cleaning_required': 0,
+                    'created_at': '2025-01-01 00:00:00.000000', 'updated_at': '2025-01-01 00:00:00.000000'}
+        errors = self.validate({'gym': [gym(1)],
+                                'equipment_item': [item(1, ''), item(2, ''), item(3, 'T-1'), item(4, 't-1')]})
+        self.assertEqual(errors['duplicate key']['examples'], ["equipment_item.csv:4: gym_id='1', serial_no='t-1'"])
+
+
+if __name__ == '__main__':
+    unittest.main()